@@ -20,12 +20,15 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Add IAP fields to users table
-    op.add_column('users', sa.Column('iap_product_id', sa.String(100), nullable=True))
-    op.add_column('users', sa.Column('iap_purchase_token', sa.Text(), nullable=True))
-    op.add_column('users', sa.Column('iap_order_id', sa.String(255), nullable=True))
-    op.add_column('users', sa.Column('iap_platform', sa.String(20), nullable=True))
-    op.add_column('users', sa.Column('iap_purchased_at', sa.DateTime(), nullable=True))
+    # Add IAP fields to users table (single ALTER: one lock, one round-trip)
+    op.execute(
+        "ALTER TABLE users "
+        "ADD COLUMN iap_product_id VARCHAR(100), "
+        "ADD COLUMN iap_purchase_token TEXT, "
+        "ADD COLUMN iap_order_id VARCHAR(255), "
+        "ADD COLUMN iap_platform VARCHAR(20), "
+        "ADD COLUMN iap_purchased_at TIMESTAMP WITHOUT TIME ZONE"
+    )
 
     # Create categories table
     op.create_table(
@@ -0,0 +1,36 @@
+"""Add composite lookup index for associated title suggestions
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Covers the /suggest lookup: one user's exact and contains rules,
+    # with category_id included so the probe is an index-only scan
+    op.create_index(
+        'ix_assoc_titles_user_exact_title',
+        'associated_titles',
+        ['user_id', 'is_exact_match', 'title'],
+        postgresql_include=['category_id']
+    )
+
+    # Title is never queried without user_id, so the standalone index is redundant
+    op.drop_index('ix_associated_titles_title', table_name='associated_titles')
+
+
+def downgrade() -> None:
+    op.create_index('ix_associated_titles_title', 'associated_titles', ['title'])
+    op.drop_index('ix_assoc_titles_user_exact_title', table_name='associated_titles')
@@ -0,0 +1,30 @@
+"""Add keyset pagination index for associated titles
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Matches the (title, id) cursor ordering used by GET /associated-titles
+    op.create_index(
+        'ix_assoc_titles_user_title_id',
+        'associated_titles',
+        ['user_id', 'title', 'id']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_assoc_titles_user_title_id', table_name='associated_titles')
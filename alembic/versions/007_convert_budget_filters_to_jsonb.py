@@ -0,0 +1,64 @@
+"""Convert budget wallet/category filters to JSONB
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # JSONB is stored pre-parsed and supports GIN-indexed containment (@>)
+    op.alter_column(
+        'budgets', 'wallet_ids',
+        type_=postgresql.JSONB(),
+        postgresql_using='wallet_ids::jsonb'
+    )
+    op.alter_column(
+        'budgets', 'category_ids',
+        type_=postgresql.JSONB(),
+        postgresql_using='category_ids::jsonb'
+    )
+
+    # jsonb_path_ops: smaller than the default opclass, and @> is the only operator we need
+    op.create_index(
+        'ix_budgets_wallet_ids_gin',
+        'budgets',
+        ['wallet_ids'],
+        postgresql_using='gin',
+        postgresql_ops={'wallet_ids': 'jsonb_path_ops'}
+    )
+    op.create_index(
+        'ix_budgets_category_ids_gin',
+        'budgets',
+        ['category_ids'],
+        postgresql_using='gin',
+        postgresql_ops={'category_ids': 'jsonb_path_ops'}
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_budgets_category_ids_gin', table_name='budgets')
+    op.drop_index('ix_budgets_wallet_ids_gin', table_name='budgets')
+
+    op.alter_column(
+        'budgets', 'category_ids',
+        type_=postgresql.JSON(),
+        postgresql_using='category_ids::json'
+    )
+    op.alter_column(
+        'budgets', 'wallet_ids',
+        type_=postgresql.JSON(),
+        postgresql_using='wallet_ids::json'
+    )
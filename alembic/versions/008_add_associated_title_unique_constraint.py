@@ -0,0 +1,39 @@
+"""Add unique (user_id, title) constraint to associated titles
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep only the most recently updated row for each duplicated title
+    op.execute(
+        "DELETE FROM associated_titles a "
+        "USING associated_titles b "
+        "WHERE a.user_id = b.user_id "
+        "AND a.title = b.title "
+        "AND (a.updated_at, a.id) < (b.updated_at, b.id)"
+    )
+
+    # Conflict target for the create-or-update upsert
+    op.create_unique_constraint(
+        'uq_associated_titles_user_title',
+        'associated_titles',
+        ['user_id', 'title']
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_associated_titles_user_title', 'associated_titles', type_='unique')
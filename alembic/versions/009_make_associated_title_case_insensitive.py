@@ -0,0 +1,55 @@
+"""Make associated titles case-insensitive (citext)
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '009'
+down_revision: Union[str, None] = '008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS citext")
+
+    # Titles synced from clients may differ only by case; keep the latest one
+    op.execute(
+        "DELETE FROM associated_titles a "
+        "USING associated_titles b "
+        "WHERE a.user_id = b.user_id "
+        "AND lower(a.title) = lower(b.title) "
+        "AND (a.updated_at, a.id) < (b.updated_at, b.id)"
+    )
+
+    # Existing indexes and uq_associated_titles_user_title are rebuilt as case-insensitive
+    op.alter_column(
+        'associated_titles', 'title',
+        type_=postgresql.CITEXT(),
+        existing_nullable=False
+    )
+
+    # citext has no length modifier; keep the previous VARCHAR(200) limit
+    op.create_check_constraint(
+        'ck_associated_titles_title_length',
+        'associated_titles',
+        'char_length(title) <= 200'
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('ck_associated_titles_title_length', 'associated_titles', type_='check')
+    op.alter_column(
+        'associated_titles', 'title',
+        type_=sa.String(200),
+        existing_nullable=False
+    )
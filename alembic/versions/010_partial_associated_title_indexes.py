@@ -0,0 +1,51 @@
+"""Split associated title suggestion index into partial indexes
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '010'
+down_revision: Union[str, None] = '009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Exact rules are probed by (user_id, title); only exact rows are indexed
+    op.create_index(
+        'ix_assoc_titles_exact',
+        'associated_titles',
+        ['user_id', 'title'],
+        postgresql_include=['category_id'],
+        postgresql_where=sa.text('is_exact_match = true')
+    )
+
+    # Contains rules are scanned per user; title/category_id included for index-only scans
+    op.create_index(
+        'ix_assoc_titles_contains',
+        'associated_titles',
+        ['user_id'],
+        postgresql_include=['title', 'category_id'],
+        postgresql_where=sa.text('is_exact_match = false')
+    )
+
+    op.drop_index('ix_assoc_titles_user_exact_title', table_name='associated_titles')
+
+
+def downgrade() -> None:
+    op.create_index(
+        'ix_assoc_titles_user_exact_title',
+        'associated_titles',
+        ['user_id', 'is_exact_match', 'title'],
+        postgresql_include=['category_id']
+    )
+    op.drop_index('ix_assoc_titles_contains', table_name='associated_titles')
+    op.drop_index('ix_assoc_titles_exact', table_name='associated_titles')
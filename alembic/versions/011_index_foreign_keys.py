@@ -0,0 +1,38 @@
+"""Index foreign key columns left unindexed in 002
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '011'
+down_revision: Union[str, None] = '010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Postgres does not index FK columns; without these, deleting a parent row
+# (SET NULL / CASCADE) scans the whole child table
+FK_INDEXES = [
+    ('ix_transactions_payment_method_id', 'transactions', 'payment_method_id'),
+    ('ix_transactions_paired_transaction_id', 'transactions', 'paired_transaction_id'),
+    ('ix_transactions_recurring_config_id', 'transactions', 'recurring_config_id'),
+    ('ix_objectives_wallet_id', 'objectives', 'wallet_id'),
+    ('ix_recurring_configs_base_transaction_id', 'recurring_configs', 'base_transaction_id'),
+]
+
+
+def upgrade() -> None:
+    for name, table, column in FK_INDEXES:
+        op.create_index(name, table, [column])
+
+
+def downgrade() -> None:
+    for name, table, _ in FK_INDEXES:
+        op.drop_index(name, table_name=table)
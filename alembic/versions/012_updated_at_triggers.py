@@ -0,0 +1,47 @@
+"""Maintain updated_at with a BEFORE UPDATE trigger
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.database import UPDATED_AT_TRIGGER_TABLES
+
+
+# revision identifiers, used by Alembic.
+revision: str = '012'
+down_revision: Union[str, None] = '011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = UPDATED_AT_TRIGGER_TABLES
+
+
+def upgrade() -> None:
+    # Columns are TIMESTAMP WITHOUT TIME ZONE holding UTC, like utc_now()
+    op.execute("""
+        CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at = now() AT TIME ZONE 'utc';
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+
+    for table in TABLES:
+        op.execute(
+            f"CREATE TRIGGER trg_{table}_updated_at BEFORE UPDATE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_updated_at ON {table}")
+
+    op.execute("DROP FUNCTION IF EXISTS set_updated_at()")
@@ -0,0 +1,38 @@
+"""Replace transactions user_id/date indexes with a composite (user_id, date DESC)
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '013'
+down_revision: Union[str, None] = '012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Matches the list ordering (date DESC, created_at DESC), so a page is
+    # read straight off the index; date filters are always per user
+    op.create_index(
+        'ix_transactions_user_date',
+        'transactions',
+        ['user_id', sa.text('date DESC'), sa.text('created_at DESC')]
+    )
+
+    # Both are prefixes/subsets of the composite index
+    op.drop_index('ix_transactions_user_id', table_name='transactions')
+    op.drop_index('ix_transactions_date', table_name='transactions')
+
+
+def downgrade() -> None:
+    op.create_index('ix_transactions_date', 'transactions', ['date'])
+    op.create_index('ix_transactions_user_id', 'transactions', ['user_id'])
+    op.drop_index('ix_transactions_user_date', table_name='transactions')
@@ -0,0 +1,32 @@
+"""Add keyset pagination index for categories
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '014'
+down_revision: Union[str, None] = '013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Matches the (order_index, name, id) cursor ordering used by GET /categories
+    op.create_index(
+        'ix_categories_user_keyset',
+        'categories',
+        ['user_id', 'order_index', 'name', 'id'],
+        postgresql_where=sa.text('deleted_at IS NULL')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_categories_user_keyset', table_name='categories')
@@ -0,0 +1,48 @@
+"""Add partial list indexes for objectives, payment methods and recurring configs
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '015'
+down_revision: Union[str, None] = '014'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Live rows only, in the order the list endpoints return them
+    op.create_index(
+        'ix_objectives_user_list',
+        'objectives',
+        ['user_id', sa.text('is_pinned DESC'), 'name'],
+        postgresql_where=sa.text('deleted_at IS NULL')
+    )
+    op.create_index(
+        'ix_payment_methods_user_name',
+        'payment_methods',
+        ['user_id', 'name'],
+        postgresql_where=sa.text('deleted_at IS NULL')
+    )
+
+    # Turns the trigger's next_occurrence <= today into a range scan over active configs
+    op.create_index(
+        'ix_recurring_configs_user_due',
+        'recurring_configs',
+        ['user_id', 'next_occurrence'],
+        postgresql_where=sa.text('is_active')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_recurring_configs_user_due', table_name='recurring_configs')
+    op.drop_index('ix_payment_methods_user_name', table_name='payment_methods')
+    op.drop_index('ix_objectives_user_list', table_name='objectives')
@@ -0,0 +1,43 @@
+"""Add unique (objective_id, transaction_id) constraint to objective links
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '016'
+down_revision: Union[str, None] = '015'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep only the oldest row for each duplicated link
+    op.execute(
+        "DELETE FROM objective_transactions a "
+        "USING objective_transactions b "
+        "WHERE a.objective_id = b.objective_id "
+        "AND a.transaction_id = b.transaction_id "
+        "AND (a.created_at, a.id) > (b.created_at, b.id)"
+    )
+
+    # Conflict target for linking a transaction to an objective
+    op.create_unique_constraint(
+        'uq_objective_transactions_objective_transaction',
+        'objective_transactions',
+        ['objective_id', 'transaction_id']
+    )
+
+    # objective_id is the leading column of the unique constraint
+    op.drop_index('ix_objective_transactions_objective_id', table_name='objective_transactions')
+
+
+def downgrade() -> None:
+    op.create_index('ix_objective_transactions_objective_id', 'objective_transactions', ['objective_id'])
+    op.drop_constraint('uq_objective_transactions_objective_transaction', 'objective_transactions', type_='unique')
@@ -0,0 +1,134 @@
+"""Add row_version to synced tables for incremental pull
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '017'
+down_revision: Union[str, None] = '016'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = [
+    'categories',
+    'wallets',
+    'payment_methods',
+    'exchange_rates',
+    'transactions',
+    'recurring_configs',
+    'budgets',
+    'objectives',
+    'associated_titles',
+]
+
+BACKFILL_BATCH_SIZE = 5000
+
+
+def upgrade() -> None:
+    # A row's version is the ID of the transaction that last wrote it, so
+    # every version below the oldest running transaction (the snapshot xmin)
+    # is final; pulls never move past that horizon. The offset keeps versions
+    # above every per-table sync_logs version clients may still send as
+    # since_version, so their first incremental pull returns everything
+    op.execute("""
+        DO $$
+        DECLARE
+            version_offset bigint := (SELECT COALESCE(max(last_server_version), 0) FROM sync_logs);
+        BEGIN
+            EXECUTE format(
+                'CREATE OR REPLACE FUNCTION sync_row_version() RETURNS bigint AS %L LANGUAGE sql VOLATILE',
+                format('SELECT pg_current_xact_id()::text::bigint + %s', version_offset)
+            );
+            EXECUTE format(
+                'CREATE OR REPLACE FUNCTION sync_row_version_horizon() RETURNS bigint AS %L LANGUAGE sql STABLE',
+                format('SELECT pg_snapshot_xmin(pg_current_snapshot())::text::bigint + %s', version_offset)
+            );
+        END
+        $$
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION set_row_version() RETURNS trigger AS $$
+        BEGIN
+            NEW.row_version = sync_row_version();
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+
+    for table in TABLES:
+        # Nullable without a default: no table rewrite. New writes are
+        # stamped by the trigger from here on
+        op.add_column(table, sa.Column('row_version', sa.BigInteger(), nullable=True))
+        op.execute(
+            f"CREATE TRIGGER trg_{table}_row_version BEFORE INSERT OR UPDATE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION set_row_version()"
+        )
+
+    # Backfill and constraints outside the migration transaction, so locks
+    # are held per batch or per statement only
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            # Walk the primary key in batches, one transaction each. The
+            # updated_at trigger is off inside a batch so existing rows keep
+            # their timestamps
+            op.execute(f"""
+                DO $$
+                DECLARE
+                    batch_ids uuid[];
+                    last_id uuid;
+                BEGIN
+                    LOOP
+                        SELECT array_agg(id ORDER BY id) INTO batch_ids FROM (
+                            SELECT id FROM {table}
+                            WHERE last_id IS NULL OR id > last_id
+                            ORDER BY id
+                            LIMIT {BACKFILL_BATCH_SIZE}
+                        ) batch;
+                        EXIT WHEN batch_ids IS NULL;
+                        last_id := batch_ids[array_upper(batch_ids, 1)];
+
+                        ALTER TABLE {table} DISABLE TRIGGER trg_{table}_updated_at;
+                        UPDATE {table} SET row_version = sync_row_version()
+                        WHERE id = ANY(batch_ids) AND row_version IS NULL;
+                        ALTER TABLE {table} ENABLE TRIGGER trg_{table}_updated_at;
+                        COMMIT;
+                    END LOOP;
+                END
+                $$
+            """)
+
+            # SET NOT NULL skips its table scan when a validated CHECK
+            # already proves it; VALIDATE does not block writes
+            op.execute(
+                f"ALTER TABLE {table} ADD CONSTRAINT ck_{table}_row_version_not_null "
+                f"CHECK (row_version IS NOT NULL) NOT VALID"
+            )
+            op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT ck_{table}_row_version_not_null")
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN row_version SET NOT NULL")
+            op.execute(f"ALTER TABLE {table} DROP CONSTRAINT ck_{table}_row_version_not_null")
+
+            op.create_index(
+                f'ix_{table}_user_row_version', table, ['user_id', 'row_version'],
+                postgresql_concurrently=True
+            )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.drop_index(f'ix_{table}_user_row_version', table_name=table)
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_row_version ON {table}")
+        op.drop_column(table, 'row_version')
+
+    op.execute("DROP FUNCTION IF EXISTS set_row_version()")
+    op.execute("DROP FUNCTION IF EXISTS sync_row_version_horizon()")
+    op.execute("DROP FUNCTION IF EXISTS sync_row_version()")
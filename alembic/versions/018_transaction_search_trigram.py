@@ -0,0 +1,36 @@
+"""Add trigram indexes for transaction search
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '018'
+down_revision: Union[str, None] = '017'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Search is title ILIKE '%q%' OR notes ILIKE '%q%'; one trigram index per
+    # column lets the planner answer each side from an index (BitmapOr)
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        'ix_transactions_title_trgm', 'transactions', ['title'],
+        postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'}
+    )
+    op.create_index(
+        'ix_transactions_notes_trgm', 'transactions', ['notes'],
+        postgresql_using='gin', postgresql_ops={'notes': 'gin_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_transactions_notes_trgm', table_name='transactions')
+    op.drop_index('ix_transactions_title_trgm', table_name='transactions')
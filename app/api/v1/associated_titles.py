@@ -1,16 +1,20 @@
 """Associated titles (Smart Categorization) endpoints"""
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, or_, func, cast, literal, select, update, delete, tuple_
+from sqlalchemy.dialects.postgresql import insert, CITEXT, UUID as UUID_TYPE
+from sqlalchemy.exc import IntegrityError
+from typing import Optional
 from uuid import UUID
-from app.database import get_db
-from app.core.dependencies import get_current_user
-from app.models.user import User
+from app.database import get_async_db
+from app.core.dependencies import CurrentUser, get_current_user_minimal_async
 from app.models.associated_title import AssociatedTitle
 from app.models.category import Category
 from app.schemas.associated_title import (
     AssociatedTitleCreate,
     AssociatedTitleUpdate,
     AssociatedTitleResponse,
+    AssociatedTitleCursor,
     AssociatedTitleListResponse,
     CategorySuggestion
 )
@@ -21,111 +25,133 @@ router = APIRouter()
 @router.get("", response_model=AssociatedTitleListResponse)
 async def list_associated_titles(
     category_id: UUID = Query(None, description="Filter by category"),
-    skip: int = Query(0, ge=0),
+    after_title: Optional[str] = Query(None, description="Cursor: title of the last item of the previous page"),
+    after_id: Optional[UUID] = Query(None, description="Cursor: id of the last item of the previous page"),
     limit: int = Query(100, ge=1, le=500),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """List all associated titles for the current user"""
-    query = db.query(AssociatedTitle).filter(
+    """List associated titles for the current user (keyset paginated by title)"""
+    if (after_title is None) != (after_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="after_title and after_id must be provided together"
+        )
+
+    # Read-only listing: plain column rows, no ORM instances or identity map
+    query = select(*AssociatedTitle.__table__.columns).where(
         AssociatedTitle.user_id == current_user.id
     )
 
     if category_id:
-        query = query.filter(AssociatedTitle.category_id == category_id)
+        query = query.where(AssociatedTitle.category_id == category_id)
+
+    if after_title is not None:
+        # Bind the cursor as citext so the row comparison matches the
+        # case-insensitive ORDER BY (and the title/id index)
+        query = query.where(
+            tuple_(AssociatedTitle.title, AssociatedTitle.id) > tuple_(cast(after_title, CITEXT), after_id)
+        )
+
+    # Fetch one extra row to know whether another page exists
+    titles = (await db.execute(
+        query.order_by(AssociatedTitle.title, AssociatedTitle.id).limit(limit + 1)
+    )).all()
 
-    total = query.count()
-    titles = query.order_by(AssociatedTitle.title).offset(skip).limit(limit).all()
+    next_cursor = None
+    if len(titles) > limit:
+        titles = titles[:limit]
+        next_cursor = AssociatedTitleCursor(after_title=titles[-1].title, after_id=titles[-1].id)
 
-    return AssociatedTitleListResponse(items=titles, total=total)
+    return AssociatedTitleListResponse(items=titles, next_cursor=next_cursor)
 
 
 @router.post("", response_model=AssociatedTitleResponse, status_code=status.HTTP_201_CREATED)
 async def create_associated_title(
     title_data: AssociatedTitleCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new associated title for smart categorization"""
-    # Verify category belongs to user
-    category = db.query(Category).filter(
+    # title is citext, so only surrounding whitespace needs normalizing
+    normalized_title = title_data.title.strip()
+
+    # Only produces a row if the category belongs to the user (ownership check in the same statement)
+    owned_category = select(
+        literal(current_user.id, UUID_TYPE),
+        literal(normalized_title, CITEXT),
+        Category.id,
+        literal(title_data.is_exact_match)
+    ).where(
         Category.id == title_data.category_id,
         Category.user_id == current_user.id,
         Category.deleted_at.is_(None)
-    ).first()
+    )
 
-    if not category:
+    # Insert, or update the existing mapping for this title instead of creating a duplicate
+    stmt = insert(AssociatedTitle).from_select(
+        ["user_id", "title", "category_id", "is_exact_match"],
+        owned_category
+    )
+    stmt = stmt.on_conflict_do_update(
+        constraint='uq_associated_titles_user_title',
+        set_={
+            "category_id": stmt.excluded.category_id,
+            "is_exact_match": stmt.excluded.is_exact_match,
+        }
+    ).returning(AssociatedTitle)
+
+    associated_title = (await db.scalars(stmt)).one_or_none()
+
+    if not associated_title:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Category not found"
         )
 
-    # Normalize title (lowercase)
-    normalized_title = title_data.title.lower().strip()
-
-    # Check if already exists
-    existing = db.query(AssociatedTitle).filter(
-        AssociatedTitle.user_id == current_user.id,
-        AssociatedTitle.title == normalized_title
-    ).first()
-
-    if existing:
-        # Update existing instead of creating duplicate
-        existing.category_id = title_data.category_id
-        existing.is_exact_match = title_data.is_exact_match
-        db.commit()
-        db.refresh(existing)
-        return existing
-
-    associated_title = AssociatedTitle(
-        user_id=current_user.id,
-        title=normalized_title,
-        category_id=title_data.category_id,
-        is_exact_match=title_data.is_exact_match
-    )
-    db.add(associated_title)
-    db.commit()
-    db.refresh(associated_title)
+    await db.commit()
     return associated_title
 
 
 @router.get("/suggest", response_model=CategorySuggestion)
 async def suggest_category(
     title: str = Query(..., description="Transaction title to get suggestion for"),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get category suggestion based on transaction title"""
-    normalized_title = title.lower().strip()
-
-    # First, check exact matches
-    exact_match = db.query(AssociatedTitle).filter(
+    normalized_title = title.strip()
+
+    # Exact and contains matches in one probe; exact matches take priority,
+    # then the longest (most specific) contains rule
+    match = (await db.execute(select(
+        AssociatedTitle.category_id,
+        AssociatedTitle.title,
+        AssociatedTitle.is_exact_match
+    ).where(
         AssociatedTitle.user_id == current_user.id,
-        AssociatedTitle.is_exact_match == True,
-        AssociatedTitle.title == normalized_title
-    ).first()
+        or_(
+            and_(
+                AssociatedTitle.is_exact_match == True,
+                AssociatedTitle.title == normalized_title
+            ),
+            and_(
+                AssociatedTitle.is_exact_match == False,
+                func.strpos(cast(literal(normalized_title), CITEXT), AssociatedTitle.title) > 0
+            )
+        )
+    ).order_by(
+        AssociatedTitle.is_exact_match.desc(),
+        func.length(AssociatedTitle.title).desc()
+    ).limit(1))).first()
 
-    if exact_match:
+    if match:
         return CategorySuggestion(
-            category_id=exact_match.category_id,
-            confidence="exact",
-            matched_title=exact_match.title
+            category_id=match.category_id,
+            confidence="exact" if match.is_exact_match else "contains",
+            matched_title=match.title
         )
 
-    # Then, check contains matches
-    contains_matches = db.query(AssociatedTitle).filter(
-        AssociatedTitle.user_id == current_user.id,
-        AssociatedTitle.is_exact_match == False
-    ).all()
-
-    for match in contains_matches:
-        if match.title in normalized_title:
-            return CategorySuggestion(
-                category_id=match.category_id,
-                confidence="contains",
-                matched_title=match.title
-            )
-
     # No match found
     return CategorySuggestion(
         category_id=None,
@@ -137,14 +163,14 @@ async def suggest_category(
 @router.get("/{title_id}", response_model=AssociatedTitleResponse)
 async def get_associated_title(
     title_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get a specific associated title"""
-    title = db.query(AssociatedTitle).filter(
+    title = await db.scalar(select(AssociatedTitle).where(
         AssociatedTitle.id == title_id,
         AssociatedTitle.user_id == current_user.id
-    ).first()
+    ))
 
     if not title:
         raise HTTPException(
@@ -159,14 +185,36 @@ async def get_associated_title(
 async def update_associated_title(
     title_id: UUID,
     title_data: AssociatedTitleUpdate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update an associated title"""
-    title = db.query(AssociatedTitle).filter(
-        AssociatedTitle.id == title_id,
-        AssociatedTitle.user_id == current_user.id
-    ).first()
+    update_data = title_data.model_dump(exclude_unset=True)
+    if "title" in update_data:
+        update_data["title"] = update_data["title"].strip()
+
+    if not update_data:
+        # Nothing to change; don't bump updated_at
+        title = await db.scalar(select(AssociatedTitle).where(
+            AssociatedTitle.id == title_id,
+            AssociatedTitle.user_id == current_user.id
+        ))
+    else:
+        # One UPDATE ... RETURNING instead of SELECT, UPDATE and refresh
+        stmt = update(AssociatedTitle).where(
+            AssociatedTitle.id == title_id,
+            AssociatedTitle.user_id == current_user.id
+        ).values(**update_data).returning(AssociatedTitle)
+
+        try:
+            title = (await db.scalars(stmt)).one_or_none()
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Associated title already exists"
+            )
 
     if not title:
         raise HTTPException(
@@ -174,36 +222,25 @@ async def update_associated_title(
             detail="Associated title not found"
         )
 
-    # Update fields
-    update_data = title_data.model_dump(exclude_unset=True)
-    if "title" in update_data:
-        update_data["title"] = update_data["title"].lower().strip()
-
-    for field, value in update_data.items():
-        setattr(title, field, value)
-
-    db.commit()
-    db.refresh(title)
     return title
 
 
 @router.delete("/{title_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_associated_title(
     title_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Delete an associated title"""
-    title = db.query(AssociatedTitle).filter(
+    deleted_id = await db.scalar(delete(AssociatedTitle).where(
         AssociatedTitle.id == title_id,
         AssociatedTitle.user_id == current_user.id
-    ).first()
+    ).returning(AssociatedTitle.id))
 
-    if not title:
+    if not deleted_id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Associated title not found"
         )
 
-    db.delete(title)
-    db.commit()
+    await db.commit()
@@ -1,11 +1,11 @@
 """Authentication endpoints"""
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from app.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
 from app.schemas.user import UserCreate, UserLogin, UserResponse, UserProfileUpdate
 from app.schemas.auth import Token
 from app.services.auth_service import AuthService
-from app.core.dependencies import get_current_user
+from app.core.dependencies import CurrentUser, get_current_user_async, get_current_user_minimal_async
 from app.models.user import User
 
 router = APIRouter()
@@ -14,7 +14,7 @@ router = APIRouter()
 @router.post("/register", response_model=Token, status_code=status.HTTP_201_CREATED)
 async def register(
     user_data: UserCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Register a new user
@@ -25,15 +25,14 @@ async def register(
     auth_service = AuthService(db)
 
     # Check if user already exists
-    existing_user = auth_service.get_user_by_email(user_data.email)
-    if existing_user:
+    if await auth_service.email_exists(user_data.email):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
 
     # Create user
-    user = auth_service.create_user(user_data)
+    user = await auth_service.create_user(user_data)
 
     # Create access token
     access_token = auth_service.create_access_token_for_user(user)
@@ -48,7 +47,7 @@ async def register(
 @router.post("/login", response_model=Token)
 async def login(
     credentials: UserLogin,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Login with email and password
@@ -58,7 +57,7 @@ async def login(
     auth_service = AuthService(db)
 
     # Authenticate user
-    user = auth_service.authenticate_user(
+    user = await auth_service.authenticate_user(
         credentials.email,
         credentials.password
     )
@@ -82,7 +81,7 @@ async def login(
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user_async)
 ):
     """
     Get current user information
@@ -94,7 +93,7 @@ async def get_current_user_info(
 
 @router.post("/logout")
 async def logout(
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async)
 ):
     """
     Logout (client should delete token)
@@ -107,8 +106,8 @@ async def logout(
 @router.put("/me", response_model=UserResponse)
 async def update_user_profile(
     profile_data: UserProfileUpdate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Update current user profile
@@ -132,7 +131,7 @@ async def update_user_profile(
     if profile_data.onboarding_completed is not None:
         current_user.onboarding_completed = profile_data.onboarding_completed
 
-    db.commit()
-    db.refresh(current_user)
+    # current_user stays loaded after commit (expire_on_commit=False)
+    await db.commit()
 
     return current_user
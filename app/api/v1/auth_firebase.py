@@ -1,7 +1,8 @@
 """Firebase Authentication endpoints"""
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from app.database import get_db
+from sqlalchemy import select, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
 from app.schemas.user import (
     FirebaseAuthRequest,
     GoogleAuthRequest,
@@ -11,8 +12,8 @@ from app.schemas.user import (
 from app.schemas.auth import Token
 from app.services.firebase_auth_service import verify_firebase_token, get_user_info_from_token
 from app.services.auth_service import AuthService
-from app.core.dependencies import get_current_user
-from app.core.security import verify_password
+from app.core.dependencies import get_current_user_async
+from app.core.security import verify_password_async
 from app.models.user import User
 from app.utils.time_utils import utc_now
 import logging
@@ -24,7 +25,7 @@ logger = logging.getLogger(__name__)
 @router.post("/firebase", response_model=Token, status_code=status.HTTP_200_OK)
 async def authenticate_with_firebase(
     request: FirebaseAuthRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Authenticate user with Firebase ID token
@@ -38,38 +39,41 @@ async def authenticate_with_firebase(
     - **firebase_token**: Firebase ID token from client
     """
     try:
-        logger.info("[Firebase Auth] Starting Firebase authentication...")
+        logger.debug("[Firebase Auth] Starting Firebase authentication...")
 
         # Verify Firebase token
-        logger.info("[Firebase Auth] Step 1: Verifying Firebase token...")
+        logger.debug("[Firebase Auth] Step 1: Verifying Firebase token...")
         decoded_token = verify_firebase_token(request.firebase_token)
-        logger.info(f"[Firebase Auth] Token verified for UID: {decoded_token.get('uid')}")
+        logger.debug("[Firebase Auth] Token verified for UID: %s", decoded_token.get('uid'))
 
-        logger.info("[Firebase Auth] Step 2: Extracting user info from token...")
+        logger.debug("[Firebase Auth] Step 2: Extracting user info from token...")
         user_info = get_user_info_from_token(decoded_token)
-        logger.info(f"[Firebase Auth] User info extracted: {user_info.get('email')}")
+        logger.debug("[Firebase Auth] User info extracted: %s", user_info.get('email'))
 
         auth_service = AuthService(db)
 
-        # Check if user exists by Firebase UID
-        logger.info(f"[Firebase Auth] Step 3: Checking if user exists (UID: {user_info['firebase_uid']})...")
-        user = db.query(User).filter(User.firebase_uid == user_info['firebase_uid']).first()
+        # Look up by Firebase UID and by email in one query
+        logger.debug("[Firebase Auth] Step 3: Checking if user exists (UID: %s)...", user_info['firebase_uid'])
+        candidates = (await db.scalars(select(User).where(or_(
+            User.firebase_uid == user_info['firebase_uid'],
+            User.email == user_info['email']
+        )))).all()
+        user = next((u for u in candidates if u.firebase_uid == user_info['firebase_uid']), None)
 
         if user:
             # Existing Firebase user - update last login
-            logger.info(f"[Firebase Auth] Found existing user: {user.email}")
+            logger.debug("[Firebase Auth] Found existing user: %s", user.email)
             user.last_login = utc_now()
-            db.commit()
-            db.refresh(user)
+            await db.commit()
         else:
-            logger.info("[Firebase Auth] User not found by UID, checking by email...")
+            logger.debug("[Firebase Auth] User not found by UID, checking by email...")
             # Check if user exists by email (for account linking scenario)
-            user = auth_service.get_user_by_email(user_info['email'])
+            user = next((u for u in candidates if u.email == user_info['email']), None)
 
             if user:
                 # Email exists but no Firebase UID - this is a conflict
                 # User needs to use account linking endpoint with password
-                logger.warning(f"[Firebase Auth] Email exists but not linked: {user_info['email']}")
+                logger.warning("[Firebase Auth] Email exists but not linked: %s", user_info['email'])
                 raise HTTPException(
                     status_code=status.HTTP_409_CONFLICT,
                     detail={
@@ -80,7 +84,7 @@ async def authenticate_with_firebase(
                 )
 
             # Create new user with Firebase auth
-            logger.info(f"[Firebase Auth] Creating new user: {user_info['email']}")
+            logger.debug("[Firebase Auth] Creating new user: %s", user_info['email'])
             user = User(
                 email=user_info['email'],
                 firebase_uid=user_info['firebase_uid'],
@@ -95,15 +99,14 @@ async def authenticate_with_firebase(
             )
 
             db.add(user)
-            db.commit()
-            db.refresh(user)
+            await db.commit()
 
-            logger.info(f"[Firebase Auth] Created new Firebase user: {user.email}")
+            logger.info("[Firebase Auth] Created new Firebase user: %s", user.email)
 
         # Create backend JWT token
-        logger.info("[Firebase Auth] Step 4: Creating JWT token...")
+        logger.debug("[Firebase Auth] Step 4: Creating JWT token...")
         access_token = auth_service.create_access_token_for_user(user)
-        logger.info(f"[Firebase Auth] Authentication successful for user: {user.email}")
+        logger.info("[Firebase Auth] Authentication successful for user: %s", user.email)
 
         return {
             "access_token": access_token,
@@ -113,14 +116,14 @@ async def authenticate_with_firebase(
 
     except ValueError as e:
         # Firebase token verification failed
-        logger.error(f"[Firebase Auth] ValueError: {str(e)}")
+        logger.error("[Firebase Auth] ValueError: %s", e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=f"Invalid Firebase token: {str(e)}"
         )
     except RuntimeError as e:
         # Firebase SDK not initialized
-        logger.error(f"[Firebase Auth] RuntimeError: {str(e)}")
+        logger.error("[Firebase Auth] RuntimeError: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Firebase initialization error: {str(e)}"
@@ -129,7 +132,7 @@ async def authenticate_with_firebase(
         # Re-raise HTTP exceptions (like 409 conflict)
         raise
     except Exception as e:
-        logger.error(f"[Firebase Auth] Unexpected error: {type(e).__name__}: {str(e)}")
+        logger.error("[Firebase Auth] Unexpected error: %s: %s", type(e).__name__, e)
         logger.exception("Full traceback:")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -140,7 +143,7 @@ async def authenticate_with_firebase(
 @router.post("/google", response_model=Token, status_code=status.HTTP_200_OK)
 async def authenticate_with_google(
     request: GoogleAuthRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Authenticate user with Google Sign-In (via Firebase)
@@ -157,7 +160,7 @@ async def authenticate_with_google(
 @router.post("/link-google", response_model=Token, status_code=status.HTTP_200_OK)
 async def link_google_account(
     request: LinkAccountRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Link Google account to existing email/password account (no authentication required)
@@ -171,17 +174,26 @@ async def link_google_account(
     - **password**: Current account password for verification
     """
     try:
-        logger.info("[Link Google] Starting account linking...")
+        logger.debug("[Link Google] Starting account linking...")
 
         # Verify Firebase token first
         decoded_token = verify_firebase_token(request.firebase_token)
         user_info = get_user_info_from_token(decoded_token)
 
-        logger.info(f"[Link Google] Firebase token verified for: {user_info['email']}")
+        logger.debug("[Link Google] Firebase token verified for: %s", user_info['email'])
 
-        # Find user by email from Firebase token
+        # Fetch the email owner and any account already holding this
+        # Firebase UID / Google ID in one query
         auth_service = AuthService(db)
-        user = auth_service.get_user_by_email(user_info['email'])
+        conditions = [
+            User.email == user_info['email'],
+            User.firebase_uid == user_info['firebase_uid']
+        ]
+        if user_info.get('google_id'):
+            conditions.append(User.google_id == user_info['google_id'])
+        candidates = (await db.scalars(select(User).where(or_(*conditions)))).all()
+
+        user = next((u for u in candidates if u.email == user_info['email']), None)
 
         if not user:
             raise HTTPException(
@@ -196,33 +208,22 @@ async def link_google_account(
                 detail="Account has no password set"
             )
 
-        if not verify_password(request.password, user.password_hash):
-            logger.warning(f"[Link Google] Incorrect password for: {user.email}")
+        if not await verify_password_async(request.password, user.password_hash):
+            logger.warning("[Link Google] Incorrect password for: %s", user.email)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect password"
             )
 
-        logger.info(f"[Link Google] Password verified for: {user.email}")
-
-        # Check if Firebase UID is already linked to another account
-        existing_user = db.query(User).filter(
-            User.firebase_uid == user_info['firebase_uid']
-        ).first()
-
-        if existing_user and existing_user.id != user.id:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="This Google account is already linked to another user"
-            )
-
-        # Check if Google ID is already linked to another account
-        if user_info.get('google_id'):
-            existing_google_user = db.query(User).filter(
-                User.google_id == user_info['google_id']
-            ).first()
+        logger.debug("[Link Google] Password verified for: %s", user.email)
 
-            if existing_google_user and existing_google_user.id != user.id:
+        # Check if the Firebase UID or Google ID is already linked to another account
+        for other in candidates:
+            if other.id == user.id:
+                continue
+            if other.firebase_uid == user_info['firebase_uid'] or (
+                user_info.get('google_id') and other.google_id == user_info['google_id']
+            ):
                 raise HTTPException(
                     status_code=status.HTTP_409_CONFLICT,
                     detail="This Google account is already linked to another user"
@@ -240,10 +241,9 @@ async def link_google_account(
         if user.auth_provider == 'email':
             user.auth_provider = 'google'  # Primary becomes Google
 
-        db.commit()
-        db.refresh(user)
+        await db.commit()
 
-        logger.info(f"[Link Google] Linked Google account to user: {user.email}")
+        logger.info("[Link Google] Linked Google account to user: %s", user.email)
 
         # Create and return JWT token so user is logged in
         access_token = auth_service.create_access_token_for_user(user)
@@ -262,7 +262,7 @@ async def link_google_account(
             detail=f"Invalid Firebase token: {str(e)}"
         )
     except Exception as e:
-        logger.error(f"Account linking error: {e}")
+        logger.error("Account linking error: %s", e)
         logger.exception("Full traceback:")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -272,8 +272,8 @@ async def link_google_account(
 
 @router.post("/unlink-google", status_code=status.HTTP_200_OK)
 async def unlink_google_account(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Unlink Google account from user account
@@ -300,10 +300,9 @@ async def unlink_google_account(
     current_user.google_id = None
     current_user.auth_provider = 'email'  # Revert to email-only
 
-    db.commit()
-    db.refresh(current_user)
+    await db.commit()
 
-    logger.info(f"Unlinked Google account from user: {current_user.email}")
+    logger.info("Unlinked Google account from user: %s", current_user.email)
 
     return {
         "message": "Google account unlinked successfully",
@@ -313,7 +312,7 @@ async def unlink_google_account(
 
 @router.get("/providers", response_model=AuthProvidersResponse)
 async def get_auth_providers(
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user_async)
 ):
     """
     Get list of authentication providers linked to current user
@@ -1,14 +1,12 @@
 """Budget CRUD endpoints"""
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, or_, case, func, cast, literal_column, select, update, String
 from typing import Optional
 from uuid import UUID
 from datetime import date
-from decimal import Decimal
-from app.database import get_db
-from app.core.dependencies import get_current_user
-from app.models.user import User
+from app.database import get_async_db
+from app.core.dependencies import CurrentUser, get_current_user_minimal_async
 from app.models.budget import Budget
 from app.models.transaction import Transaction
 from app.schemas.budget import (
@@ -23,38 +21,56 @@ from app.utils.time_utils import utc_now
 router = APIRouter()
 
 
-def calculate_budget_progress(db: Session, budget: Budget, user_id: UUID) -> BudgetWithProgress:
-    """Calculate budget progress based on transactions"""
-    # Build transaction filter
-    query = db.query(func.sum(Transaction.amount)).filter(
-        Transaction.user_id == user_id,
-        Transaction.is_income == budget.is_income,
-        Transaction.deleted_at.is_(None),
-        Transaction.date >= budget.start_date
+def _budget_values(data: dict) -> dict:
+    """Store wallet/category filters as JSON strings (UUIDs are not JSON serializable)"""
+    for field in ("wallet_ids", "category_ids"):
+        if data.get(field) is not None:
+            data[field] = [str(item_id) for item_id in data[field]]
+    return data
+
+
+async def fetch_budgets_with_progress(db: AsyncSession, user_id: UUID, *conditions) -> list[BudgetWithProgress]:
+    """Load budgets together with their spending progress in one aggregate query"""
+    # Each budget keeps only the transactions matching its own filters;
+    # SQL NULL, JSON null and [] all mean "all wallets/categories".
+    # Membership uses @> so it matches the jsonb_path_ops GIN indexes.
+    no_filter = [literal_column("'null'::jsonb"), literal_column("'[]'::jsonb")]
+    wallet_match = or_(
+        Budget.wallet_ids.is_(None),
+        Budget.wallet_ids.in_(no_filter),
+        Budget.wallet_ids.contains(func.jsonb_build_array(cast(Transaction.wallet_id, String)))
+    )
+    category_match = or_(
+        Budget.category_ids.is_(None),
+        Budget.category_ids.in_(no_filter),
+        Budget.category_ids.contains(func.jsonb_build_array(cast(Transaction.category_id, String)))
     )
 
-    # Filter by end date
-    if budget.end_date:
-        query = query.filter(Transaction.date <= budget.end_date)
-
-    # Filter by wallets if specified
-    if budget.wallet_ids:
-        query = query.filter(Transaction.wallet_id.in_(budget.wallet_ids))
-
-    # Filter by categories if specified
-    if budget.category_ids:
-        query = query.filter(Transaction.category_id.in_(budget.category_ids))
-
-    spent = query.scalar() or Decimal("0")
-    remaining = budget.amount - spent
-    progress_percent = float(spent / budget.amount * 100) if budget.amount > 0 else 0
+    spent = func.coalesce(func.sum(Transaction.amount), 0)
+    rows = (await db.execute(select(
+        *Budget.__table__.columns,
+        spent.label("spent"),
+        (Budget.amount - spent).label("remaining"),
+        case(
+            (Budget.amount > 0, func.least(spent / Budget.amount * 100, 100)),  # Cap at 100%
+            else_=0
+        ).label("progress_percent")
+    ).outerjoin(Transaction, and_(
+        Transaction.user_id == user_id,
+        Transaction.is_income == Budget.is_income,
+        Transaction.deleted_at.is_(None),
+        Transaction.date >= Budget.start_date,
+        or_(Budget.end_date.is_(None), Transaction.date <= Budget.end_date),
+        wallet_match,
+        category_match
+    )).where(
+        Budget.user_id == user_id,
+        Budget.deleted_at.is_(None),
+        *conditions
+    ).group_by(Budget.id).order_by(Budget.is_pinned.desc(), Budget.name))).all()
 
-    return BudgetWithProgress(
-        **BudgetResponse.model_validate(budget).model_dump(),
-        spent=spent,
-        remaining=remaining,
-        progress_percent=min(progress_percent, 100)  # Cap at 100%
-    )
+    # Rows already carry every response field, so each one is validated once
+    return [BudgetWithProgress.model_validate(row) for row in rows]
 
 
 @router.get("", response_model=BudgetListResponse)
@@ -63,75 +79,80 @@ async def list_budgets(
     is_pinned: Optional[bool] = Query(None),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """List all budgets for the current user"""
-    query = db.query(Budget).filter(
+    query = select(Budget).where(
         Budget.user_id == current_user.id,
         Budget.deleted_at.is_(None)
     )
 
     if is_archived is not None:
-        query = query.filter(Budget.is_archived == is_archived)
+        query = query.where(Budget.is_archived == is_archived)
     if is_pinned is not None:
-        query = query.filter(Budget.is_pinned == is_pinned)
+        query = query.where(Budget.is_pinned == is_pinned)
 
-    total = query.count()
-    budgets = query.order_by(Budget.is_pinned.desc(), Budget.name).offset(skip).limit(limit).all()
+    # Page and total count in one round trip
+    rows = (await db.execute(
+        query.add_columns(func.count().over().label("total"))
+        .order_by(Budget.is_pinned.desc(), Budget.name).offset(skip).limit(limit)
+    )).all()
 
-    return BudgetListResponse(items=budgets, total=total)
+    if rows:
+        total = rows[0].total
+    elif skip:
+        # Page past the end; the window count has no row to ride on
+        total = await db.scalar(select(func.count()).select_from(query.subquery()))
+    else:
+        total = 0
+
+    return BudgetListResponse(items=[row.Budget for row in rows], total=total)
 
 
 @router.get("/with-progress", response_model=list[BudgetWithProgress])
 async def list_budgets_with_progress(
     is_archived: Optional[bool] = Query(False),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """List all budgets with spending progress"""
-    query = db.query(Budget).filter(
-        Budget.user_id == current_user.id,
-        Budget.deleted_at.is_(None)
-    )
-
+    conditions = []
     if is_archived is not None:
-        query = query.filter(Budget.is_archived == is_archived)
-
-    budgets = query.order_by(Budget.is_pinned.desc(), Budget.name).all()
+        conditions.append(Budget.is_archived == is_archived)
 
-    return [calculate_budget_progress(db, b, current_user.id) for b in budgets]
+    return await fetch_budgets_with_progress(db, current_user.id, *conditions)
 
 
 @router.post("", response_model=BudgetResponse, status_code=status.HTTP_201_CREATED)
 async def create_budget(
     budget_data: BudgetCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new budget"""
     budget = Budget(
         user_id=current_user.id,
-        **budget_data.model_dump()
+        **_budget_values(budget_data.model_dump())
     )
     db.add(budget)
-    db.commit()
-    db.refresh(budget)
+    await db.commit()
+    await db.refresh(budget)
     return budget
 
 
 @router.get("/{budget_id}", response_model=BudgetResponse)
 async def get_budget(
     budget_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get a specific budget"""
-    budget = db.query(Budget).filter(
+    budget = await db.scalar(select(Budget).where(
         Budget.id == budget_id,
         Budget.user_id == current_user.id,
         Budget.deleted_at.is_(None)
-    ).first()
+    ))
 
     if not budget:
         raise HTTPException(
@@ -145,38 +166,44 @@ async def get_budget(
 @router.get("/{budget_id}/progress", response_model=BudgetWithProgress)
 async def get_budget_with_progress(
     budget_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get a specific budget with spending progress"""
-    budget = db.query(Budget).filter(
-        Budget.id == budget_id,
-        Budget.user_id == current_user.id,
-        Budget.deleted_at.is_(None)
-    ).first()
+    budgets = await fetch_budgets_with_progress(db, current_user.id, Budget.id == budget_id)
 
-    if not budget:
+    if not budgets:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Budget not found"
         )
 
-    return calculate_budget_progress(db, budget, current_user.id)
+    return budgets[0]
 
 
 @router.put("/{budget_id}", response_model=BudgetResponse)
 async def update_budget(
     budget_id: UUID,
     budget_data: BudgetUpdate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update a budget"""
-    budget = db.query(Budget).filter(
+    update_data = _budget_values(budget_data.model_dump(exclude_unset=True))
+    active_budget = and_(
         Budget.id == budget_id,
         Budget.user_id == current_user.id,
         Budget.deleted_at.is_(None)
-    ).first()
+    )
+
+    if update_data:
+        # One UPDATE ... RETURNING instead of SELECT, UPDATE and refresh
+        budget = (await db.scalars(
+            update(Budget).where(active_budget).values(**update_data).returning(Budget)
+        )).one_or_none()
+        await db.commit()
+    else:
+        budget = await db.scalar(select(Budget).where(active_budget))
 
     if not budget:
         raise HTTPException(
@@ -184,34 +211,26 @@ async def update_budget(
             detail="Budget not found"
         )
 
-    # Update fields
-    update_data = budget_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(budget, field, value)
-
-    db.commit()
-    db.refresh(budget)
     return budget
 
 
 @router.delete("/{budget_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_budget(
     budget_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Soft delete a budget"""
-    budget = db.query(Budget).filter(
+    deleted_id = await db.scalar(update(Budget).where(
         Budget.id == budget_id,
         Budget.user_id == current_user.id,
         Budget.deleted_at.is_(None)
-    ).first()
+    ).values(deleted_at=utc_now()).returning(Budget.id))
 
-    if not budget:
+    if not deleted_id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Budget not found"
         )
 
-    budget.deleted_at = utc_now()
-    db.commit()
+    await db.commit()
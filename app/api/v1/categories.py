@@ -1,20 +1,22 @@
 """Category CRUD endpoints"""
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from sqlalchemy import func, insert, lambda_stmt, literal, or_, select, update, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from typing import Optional
 from uuid import UUID
-from app.database import get_db
-from app.core.dependencies import get_current_user
-from app.models.user import User
+from app.database import get_async_db
+from app.core.dependencies import CurrentUser, get_current_user_minimal_async
 from app.models.category import Category
 from app.schemas.category import (
     CategoryCreate,
     CategoryUpdate,
     CategoryResponse,
     CategoryWithSubcategories,
-    CategoryListResponse
+    CategoryCursor,
+    CategoryListResponse,
+    CategoryCountResponse
 )
-from app.utils.time_utils import utc_now
 
 router = APIRouter()
 
@@ -23,105 +25,152 @@ router = APIRouter()
 async def list_categories(
     include_subcategories: bool = Query(False, description="Include nested subcategories"),
     is_income: Optional[bool] = Query(None, description="Filter by income/expense type"),
-    skip: int = Query(0, ge=0),
+    after_order_index: Optional[int] = Query(None, description="Cursor: order_index of the last item of the previous page"),
+    after_name: Optional[str] = Query(None, description="Cursor: name of the last item of the previous page"),
+    after_id: Optional[UUID] = Query(None, description="Cursor: id of the last item of the previous page"),
     limit: int = Query(100, ge=1, le=500),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """List all categories for the current user"""
-    query = db.query(Category).filter(
+    """List all categories for the current user (keyset paginated by order_index, name)"""
+    cursor = (after_order_index, after_name, after_id)
+    if any(part is None for part in cursor) and any(part is not None for part in cursor):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="after_order_index, after_name and after_id must be provided together"
+        )
+
+    # Read-only listing: plain column rows, no ORM instances or identity map
+    query = select(*Category.__table__.columns).where(
         Category.user_id == current_user.id,
         Category.deleted_at.is_(None)
     )
 
     if is_income is not None:
-        query = query.filter(Category.is_income == is_income)
+        query = query.where(Category.is_income == is_income)
 
     if not include_subcategories:
         # Only get parent categories
-        query = query.filter(Category.main_category_id.is_(None))
+        query = query.where(Category.main_category_id.is_(None))
+
+    if after_id is not None:
+        query = query.where(
+            tuple_(Category.order_index, Category.name, Category.id) > tuple_(*cursor)
+        )
 
-    total = query.count()
-    categories = query.order_by(Category.order_index, Category.name).offset(skip).limit(limit).all()
+    # Fetch one extra row to know whether another page exists
+    categories = (await db.execute(
+        query.order_by(Category.order_index, Category.name, Category.id).limit(limit + 1)
+    )).all()
 
-    return CategoryListResponse(items=categories, total=total)
+    next_cursor = None
+    if len(categories) > limit:
+        categories = categories[:limit]
+        last = categories[-1]
+        next_cursor = CategoryCursor(after_order_index=last.order_index, after_name=last.name, after_id=last.id)
+
+    return CategoryListResponse(items=categories, next_cursor=next_cursor)
 
 
 @router.get("/with-subcategories", response_model=list[CategoryWithSubcategories])
 async def list_categories_with_subcategories(
     is_income: Optional[bool] = Query(None, description="Filter by income/expense type"),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """List all parent categories with their subcategories nested"""
-    query = db.query(Category).filter(
+    query = select(Category).where(
         Category.user_id == current_user.id,
         Category.deleted_at.is_(None),
         Category.main_category_id.is_(None)  # Only parents
     )
 
     if is_income is not None:
-        query = query.filter(Category.is_income == is_income)
+        query = query.where(Category.is_income == is_income)
 
-    parents = query.order_by(Category.order_index, Category.name).all()
+    # Load all live subcategories in one extra query instead of one per parent
+    parents = (await db.scalars(query.options(
+        selectinload(Category.subcategories.and_(Category.deleted_at.is_(None)))
+    ).order_by(Category.order_index, Category.name))).all()
 
-    result = []
-    for parent in parents:
-        subcategories = db.query(Category).filter(
-            Category.main_category_id == parent.id,
-            Category.deleted_at.is_(None)
-        ).order_by(Category.order_index, Category.name).all()
+    # Parents already carry their subcategories, so the response model
+    # validates each row once straight from the ORM objects
+    return parents
+
+
+@router.get("/count", response_model=CategoryCountResponse)
+async def count_categories(
+    include_subcategories: bool = Query(False, description="Include nested subcategories"),
+    is_income: Optional[bool] = Query(None, description="Filter by income/expense type"),
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Count categories for the current user (same filters as the list endpoint)"""
+    query = select(func.count(Category.id)).where(
+        Category.user_id == current_user.id,
+        Category.deleted_at.is_(None)
+    )
 
-        result.append(CategoryWithSubcategories(
-            **CategoryResponse.model_validate(parent).model_dump(),
-            subcategories=subcategories
-        ))
+    if is_income is not None:
+        query = query.where(Category.is_income == is_income)
+
+    if not include_subcategories:
+        query = query.where(Category.main_category_id.is_(None))
 
-    return result
+    return CategoryCountResponse(total=await db.scalar(query))
 
 
 @router.post("", response_model=CategoryResponse, status_code=status.HTTP_201_CREATED)
 async def create_category(
     category_data: CategoryCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new category"""
-    # If subcategory, verify parent exists and belongs to user
+    values = {"user_id": current_user.id, **category_data.model_dump()}
+
     if category_data.main_category_id:
-        parent = db.query(Category).filter(
+        # Only produces a row if the parent is a live category of the user
+        # (ownership check and insert in the same statement)
+        owned_parent = select(*(
+            Category.id if column == "main_category_id"
+            else literal(value, Category.__table__.c[column].type)
+            for column, value in values.items()
+        )).where(
             Category.id == category_data.main_category_id,
             Category.user_id == current_user.id,
             Category.deleted_at.is_(None)
-        ).first()
-        if not parent:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Parent category not found"
-            )
+        )
+        stmt = insert(Category).from_select(list(values), owned_parent)
+    else:
+        stmt = insert(Category).values(**values)
 
-    category = Category(
-        user_id=current_user.id,
-        **category_data.model_dump()
-    )
-    db.add(category)
-    db.commit()
-    db.refresh(category)
+    category = (await db.scalars(stmt.returning(Category))).one_or_none()
+
+    if not category:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Parent category not found"
+        )
+
+    await db.commit()
     return category
 
 
 @router.get("/{category_id}", response_model=CategoryResponse)
 async def get_category(
     category_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get a specific category"""
-    category = db.query(Category).filter(
+    user_id = current_user.id
+    # Lambda statement: SQL is compiled once and cached, ids become bound parameters
+    category = await db.scalar(lambda_stmt(lambda: select(Category).where(
         Category.id == category_id,
-        Category.user_id == current_user.id,
+        Category.user_id == user_id,
         Category.deleted_at.is_(None)
-    ).first()
+    )))
 
     if not category:
         raise HTTPException(
@@ -136,15 +185,16 @@ async def get_category(
 async def update_category(
     category_id: UUID,
     category_data: CategoryUpdate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update a category"""
-    category = db.query(Category).filter(
+    user_id = current_user.id
+    category = await db.scalar(lambda_stmt(lambda: select(Category).where(
         Category.id == category_id,
-        Category.user_id == current_user.id,
+        Category.user_id == user_id,
         Category.deleted_at.is_(None)
-    ).first()
+    )))
 
     if not category:
         raise HTTPException(
@@ -154,12 +204,13 @@ async def update_category(
 
     # If updating parent, verify it exists
     if category_data.main_category_id:
-        parent = db.query(Category).filter(
-            Category.id == category_data.main_category_id,
-            Category.user_id == current_user.id,
+        parent_category_id = category_data.main_category_id
+        parent_id = await db.scalar(lambda_stmt(lambda: select(Category.id).where(
+            Category.id == parent_category_id,
+            Category.user_id == user_id,
             Category.deleted_at.is_(None)
-        ).first()
-        if not parent:
+        )))
+        if not parent_id:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Parent category not found"
@@ -170,37 +221,31 @@ async def update_category(
     for field, value in update_data.items():
         setattr(category, field, value)
 
-    db.commit()
-    db.refresh(category)
+    await db.commit()
+    await db.refresh(category)
     return category
 
 
 @router.delete("/{category_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_category(
     category_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Soft delete a category"""
-    category = db.query(Category).filter(
-        Category.id == category_id,
+    # Tombstone the category and its subcategories in one UPDATE; the
+    # database clock gives every row the same UTC timestamp
+    deleted_ids = (await db.scalars(update(Category).where(
+        or_(Category.id == category_id, Category.main_category_id == category_id),
         Category.user_id == current_user.id,
         Category.deleted_at.is_(None)
-    ).first()
+    ).values(deleted_at=func.timezone('utc', func.now())).returning(Category.id))).all()
 
-    if not category:
+    if category_id not in deleted_ids:
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Category not found"
         )
 
-    # Soft delete
-    category.deleted_at = utc_now()
-
-    # Also soft delete subcategories
-    db.query(Category).filter(
-        Category.main_category_id == category_id,
-        Category.deleted_at.is_(None)
-    ).update({"deleted_at": utc_now()})
-
-    db.commit()
+    await db.commit()
@@ -1,61 +1,225 @@
 """Exchange rates CRUD endpoints"""
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Body, Depends, HTTPException, status, Query
+from cachetools import TTLCache
+from sqlalchemy import lambda_stmt, literal_column, select, delete, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 from decimal import Decimal
 from typing import Optional
-from app.database import get_db
-from app.core.dependencies import get_current_user
-from app.models.user import User
+from app.database import get_async_db
+from app.core.dependencies import CurrentUser, get_current_user_minimal_async
 from app.models.exchange_rate import ExchangeRate
 from app.schemas.exchange_rate import (
     ExchangeRateCreate,
     ExchangeRateUpdate,
     ExchangeRateResponse,
+    ExchangeRateCursor,
+    ExchangeRateListResponse,
     BulkApiRatesUpdate,
     ConversionRequest,
     ConversionResponse,
 )
-from app.utils.time_utils import utc_now
+from app.utils.cache_utils import CacheGenerations
 
 router = APIRouter()
 
+# Effective rates per user: {user_id: {(from, to): (rate, is_custom) | None}}.
+# Any write to a user's rates evicts that user's entry.
+_rate_cache: TTLCache = TTLCache(maxsize=10000, ttl=60)
 
-@router.get("", response_model=list[ExchangeRateResponse])
+# /rate responses per user: {user_id: {(from, to): ExchangeRateResponse}}
+_rate_response_cache: TTLCache = TTLCache(maxsize=10000, ttl=60)
+
+# Bumped with every eviction so reads in flight do not repopulate either cache
+_rate_generations = CacheGenerations()
+
+
+def invalidate_rate_cache(user_id: UUID) -> None:
+    """Drop everything cached for the user's rates (call after each committed write)"""
+    _rate_cache.pop(user_id, None)
+    _rate_response_cache.pop(user_id, None)
+    _rate_generations.bump(user_id)
+
+
+def _effective_rate(row) -> Optional[tuple[Decimal, bool]]:
+    """(rate, is_custom) for a rate row, or None if it has no usable rate"""
+    value = row.custom_rate if row.use_custom_rate else row.api_rate
+    return (value, row.use_custom_rate) if value else None
+
+
+async def _get_rates(
+    db: AsyncSession,
+    user_id: UUID,
+    pairs: list[tuple[str, str]]
+) -> dict[tuple[str, str], Optional[tuple[Decimal, bool]]]:
+    """Return (rate, is_custom) per currency pair, or None where no usable rate is stored
+
+    Pairs missing from the cache are fetched together in one query.
+    """
+    user_rates = _rate_cache.get(user_id) or {}
+
+    missing = [pair for pair in dict.fromkeys(pairs) if pair not in user_rates]
+    if missing:
+        generation = _rate_generations.current(user_id)
+        rows = (await db.execute(select(
+            ExchangeRate.from_currency,
+            ExchangeRate.to_currency,
+            ExchangeRate.api_rate,
+            ExchangeRate.custom_rate,
+            ExchangeRate.use_custom_rate
+        ).where(
+            ExchangeRate.user_id == user_id,
+            tuple_(ExchangeRate.from_currency, ExchangeRate.to_currency).in_(missing)
+        ))).all()
+
+        fetched = dict.fromkeys(missing)
+        for row in rows:
+            fetched[(row.from_currency, row.to_currency)] = _effective_rate(row)
+
+        # Not if a write invalidated the cache while the rates were being read
+        if _rate_generations.unchanged(user_id, generation):
+            _rate_cache.setdefault(user_id, {}).update(fetched)
+        user_rates = {**user_rates, **fetched}
+
+    return {pair: user_rates[pair] for pair in pairs}
+
+
+def _rate_pairs(data: ConversionRequest) -> list[tuple[str, str]]:
+    """Currency pairs a conversion may need: the direct rate and both USD legs"""
+    from_currency = data.from_currency.upper()
+    to_currency = data.to_currency.upper()
+    if from_currency == to_currency:
+        return []
+    return [(from_currency, to_currency), ('USD', from_currency), ('USD', to_currency)]
+
+
+def _convert(
+    data: ConversionRequest,
+    rates: dict[tuple[str, str], Optional[tuple[Decimal, bool]]]
+) -> ConversionResponse:
+    """Convert one amount using rates resolved by _get_rates for _rate_pairs(data)"""
+    from_currency = data.from_currency.upper()
+    to_currency = data.to_currency.upper()
+
+    # Same currency = no conversion
+    if from_currency == to_currency:
+        return ConversionResponse(
+            original_amount=data.amount,
+            converted_amount=data.amount,
+            from_currency=from_currency,
+            to_currency=to_currency,
+            rate_used=Decimal('1'),
+            is_custom_rate=False
+        )
+
+    direct_rate = rates[(from_currency, to_currency)]
+    if direct_rate:
+        rate, is_custom = direct_rate
+        return ConversionResponse(
+            original_amount=data.amount,
+            converted_amount=data.amount * rate,
+            from_currency=from_currency,
+            to_currency=to_currency,
+            rate_used=rate,
+            is_custom_rate=is_custom
+        )
+
+    # Try conversion via USD
+    from_usd_rate = None
+    to_usd_rate = None
+
+    if from_currency == 'USD':
+        from_usd_rate = Decimal('1')
+    elif rates[('USD', from_currency)]:
+        from_usd_rate = rates[('USD', from_currency)][0]
+
+    if to_currency == 'USD':
+        to_usd_rate = Decimal('1')
+    elif rates[('USD', to_currency)]:
+        to_usd_rate = rates[('USD', to_currency)][0]
+
+    if from_usd_rate and to_usd_rate:
+        # Convert: amount * (to_rate / from_rate)
+        conversion_rate = to_usd_rate / from_usd_rate
+        return ConversionResponse(
+            original_amount=data.amount,
+            converted_amount=data.amount * conversion_rate,
+            from_currency=from_currency,
+            to_currency=to_currency,
+            rate_used=conversion_rate,
+            is_custom_rate=False
+        )
+
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"No exchange rate available for {from_currency} to {to_currency}"
+    )
+
+
+@router.get("", response_model=ExchangeRateListResponse)
 async def list_exchange_rates(
     from_currency: Optional[str] = Query(None, description="Filter by source currency"),
     to_currency: Optional[str] = Query(None, description="Filter by target currency"),
     custom_only: bool = Query(False, description="Only return custom rate overrides"),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    after_from_currency: Optional[str] = Query(None, description="Cursor: from_currency of the last item of the previous page"),
+    after_to_currency: Optional[str] = Query(None, description="Cursor: to_currency of the last item of the previous page"),
+    limit: int = Query(100, ge=1, le=500),
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """List all exchange rates for the current user"""
-    query = db.query(ExchangeRate).filter(ExchangeRate.user_id == current_user.id)
+    """List exchange rates for the current user (keyset paginated by currency pair)"""
+    if (after_from_currency is None) != (after_to_currency is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="after_from_currency and after_to_currency must be provided together"
+        )
+
+    query = select(ExchangeRate).where(ExchangeRate.user_id == current_user.id)
 
     if from_currency:
-        query = query.filter(ExchangeRate.from_currency == from_currency.upper())
+        query = query.where(ExchangeRate.from_currency == from_currency.upper())
     if to_currency:
-        query = query.filter(ExchangeRate.to_currency == to_currency.upper())
+        query = query.where(ExchangeRate.to_currency == to_currency.upper())
     if custom_only:
-        query = query.filter(ExchangeRate.use_custom_rate == True)
+        query = query.where(ExchangeRate.use_custom_rate == True)
+
+    # Served by the (user_id, from_currency, to_currency) unique index
+    if after_from_currency is not None:
+        query = query.where(
+            tuple_(ExchangeRate.from_currency, ExchangeRate.to_currency)
+            > tuple_(after_from_currency.upper(), after_to_currency.upper())
+        )
+
+    # Fetch one extra row to know whether another page exists
+    rates = (await db.scalars(
+        query.order_by(ExchangeRate.from_currency, ExchangeRate.to_currency).limit(limit + 1)
+    )).all()
+
+    next_cursor = None
+    if len(rates) > limit:
+        rates = rates[:limit]
+        next_cursor = ExchangeRateCursor(
+            after_from_currency=rates[-1].from_currency,
+            after_to_currency=rates[-1].to_currency
+        )
 
-    rates = query.order_by(ExchangeRate.from_currency, ExchangeRate.to_currency).all()
-    return rates
+    return ExchangeRateListResponse(items=rates, next_cursor=next_cursor)
 
 
 @router.post("", response_model=ExchangeRateResponse, status_code=status.HTTP_201_CREATED)
 async def create_or_update_exchange_rate(
     rate_data: ExchangeRateCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create or update an exchange rate (upsert by currency pair)"""
     # Check for existing rate
-    existing = db.query(ExchangeRate).filter(
+    existing = await db.scalar(select(ExchangeRate).where(
         ExchangeRate.user_id == current_user.id,
         ExchangeRate.from_currency == rate_data.from_currency.upper(),
         ExchangeRate.to_currency == rate_data.to_currency.upper()
-    ).first()
+    ))
 
     if existing:
         # Update existing
@@ -63,10 +227,10 @@ async def create_or_update_exchange_rate(
             if field in ('from_currency', 'to_currency'):
                 value = value.upper() if value else value
             setattr(existing, field, value)
-        existing.updated_at = utc_now()
         existing.version = (existing.version or 0) + 1
-        db.commit()
-        db.refresh(existing)
+        await db.commit()
+        invalidate_rate_cache(current_user.id)
+        await db.refresh(existing)
         return existing
     else:
         # Create new
@@ -81,8 +245,9 @@ async def create_or_update_exchange_rate(
             api_rate_fetched_at=rate_data.api_rate_fetched_at,
         )
         db.add(rate)
-        db.commit()
-        db.refresh(rate)
+        await db.commit()
+        invalidate_rate_cache(current_user.id)
+        await db.refresh(rate)
         return rate
 
 
@@ -90,15 +255,24 @@ async def create_or_update_exchange_rate(
 async def get_exchange_rate(
     from_currency: str = Query(..., description="Source currency code"),
     to_currency: str = Query(..., description="Target currency code"),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get exchange rate for a specific currency pair"""
-    rate = db.query(ExchangeRate).filter(
-        ExchangeRate.user_id == current_user.id,
-        ExchangeRate.from_currency == from_currency.upper(),
-        ExchangeRate.to_currency == to_currency.upper()
-    ).first()
+    pair = (from_currency.upper(), to_currency.upper())
+    user_responses = _rate_response_cache.get(current_user.id)
+    if user_responses is not None and pair in user_responses:
+        return user_responses[pair]
+
+    user_id = current_user.id
+    generation = _rate_generations.current(user_id)
+    from_code, to_code = pair
+    # Lambda statement: SQL is compiled once and cached, values become bound parameters
+    rate = await db.scalar(lambda_stmt(lambda: select(ExchangeRate).where(
+        ExchangeRate.user_id == user_id,
+        ExchangeRate.from_currency == from_code,
+        ExchangeRate.to_currency == to_code
+    )))
 
     if not rate:
         raise HTTPException(
@@ -106,20 +280,25 @@ async def get_exchange_rate(
             detail=f"Exchange rate not found for {from_currency}/{to_currency}"
         )
 
-    return rate
+    response = ExchangeRateResponse.model_validate(rate)
+    # Not if a write invalidated the cache while the rate was being read
+    if _rate_generations.unchanged(user_id, generation):
+        _rate_response_cache.setdefault(user_id, {})[pair] = response
+    return response
 
 
 @router.get("/{rate_id}", response_model=ExchangeRateResponse)
 async def get_exchange_rate_by_id(
     rate_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get a specific exchange rate by ID"""
-    rate = db.query(ExchangeRate).filter(
+    user_id = current_user.id
+    rate = await db.scalar(lambda_stmt(lambda: select(ExchangeRate).where(
         ExchangeRate.id == rate_id,
-        ExchangeRate.user_id == current_user.id
-    ).first()
+        ExchangeRate.user_id == user_id
+    )))
 
     if not rate:
         raise HTTPException(
@@ -134,14 +313,14 @@ async def get_exchange_rate_by_id(
 async def update_exchange_rate(
     rate_id: UUID,
     rate_data: ExchangeRateUpdate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update an exchange rate"""
-    rate = db.query(ExchangeRate).filter(
+    rate = await db.scalar(select(ExchangeRate).where(
         ExchangeRate.id == rate_id,
         ExchangeRate.user_id == current_user.id
-    ).first()
+    ))
 
     if not rate:
         raise HTTPException(
@@ -154,78 +333,95 @@ async def update_exchange_rate(
     for field, value in update_data.items():
         setattr(rate, field, value)
 
-    rate.updated_at = utc_now()
     rate.version = (rate.version or 0) + 1
-    db.commit()
-    db.refresh(rate)
+    await db.commit()
+    invalidate_rate_cache(current_user.id)
+    await db.refresh(rate)
     return rate
 
 
 @router.delete("/{rate_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_exchange_rate(
     rate_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Delete an exchange rate"""
-    rate = db.query(ExchangeRate).filter(
+    deleted_id = await db.scalar(delete(ExchangeRate).where(
         ExchangeRate.id == rate_id,
         ExchangeRate.user_id == current_user.id
-    ).first()
+    ).returning(ExchangeRate.id))
 
-    if not rate:
+    if not deleted_id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Exchange rate not found"
         )
 
-    db.delete(rate)
-    db.commit()
+    await db.commit()
+    invalidate_rate_cache(current_user.id)
 
 
 @router.post("/bulk-update-api-rates", response_model=dict)
 async def bulk_update_api_rates(
     data: BulkApiRatesUpdate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Bulk update API rates (from external API fetch)
 
     Rates should be provided as USD-based rates (e.g., {"EUR": 0.95, "GBP": 0.79})
     """
-    updated_count = 0
-    created_count = 0
-
-    for currency, rate_value in data.rates.items():
-        currency_upper = currency.upper()
-        if currency_upper == 'USD':
-            continue
-
-        existing = db.query(ExchangeRate).filter(
-            ExchangeRate.user_id == current_user.id,
-            ExchangeRate.from_currency == 'USD',
-            ExchangeRate.to_currency == currency_upper
-        ).first()
-
-        if existing:
-            existing.api_rate = rate_value
-            existing.api_rate_fetched_at = data.fetched_at
-            existing.updated_at = utc_now()
-            existing.version = (existing.version or 0) + 1
-            updated_count += 1
-        else:
-            new_rate = ExchangeRate(
-                user_id=current_user.id,
-                from_currency='USD',
-                to_currency=currency_upper,
-                api_rate=rate_value,
-                api_rate_fetched_at=data.fetched_at,
-                use_custom_rate=False,
-            )
-            db.add(new_rate)
-            created_count += 1
-
-    db.commit()
+    # One row per target currency (last value wins for duplicate keys)
+    rates = {
+        currency.upper(): rate_value
+        for currency, rate_value in data.rates.items()
+        if currency.upper() != 'USD'
+    }
+
+    inserted = []
+    if rates:
+        stmt = insert(ExchangeRate).values([
+            {
+                "user_id": current_user.id,
+                "from_currency": 'USD',
+                "to_currency": currency,
+                "api_rate": rate_value,
+                "api_rate_fetched_at": data.fetched_at,
+                "use_custom_rate": False,
+            }
+            for currency, rate_value in rates.items()
+        ])
+        stmt = stmt.on_conflict_do_update(
+            constraint='uq_exchange_rates_user_currency_pair',
+            set_={
+                "api_rate": stmt.excluded.api_rate,
+                "api_rate_fetched_at": stmt.excluded.api_rate_fetched_at,
+                "version": ExchangeRate.version + 1,
+            }
+        ).returning(
+            (literal_column("xmax") == 0).label("inserted"),  # True for freshly inserted rows
+            ExchangeRate.from_currency,
+            ExchangeRate.to_currency,
+            ExchangeRate.api_rate,
+            ExchangeRate.custom_rate,
+            ExchangeRate.use_custom_rate
+        )
+        inserted = (await db.execute(stmt)).all()
+
+    await db.commit()
+
+    # Write the refreshed rates through to the conversion cache instead of
+    # evicting it, so conversions right after a rate refresh stay cache hits;
+    # pairs not in this update are unaffected by it
+    _rate_response_cache.pop(current_user.id, None)
+    _rate_generations.bump(current_user.id)
+    user_rates = _rate_cache.setdefault(current_user.id, {})
+    for row in inserted:
+        user_rates[(row.from_currency, row.to_currency)] = _effective_rate(row)
+
+    created_count = sum(1 for row in inserted if row.inserted)
+    updated_count = len(inserted) - created_count
 
     return {
         "message": "API rates updated",
@@ -238,108 +434,46 @@ async def bulk_update_api_rates(
 @router.post("/convert", response_model=ConversionResponse)
 async def convert_currency(
     data: ConversionRequest,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Convert amount between currencies using stored rates"""
-    from_currency = data.from_currency.upper()
-    to_currency = data.to_currency.upper()
-
-    # Same currency = no conversion
-    if from_currency == to_currency:
-        return ConversionResponse(
-            original_amount=data.amount,
-            converted_amount=data.amount,
-            from_currency=from_currency,
-            to_currency=to_currency,
-            rate_used=Decimal('1'),
-            is_custom_rate=False
-        )
+    rates = await _get_rates(db, current_user.id, _rate_pairs(data))
+    return _convert(data, rates)
 
-    # Try to find direct rate
-    direct_rate = db.query(ExchangeRate).filter(
-        ExchangeRate.user_id == current_user.id,
-        ExchangeRate.from_currency == from_currency,
-        ExchangeRate.to_currency == to_currency
-    ).first()
-
-    if direct_rate:
-        rate = direct_rate.custom_rate if direct_rate.use_custom_rate else direct_rate.api_rate
-        if rate:
-            return ConversionResponse(
-                original_amount=data.amount,
-                converted_amount=data.amount * rate,
-                from_currency=from_currency,
-                to_currency=to_currency,
-                rate_used=rate,
-                is_custom_rate=direct_rate.use_custom_rate
-            )
-
-    # Try conversion via USD
-    from_usd_rate = None
-    to_usd_rate = None
-
-    if from_currency == 'USD':
-        from_usd_rate = Decimal('1')
-    else:
-        from_rate = db.query(ExchangeRate).filter(
-            ExchangeRate.user_id == current_user.id,
-            ExchangeRate.from_currency == 'USD',
-            ExchangeRate.to_currency == from_currency
-        ).first()
-        if from_rate:
-            rate = from_rate.custom_rate if from_rate.use_custom_rate else from_rate.api_rate
-            if rate:
-                from_usd_rate = rate
-
-    if to_currency == 'USD':
-        to_usd_rate = Decimal('1')
-    else:
-        to_rate = db.query(ExchangeRate).filter(
-            ExchangeRate.user_id == current_user.id,
-            ExchangeRate.from_currency == 'USD',
-            ExchangeRate.to_currency == to_currency
-        ).first()
-        if to_rate:
-            rate = to_rate.custom_rate if to_rate.use_custom_rate else to_rate.api_rate
-            if rate:
-                to_usd_rate = rate
 
-    if from_usd_rate and to_usd_rate:
-        # Convert: amount * (to_rate / from_rate)
-        conversion_rate = to_usd_rate / from_usd_rate
-        return ConversionResponse(
-            original_amount=data.amount,
-            converted_amount=data.amount * conversion_rate,
-            from_currency=from_currency,
-            to_currency=to_currency,
-            rate_used=conversion_rate,
-            is_custom_rate=False
-        )
+@router.post("/convert/batch", response_model=list[ConversionResponse])
+async def convert_currency_batch(
+    items: list[ConversionRequest] = Body(..., max_length=1000),
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Convert many amounts at once (results in request order)
 
-    raise HTTPException(
-        status_code=status.HTTP_400_BAD_REQUEST,
-        detail=f"No exchange rate available for {from_currency} to {to_currency}"
-    )
+    All rates needed by the batch are resolved with a single lookup.
+    """
+    pairs = [pair for data in items for pair in _rate_pairs(data)]
+    rates = await _get_rates(db, current_user.id, pairs)
+    return [_convert(data, rates) for data in items]
 
 
 @router.delete("/custom/{from_currency}/{to_currency}", status_code=status.HTTP_204_NO_CONTENT)
 async def clear_custom_rate(
     from_currency: str,
     to_currency: str,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Clear custom rate override (use API rate instead)"""
-    rate = db.query(ExchangeRate).filter(
+    rate = await db.scalar(select(ExchangeRate).where(
         ExchangeRate.user_id == current_user.id,
         ExchangeRate.from_currency == from_currency.upper(),
         ExchangeRate.to_currency == to_currency.upper()
-    ).first()
+    ))
 
     if rate:
         rate.custom_rate = None
         rate.use_custom_rate = False
-        rate.updated_at = utc_now()
         rate.version = (rate.version or 0) + 1
-        db.commit()
+        await db.commit()
+        invalidate_rate_cache(current_user.id)
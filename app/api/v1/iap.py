@@ -1,9 +1,15 @@
 """In-App Purchase verification endpoints"""
+import asyncio
+import httpx
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from datetime import timedelta
-from app.database import get_db
-from app.core.dependencies import get_current_user
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
+from cachetools import TLRUCache
+from datetime import timedelta, timezone
+from uuid import UUID
+from app.database import get_async_db
+from app.core.dependencies import get_current_user_async, get_current_user_id, invalidate_user_cache
+from app.core.http_client import get_http_client
 from app.models.user import User
 from app.schemas.iap import (
     PurchaseVerifyRequest,
@@ -24,8 +30,26 @@ PRODUCT_DURATIONS = {
     "premium_lifetime": None,  # Never expires
 }
 
+# Subscription status per user; clients poll /status, and the answer only
+# changes on verify/restore (which evict it) or when the subscription expires
+_STATUS_CACHE_TTL_SECONDS = 60
 
-async def verify_google_play_purchase(product_id: str, purchase_token: str) -> dict:
+
+def _status_ttu(_user_id, status_response: SubscriptionStatusResponse, now: float) -> float:
+    """Keep a cached status for at most a minute, and never past its expiry"""
+    ttl = _STATUS_CACHE_TTL_SECONDS
+    expires_at = status_response.expires_at
+    if expires_at is not None:
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        ttl = min(ttl, (expires_at - utc_now()).total_seconds())
+    return now + ttl
+
+
+_status_cache: TLRUCache = TLRUCache(maxsize=10000, ttu=_status_ttu)
+
+
+async def verify_google_play_purchase(http: httpx.AsyncClient, product_id: str, purchase_token: str) -> dict:
     """
     Verify a Google Play purchase using the Play Developer API.
 
@@ -54,7 +78,7 @@ async def verify_google_play_purchase(product_id: str, purchase_token: str) -> d
     }
 
 
-async def verify_app_store_purchase(receipt_data: str) -> dict:
+async def verify_app_store_purchase(http: httpx.AsyncClient, receipt_data: str) -> dict:
     """
     Verify an App Store purchase using the App Store Server API.
 
@@ -66,13 +90,11 @@ async def verify_app_store_purchase(receipt_data: str) -> dict:
     For now, this is a placeholder.
     """
     # TODO: Implement actual App Store verification
-    # import httpx
-    # async with httpx.AsyncClient() as client:
-    #     response = await client.post(
-    #         'https://buy.itunes.apple.com/verifyReceipt',
-    #         json={'receipt-data': receipt_data}
-    #     )
-    #     result = response.json()
+    # response = await http.post(
+    #     'https://buy.itunes.apple.com/verifyReceipt',
+    #     json={'receipt-data': receipt_data}
+    # )
+    # result = response.json()
 
     return {
         "valid": True,
@@ -84,8 +106,9 @@ async def verify_app_store_purchase(receipt_data: str) -> dict:
 @router.post("/verify", response_model=PurchaseVerifyResponse)
 async def verify_purchase(
     purchase: PurchaseVerifyRequest,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+    http: httpx.AsyncClient = Depends(get_http_client)
 ):
     """
     Verify a purchase from Google Play or App Store.
@@ -94,11 +117,12 @@ async def verify_purchase(
     try:
         if purchase.platform == IAPPlatform.ANDROID:
             result = await verify_google_play_purchase(
+                http,
                 purchase.product_id,
                 purchase.purchase_token
             )
         else:
-            result = await verify_app_store_purchase(purchase.purchase_token)
+            result = await verify_app_store_purchase(http, purchase.purchase_token)
 
         if not result.get("valid"):
             return PurchaseVerifyResponse(
@@ -127,7 +151,9 @@ async def verify_purchase(
         current_user.iap_platform = purchase.platform.value
         current_user.iap_purchased_at = utc_now()
 
-        db.commit()
+        await db.commit()
+        _status_cache.pop(current_user.id, None)
+        invalidate_user_cache(current_user.id)
 
         return PurchaseVerifyResponse(
             valid=True,
@@ -147,8 +173,9 @@ async def verify_purchase(
 @router.post("/restore", response_model=PurchaseRestoreResponse)
 async def restore_purchases(
     restore_data: PurchaseRestoreRequest,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+    http: httpx.AsyncClient = Depends(get_http_client)
 ):
     """
     Restore purchases from the store.
@@ -158,38 +185,41 @@ async def restore_purchases(
     active_subscription = None
     expires_at = None
 
-    for token in restore_data.purchase_tokens:
-        try:
-            if restore_data.platform == IAPPlatform.ANDROID:
-                result = await verify_google_play_purchase("", token)
-            else:
-                result = await verify_app_store_purchase(token)
+    # Verify all tokens concurrently; results keep the token order
+    if restore_data.platform == IAPPlatform.ANDROID:
+        verifications = [verify_google_play_purchase(http, "", token) for token in restore_data.purchase_tokens]
+    else:
+        verifications = [verify_app_store_purchase(http, token) for token in restore_data.purchase_tokens]
+    results = await asyncio.gather(*verifications, return_exceptions=True)
 
-            if result.get("valid"):
-                restored_count += 1
-                product_id = result.get("productId")
+    for result in results:
+        # A failed verification only skips that token
+        if isinstance(result, Exception) or not result.get("valid"):
+            continue
 
-                if product_id:
-                    duration = PRODUCT_DURATIONS.get(product_id)
+        restored_count += 1
+        product_id = result.get("productId")
 
-                    # Keep the best subscription
-                    if active_subscription is None or product_id == "premium_lifetime":
-                        active_subscription = product_id
+        if product_id:
+            duration = PRODUCT_DURATIONS.get(product_id)
 
-                        if duration:
-                            expires_at = utc_now() + duration
-                        else:
-                            expires_at = None
+            # Keep the best subscription
+            if active_subscription is None or product_id == "premium_lifetime":
+                active_subscription = product_id
 
-        except Exception:
-            continue
+                if duration:
+                    expires_at = utc_now() + duration
+                else:
+                    expires_at = None
 
     # Update user if we found valid purchases
     if active_subscription:
         current_user.subscription_tier = active_subscription
         current_user.subscription_expires_at = expires_at
         current_user.iap_platform = restore_data.platform.value
-        db.commit()
+        await db.commit()
+        _status_cache.pop(current_user.id, None)
+        invalidate_user_cache(current_user.id)
 
     return PurchaseRestoreResponse(
         restored_count=restored_count,
@@ -200,17 +230,32 @@ async def restore_purchases(
 
 @router.get("/status", response_model=SubscriptionStatusResponse)
 async def get_subscription_status(
-    current_user: User = Depends(get_current_user)
+    user_id: UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get current subscription status"""
+    """Get current subscription status (cached per user for up to a minute)"""
+    cached = _status_cache.get(user_id)
+    if cached is not None:
+        return cached
+
+    current_user = await db.get(User, user_id, options=[raiseload("*")])
+    if current_user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
     days_remaining = None
     if current_user.subscription_expires_at:
         delta = current_user.subscription_expires_at - utc_now()
         days_remaining = max(0, delta.days)
 
-    return SubscriptionStatusResponse(
+    status_response = SubscriptionStatusResponse(
         is_premium=current_user.is_premium,
         subscription_tier=current_user.subscription_tier,
         expires_at=current_user.subscription_expires_at,
         days_remaining=days_remaining
     )
+    _status_cache[user_id] = status_response
+    return status_response
@@ -1,14 +1,16 @@
 """Objective (Goals & Savings) CRUD endpoints"""
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from cachetools import TTLCache
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
+from sqlalchemy import bindparam, exists, func, lambda_stmt, select
+from sqlalchemy.dialects.postgresql import insert
 from typing import Optional
 from uuid import UUID
 from datetime import date
 from decimal import Decimal
-from app.database import get_db
-from app.core.dependencies import get_current_user
-from app.models.user import User
+from app.database import get_async_db
+from app.core.dependencies import CurrentUser, get_current_user_minimal_async
 from app.models.objective import Objective, objective_transactions, ObjectiveType
 from app.models.transaction import Transaction
 from app.schemas.objective import (
@@ -20,22 +22,80 @@ from app.schemas.objective import (
     ObjectiveTransactionLink,
     ObjectiveTransactionResponse
 )
+from app.utils.cache_utils import CacheGenerations
 from app.utils.time_utils import utc_now
+from app.utils.uuid_utils import uuid7
 
 router = APIRouter()
 
+# GET /objectives responses per user: {user_id: {query params: ObjectiveListResponse}}.
+# Any write to a user's objectives (here or via sync push) evicts that user's entry.
+_list_cache: TTLCache = TTLCache(maxsize=10000, ttl=30)
+_list_generations = CacheGenerations()
 
-def calculate_objective_progress(db: Session, objective: Objective, user_id: UUID) -> ObjectiveWithProgress:
-    """Calculate objective progress based on linked transactions"""
-    # Sum linked transactions
-    current_amount = db.query(func.sum(Transaction.amount)).join(
-        objective_transactions,
+
+def invalidate_objective_cache(user_id: UUID) -> None:
+    """Drop cached objective lists for the user (call after each committed write)"""
+    _list_cache.pop(user_id, None)
+    _list_generations.bump(user_id)
+
+
+# Link/unlink statements are built once at import; handlers only bind values
+_OBJECTIVE_OWNED = exists().where(
+    Objective.id == bindparam("objective_id"),
+    Objective.user_id == bindparam("user_id")
+)
+
+# Both ownership checks in one round trip
+_LINK_OWNERSHIP_STMT = select(
+    exists().where(
+        Objective.id == bindparam("objective_id"),
+        Objective.user_id == bindparam("user_id"),
+        Objective.deleted_at.is_(None)
+    ).label("objective_ok"),
+    exists().where(
+        Transaction.id == bindparam("transaction_id"),
+        Transaction.user_id == bindparam("user_id"),
+        Transaction.deleted_at.is_(None)
+    ).label("transaction_ok")
+)
+
+# An existing link makes the insert a no-op with no row returned
+_LINK_INSERT_STMT = insert(objective_transactions).on_conflict_do_nothing(
+    constraint='uq_objective_transactions_objective_transaction'
+).returning(objective_transactions.c.id)
+
+# Deletes the link only if the objective belongs to the user
+_UNLINK_DELETE_STMT = objective_transactions.delete().where(
+    objective_transactions.c.objective_id == bindparam("objective_id"),
+    objective_transactions.c.transaction_id == bindparam("transaction_id"),
+    _OBJECTIVE_OWNED
+).returning(objective_transactions.c.id)
+
+_OBJECTIVE_OWNED_STMT = select(_OBJECTIVE_OWNED)
+
+
+async def _bulk_current_amounts(db: AsyncSession, objective_ids: list[UUID]) -> dict[UUID, Decimal]:
+    """Sum linked live transactions for many objectives in one GROUP BY query"""
+    if not objective_ids:
+        return {}
+
+    rows = (await db.execute(select(
+        objective_transactions.c.objective_id,
+        func.sum(Transaction.amount)
+    ).join(
+        Transaction,
         Transaction.id == objective_transactions.c.transaction_id
-    ).filter(
-        objective_transactions.c.objective_id == objective.id,
+    ).where(
+        objective_transactions.c.objective_id.in_(objective_ids),
         Transaction.deleted_at.is_(None)
-    ).scalar() or Decimal("0")
+    ).group_by(objective_transactions.c.objective_id))).all()
+
+    return {objective_id: amount for objective_id, amount in rows}
 
+
+def calculate_objective_progress(objective: Objective, current_amount: Decimal, today: date) -> ObjectiveWithProgress:
+    """Calculate objective progress from the sum of its linked transactions"""
     remaining = objective.target_amount - current_amount
     progress_percent = float(current_amount / objective.target_amount * 100) if objective.target_amount > 0 else 0
 
@@ -43,19 +103,21 @@ def calculate_objective_progress(db: Session, objective: Objective, user_id: UUI
     days_remaining = None
     daily_target = None
     if objective.end_date:
-        days = (objective.end_date - date.today()).days
+        days = (objective.end_date - today).days
         days_remaining = max(days, 0)
         if days_remaining > 0 and remaining > 0:
             daily_target = remaining / Decimal(days_remaining)
 
-    return ObjectiveWithProgress(
-        **ObjectiveResponse.model_validate(objective).model_dump(),
-        current_amount=current_amount,
-        progress_percent=min(progress_percent, 100),
-        remaining_amount=max(remaining, Decimal("0")),
-        days_remaining=days_remaining,
-        daily_target=daily_target
-    )
+    # Validate once, straight from the ORM columns (no intermediate
+    # ObjectiveResponse dump/re-parse)
+    return ObjectiveWithProgress.model_validate({
+        **{column.key: getattr(objective, column.key) for column in Objective.__table__.columns},
+        "current_amount": current_amount,
+        "progress_percent": min(progress_percent, 100),
+        "remaining_amount": max(remaining, Decimal("0")),
+        "days_remaining": days_remaining,
+        "daily_target": daily_target
+    })
 
 
 @router.get("", response_model=ObjectiveListResponse)
@@ -65,56 +127,91 @@ async def list_objectives(
     is_pinned: Optional[bool] = Query(None),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """List all objectives for the current user"""
-    query = db.query(Objective).filter(
-        Objective.user_id == current_user.id,
-        Objective.deleted_at.is_(None)
-    )
-
-    if objective_type:
-        query = query.filter(Objective.type == objective_type)
-    if is_archived is not None:
-        query = query.filter(Objective.is_archived == is_archived)
-    if is_pinned is not None:
-        query = query.filter(Objective.is_pinned == is_pinned)
-
-    total = query.count()
-    objectives = query.order_by(Objective.is_pinned.desc(), Objective.name).offset(skip).limit(limit).all()
-
-    return ObjectiveListResponse(items=objectives, total=total)
+    """List all objectives for the current user (cached per user for up to 30 seconds)"""
+    cache_key = (objective_type, is_archived, is_pinned, skip, limit)
+    user_lists = _list_cache.get(current_user.id)
+    if user_lists is not None and cache_key in user_lists:
+        return user_lists[cache_key]
+
+    user_id = current_user.id
+    generation = _list_generations.current(user_id)
+
+    async def fetch_page(offset: int, count: int):
+        # Lambda statement: SQL is compiled once per filter shape, values
+        # become bound parameters. Page and total count in one round trip;
+        # rows are serialized column-only, so relationship access fails loudly
+        stmt = lambda_stmt(lambda: select(Objective, func.count().over().label("total")).options(
+            raiseload("*")
+        ).where(
+            Objective.user_id == user_id,
+            Objective.deleted_at.is_(None)
+        ))
+
+        if objective_type:
+            stmt += lambda s: s.where(Objective.type == objective_type)
+        if is_archived is not None:
+            stmt += lambda s: s.where(Objective.is_archived == is_archived)
+        if is_pinned is not None:
+            stmt += lambda s: s.where(Objective.is_pinned == is_pinned)
+
+        stmt += lambda s: s.order_by(Objective.is_pinned.desc(), Objective.name).offset(offset).limit(count)
+        return (await db.execute(stmt)).all()
+
+    rows = await fetch_page(skip, limit)
+
+    if rows:
+        total = rows[0].total
+    elif skip:
+        # Page past the end; the window count has no row to ride on
+        first = await fetch_page(0, 1)
+        total = first[0].total if first else 0
+    else:
+        total = 0
+
+    response = ObjectiveListResponse(items=[row.Objective for row in rows], total=total)
+    # Not if a write invalidated the cache while this page was being read
+    if _list_generations.unchanged(user_id, generation):
+        _list_cache.setdefault(user_id, {})[cache_key] = response
+    return response
 
 
 @router.get("/with-progress", response_model=list[ObjectiveWithProgress])
 async def list_objectives_with_progress(
     objective_type: Optional[ObjectiveType] = Query(None),
     is_archived: Optional[bool] = Query(False),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """List all objectives with progress details"""
-    query = db.query(Objective).filter(
+    query = select(Objective).where(
         Objective.user_id == current_user.id,
         Objective.deleted_at.is_(None)
     )
 
     if objective_type:
-        query = query.filter(Objective.type == objective_type)
+        query = query.where(Objective.type == objective_type)
     if is_archived is not None:
-        query = query.filter(Objective.is_archived == is_archived)
+        query = query.where(Objective.is_archived == is_archived)
+
+    objectives = (await db.scalars(query.order_by(Objective.is_pinned.desc(), Objective.name))).all()
 
-    objectives = query.order_by(Objective.is_pinned.desc(), Objective.name).all()
+    current_amounts = await _bulk_current_amounts(db, [obj.id for obj in objectives])
+    today = date.today()
 
-    return [calculate_objective_progress(db, obj, current_user.id) for obj in objectives]
+    return [
+        calculate_objective_progress(obj, current_amounts.get(obj.id, Decimal("0")), today)
+        for obj in objectives
+    ]
 
 
 @router.post("", response_model=ObjectiveResponse, status_code=status.HTTP_201_CREATED)
 async def create_objective(
     objective_data: ObjectiveCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new objective"""
     objective = Objective(
@@ -122,23 +219,24 @@ async def create_objective(
         **objective_data.model_dump()
     )
     db.add(objective)
-    db.commit()
-    db.refresh(objective)
+    await db.commit()
+    invalidate_objective_cache(current_user.id)
+    await db.refresh(objective)
     return objective
 
 
 @router.get("/{objective_id}", response_model=ObjectiveResponse)
 async def get_objective(
     objective_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get a specific objective"""
-    objective = db.query(Objective).filter(
+    objective = await db.scalar(select(Objective).where(
         Objective.id == objective_id,
         Objective.user_id == current_user.id,
         Objective.deleted_at.is_(None)
-    ).first()
+    ))
 
     if not objective:
         raise HTTPException(
@@ -152,15 +250,15 @@ async def get_objective(
 @router.get("/{objective_id}/progress", response_model=ObjectiveWithProgress)
 async def get_objective_with_progress(
     objective_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get a specific objective with progress details"""
-    objective = db.query(Objective).filter(
+    objective = await db.scalar(select(Objective).where(
         Objective.id == objective_id,
         Objective.user_id == current_user.id,
         Objective.deleted_at.is_(None)
-    ).first()
+    ))
 
     if not objective:
         raise HTTPException(
@@ -168,22 +266,23 @@ async def get_objective_with_progress(
             detail="Objective not found"
         )
 
-    return calculate_objective_progress(db, objective, current_user.id)
+    current_amounts = await _bulk_current_amounts(db, [objective.id])
+    return calculate_objective_progress(objective, current_amounts.get(objective.id, Decimal("0")), date.today())
 
 
 @router.put("/{objective_id}", response_model=ObjectiveResponse)
 async def update_objective(
     objective_id: UUID,
     objective_data: ObjectiveUpdate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update an objective"""
-    objective = db.query(Objective).filter(
+    objective = await db.scalar(select(Objective).where(
         Objective.id == objective_id,
         Objective.user_id == current_user.id,
         Objective.deleted_at.is_(None)
-    ).first()
+    ))
 
     if not objective:
         raise HTTPException(
@@ -196,23 +295,24 @@ async def update_objective(
     for field, value in update_data.items():
         setattr(objective, field, value)
 
-    db.commit()
-    db.refresh(objective)
+    await db.commit()
+    invalidate_objective_cache(current_user.id)
+    await db.refresh(objective)
     return objective
 
 
 @router.delete("/{objective_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_objective(
     objective_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Soft delete an objective"""
-    objective = db.query(Objective).filter(
+    objective = await db.scalar(select(Objective).where(
         Objective.id == objective_id,
         Objective.user_id == current_user.id,
         Objective.deleted_at.is_(None)
-    ).first()
+    ))
 
     if not objective:
         raise HTTPException(
@@ -221,7 +321,8 @@ async def delete_objective(
         )
 
     objective.deleted_at = utc_now()
-    db.commit()
+    await db.commit()
+    invalidate_objective_cache(current_user.id)
 
 
 # Transaction linking endpoints
@@ -229,61 +330,45 @@ async def delete_objective(
 async def link_transaction_to_objective(
     objective_id: UUID,
     link_data: ObjectiveTransactionLink,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Link a transaction to an objective"""
-    # Verify objective exists
-    objective = db.query(Objective).filter(
-        Objective.id == objective_id,
-        Objective.user_id == current_user.id,
-        Objective.deleted_at.is_(None)
-    ).first()
-
-    if not objective:
+    # Verify objective and transaction exist in one round trip
+    ownership = (await db.execute(_LINK_OWNERSHIP_STMT, {
+        "objective_id": objective_id,
+        "transaction_id": link_data.transaction_id,
+        "user_id": current_user.id
+    })).one()
+
+    if not ownership.objective_ok:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Objective not found"
         )
 
-    # Verify transaction exists
-    transaction = db.query(Transaction).filter(
-        Transaction.id == link_data.transaction_id,
-        Transaction.user_id == current_user.id,
-        Transaction.deleted_at.is_(None)
-    ).first()
-
-    if not transaction:
+    if not ownership.transaction_ok:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Transaction not found"
         )
 
-    # Check if already linked
-    existing = db.execute(
-        objective_transactions.select().where(
-            objective_transactions.c.objective_id == objective_id,
-            objective_transactions.c.transaction_id == link_data.transaction_id
-        )
-    ).first()
+    # Create link (no row returned if it already exists)
+    link_id = await db.scalar(_LINK_INSERT_STMT, {
+        "id": uuid7(),
+        "objective_id": objective_id,
+        "transaction_id": link_data.transaction_id,
+        "created_at": utc_now()
+    })
 
-    if existing:
+    if not link_id:
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Transaction already linked to this objective"
         )
 
-    # Create link
-    import uuid
-    db.execute(
-        objective_transactions.insert().values(
-            id=uuid.uuid4(),
-            objective_id=objective_id,
-            transaction_id=link_data.transaction_id,
-            created_at=utc_now()
-        )
-    )
-    db.commit()
+    await db.commit()
 
     return {"message": "Transaction linked successfully"}
 
@@ -292,34 +377,29 @@ async def link_transaction_to_objective(
 async def unlink_transaction_from_objective(
     objective_id: UUID,
     transaction_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Unlink a transaction from an objective"""
-    # Verify objective belongs to user
-    objective = db.query(Objective).filter(
-        Objective.id == objective_id,
-        Objective.user_id == current_user.id
-    ).first()
-
-    if not objective:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Objective not found"
-        )
-
-    # Delete link
-    result = db.execute(
-        objective_transactions.delete().where(
-            objective_transactions.c.objective_id == objective_id,
-            objective_transactions.c.transaction_id == transaction_id
-        )
-    )
-
-    if result.rowcount == 0:
+    params = {
+        "objective_id": objective_id,
+        "transaction_id": transaction_id,
+        "user_id": current_user.id
+    }
+
+    # Delete link, only if the objective belongs to the user
+    deleted_id = await db.scalar(_UNLINK_DELETE_STMT, params)
+
+    if not deleted_id:
+        # Nothing deleted; tell a foreign/missing objective apart from a missing link
+        if not await db.scalar(_OBJECTIVE_OWNED_STMT, params):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Objective not found"
+            )
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Link not found"
         )
 
-    db.commit()
+    await db.commit()
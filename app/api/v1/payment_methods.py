@@ -1,10 +1,12 @@
 """Payment method CRUD endpoints"""
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from cachetools import TTLCache
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
+from sqlalchemy import func, lambda_stmt, select, update
 from uuid import UUID
-from app.database import get_db
-from app.core.dependencies import get_current_user
-from app.models.user import User
+from app.database import get_async_db
+from app.core.dependencies import CurrentUser, get_current_user_minimal_async
 from app.models.payment_method import PaymentMethod
 from app.schemas.payment_method import (
     PaymentMethodCreate,
@@ -12,66 +14,105 @@ from app.schemas.payment_method import (
     PaymentMethodResponse,
     PaymentMethodListResponse
 )
+from app.utils.cache_utils import CacheGenerations
 from app.utils.time_utils import utc_now
 
 router = APIRouter()
 
+# GET /payment-methods responses per user: {user_id: {query params: PaymentMethodListResponse}}.
+# Any write to a user's payment methods (here or via sync push) evicts that user's entry.
+_list_cache: TTLCache = TTLCache(maxsize=10000, ttl=30)
+_list_generations = CacheGenerations()
+
+
+def invalidate_payment_method_cache(user_id: UUID) -> None:
+    """Drop cached payment method lists for the user (call after each committed write)"""
+    _list_cache.pop(user_id, None)
+    _list_generations.bump(user_id)
+
 
 @router.get("", response_model=PaymentMethodListResponse)
 async def list_payment_methods(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """List all payment methods for the current user"""
-    query = db.query(PaymentMethod).filter(
-        PaymentMethod.user_id == current_user.id,
-        PaymentMethod.deleted_at.is_(None)
-    )
-
-    total = query.count()
-    payment_methods = query.order_by(PaymentMethod.name).offset(skip).limit(limit).all()
-
-    return PaymentMethodListResponse(items=payment_methods, total=total)
+    """List all payment methods for the current user (cached per user for up to 30 seconds)"""
+    cache_key = (skip, limit)
+    user_lists = _list_cache.get(current_user.id)
+    if user_lists is not None and cache_key in user_lists:
+        return user_lists[cache_key]
+
+    user_id = current_user.id
+    generation = _list_generations.current(user_id)
+
+    async def fetch_page(offset: int, count: int):
+        # Lambda statement: SQL is compiled once and cached, values become
+        # bound parameters. Page and total count in one round trip; rows are
+        # serialized column-only, so relationship access fails loudly
+        return (await db.execute(lambda_stmt(lambda: select(PaymentMethod, func.count().over().label("total")).options(
+            raiseload("*")
+        ).where(
+            PaymentMethod.user_id == user_id,
+            PaymentMethod.deleted_at.is_(None)
+        ).order_by(PaymentMethod.name).offset(offset).limit(count)))).all()
+
+    rows = await fetch_page(skip, limit)
+
+    if rows:
+        total = rows[0].total
+    elif skip:
+        # Page past the end; the window count has no row to ride on
+        first = await fetch_page(0, 1)
+        total = first[0].total if first else 0
+    else:
+        total = 0
+
+    response = PaymentMethodListResponse(items=[row.PaymentMethod for row in rows], total=total)
+    # Not if a write invalidated the cache while this page was being read
+    if _list_generations.unchanged(user_id, generation):
+        _list_cache.setdefault(user_id, {})[cache_key] = response
+    return response
 
 
 @router.post("", response_model=PaymentMethodResponse, status_code=status.HTTP_201_CREATED)
 async def create_payment_method(
     payment_method_data: PaymentMethodCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new payment method"""
     # If this is set as default, unset other defaults
     if payment_method_data.is_default:
-        db.query(PaymentMethod).filter(
+        await db.execute(update(PaymentMethod).where(
             PaymentMethod.user_id == current_user.id,
             PaymentMethod.is_default == True
-        ).update({"is_default": False})
+        ).values(is_default=False).execution_options(synchronize_session=False))
 
     payment_method = PaymentMethod(
         user_id=current_user.id,
         **payment_method_data.model_dump()
     )
     db.add(payment_method)
-    db.commit()
-    db.refresh(payment_method)
+    await db.commit()
+    invalidate_payment_method_cache(current_user.id)
+    await db.refresh(payment_method)
     return payment_method
 
 
 @router.get("/{payment_method_id}", response_model=PaymentMethodResponse)
 async def get_payment_method(
     payment_method_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get a specific payment method"""
-    payment_method = db.query(PaymentMethod).filter(
+    payment_method = await db.scalar(select(PaymentMethod).where(
         PaymentMethod.id == payment_method_id,
         PaymentMethod.user_id == current_user.id,
         PaymentMethod.deleted_at.is_(None)
-    ).first()
+    ))
 
     if not payment_method:
         raise HTTPException(
@@ -86,15 +127,15 @@ async def get_payment_method(
 async def update_payment_method(
     payment_method_id: UUID,
     payment_method_data: PaymentMethodUpdate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update a payment method"""
-    payment_method = db.query(PaymentMethod).filter(
+    payment_method = await db.scalar(select(PaymentMethod).where(
         PaymentMethod.id == payment_method_id,
         PaymentMethod.user_id == current_user.id,
         PaymentMethod.deleted_at.is_(None)
-    ).first()
+    ))
 
     if not payment_method:
         raise HTTPException(
@@ -102,36 +143,37 @@ async def update_payment_method(
             detail="Payment method not found"
         )
 
-    # If setting as default, unset others
-    if payment_method_data.is_default:
-        db.query(PaymentMethod).filter(
+    # If setting as default, unset others (nothing to do if it already is the default)
+    if payment_method_data.is_default and not payment_method.is_default:
+        await db.execute(update(PaymentMethod).where(
             PaymentMethod.user_id == current_user.id,
             PaymentMethod.id != payment_method_id,
             PaymentMethod.is_default == True
-        ).update({"is_default": False})
+        ).values(is_default=False).execution_options(synchronize_session=False))
 
     # Update fields
     update_data = payment_method_data.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(payment_method, field, value)
 
-    db.commit()
-    db.refresh(payment_method)
+    await db.commit()
+    invalidate_payment_method_cache(current_user.id)
+    await db.refresh(payment_method)
     return payment_method
 
 
 @router.delete("/{payment_method_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_payment_method(
     payment_method_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Soft delete a payment method"""
-    payment_method = db.query(PaymentMethod).filter(
+    payment_method = await db.scalar(select(PaymentMethod).where(
         PaymentMethod.id == payment_method_id,
         PaymentMethod.user_id == current_user.id,
         PaymentMethod.deleted_at.is_(None)
-    ).first()
+    ))
 
     if not payment_method:
         raise HTTPException(
@@ -141,4 +183,5 @@ async def delete_payment_method(
 
     # Soft delete
     payment_method.deleted_at = utc_now()
-    db.commit()
+    await db.commit()
+    invalidate_payment_method_cache(current_user.id)
@@ -1,12 +1,13 @@
 """Recurring transaction configuration endpoints"""
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from sqlalchemy import func, insert, lambda_stmt, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 from typing import Optional
 from uuid import UUID
-from datetime import date
-from app.database import get_db
-from app.core.dependencies import get_current_user
-from app.models.user import User
+from datetime import date, datetime, time
+from app.database import get_async_db
+from app.core.dependencies import CurrentUser, get_current_user_minimal_async
 from app.models.recurring_config import RecurringConfig
 from app.models.transaction import Transaction, TransactionType
 from app.schemas.recurring import (
@@ -17,54 +18,65 @@ from app.schemas.recurring import (
     RecurringTriggerResponse
 )
 from app.utils.time_utils import utc_now
+from app.utils.uuid_utils import uuid7
 
 router = APIRouter()
 
 
-def process_single_recurring(db: Session, config: RecurringConfig) -> list[UUID]:
-    """Process a single recurring config, creating transactions as needed"""
-    created_ids = []
-    today = date.today()
+async def process_single_recurring(
+    db: AsyncSession,
+    config: RecurringConfig,
+    base: Optional[Transaction],
+    today: date
+) -> list[UUID]:
+    """Process a single recurring config, creating transactions as needed
+
+    base is the config's live base transaction (None if it was deleted),
+    loaded by the caller so many configs can share one query.
+    """
+    # Nothing due yet
+    if config.next_occurrence > today:
+        return []
+
+    # Already past its end date: deactivate
+    if config.end_date and config.next_occurrence > config.end_date:
+        config.is_active = False
+        return []
+
+    if not base:
+        config.is_active = False
+        return []
 
+    # Collect every due occurrence, then insert them in one statement
+    new_rows = []
     while config.is_active and config.next_occurrence <= today:
         # Check if ended
         if config.end_date and config.next_occurrence > config.end_date:
             config.is_active = False
             break
 
-        # Get base transaction
-        base = db.query(Transaction).filter(
-            Transaction.id == config.base_transaction_id,
-            Transaction.deleted_at.is_(None)
-        ).first()
-
-        if not base:
-            config.is_active = False
-            break
-
-        # Create new transaction instance
-        import uuid
-        new_transaction = Transaction(
-            id=uuid.uuid4(),
-            user_id=config.user_id,
-            wallet_id=base.wallet_id,
-            category_id=base.category_id,
-            payment_method_id=base.payment_method_id,
-            amount=base.amount,
-            title=base.title,
-            notes=base.notes,
-            date=config.next_occurrence,
-            is_income=base.is_income,
-            type=TransactionType.RECURRING_INSTANCE,
-            recurring_config_id=config.id
-        )
-        db.add(new_transaction)
-        created_ids.append(new_transaction.id)
+        new_rows.append({
+            "id": uuid7(),
+            "user_id": config.user_id,
+            "wallet_id": base.wallet_id,
+            "category_id": base.category_id,
+            "payment_method_id": base.payment_method_id,
+            "amount": base.amount,
+            "title": base.title,
+            "notes": base.notes,
+            "date": datetime.combine(config.next_occurrence, time.min),
+            "is_income": base.is_income,
+            "type": TransactionType.RECURRING_INSTANCE,
+            "recurring_config_id": config.id
+        })
 
         # Calculate next occurrence
         config.next_occurrence = config.calculate_next_occurrence()
 
-    return created_ids
+    if new_rows:
+        await db.execute(insert(Transaction), new_rows)
+
+    return [row["id"] for row in new_rows]
 
 
 @router.get("", response_model=RecurringConfigListResponse)
@@ -72,36 +84,53 @@ async def list_recurring_configs(
     is_active: Optional[bool] = Query(None),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """List all recurring configurations for the current user"""
-    query = db.query(RecurringConfig).filter(
-        RecurringConfig.user_id == current_user.id
-    )
+    user_id = current_user.id
+
+    async def fetch_page(offset: int, count: int):
+        # Lambda statement: SQL is compiled once per filter shape, values
+        # become bound parameters. Page and total count in one round trip;
+        # rows are serialized column-only, so relationship access fails loudly
+        stmt = lambda_stmt(lambda: select(RecurringConfig, func.count().over().label("total")).options(
+            raiseload("*")
+        ).where(RecurringConfig.user_id == user_id))
 
-    if is_active is not None:
-        query = query.filter(RecurringConfig.is_active == is_active)
+        if is_active is not None:
+            stmt += lambda s: s.where(RecurringConfig.is_active == is_active)
 
-    total = query.count()
-    configs = query.order_by(RecurringConfig.next_occurrence).offset(skip).limit(limit).all()
+        stmt += lambda s: s.order_by(RecurringConfig.next_occurrence).offset(offset).limit(count)
+        return (await db.execute(stmt)).all()
 
-    return RecurringConfigListResponse(items=configs, total=total)
+    rows = await fetch_page(skip, limit)
+
+    if rows:
+        total = rows[0].total
+    elif skip:
+        # Page past the end; the window count has no row to ride on
+        first = await fetch_page(0, 1)
+        total = first[0].total if first else 0
+    else:
+        total = 0
+
+    return RecurringConfigListResponse(items=[row.RecurringConfig for row in rows], total=total)
 
 
 @router.post("", response_model=RecurringConfigResponse, status_code=status.HTTP_201_CREATED)
 async def create_recurring_config(
     config_data: RecurringConfigCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new recurring configuration"""
     # Verify base transaction belongs to user
-    base = db.query(Transaction).filter(
+    base = await db.scalar(select(Transaction.id).where(
         Transaction.id == config_data.base_transaction_id,
         Transaction.user_id == current_user.id,
         Transaction.deleted_at.is_(None)
-    ).first()
+    ))
 
     if not base:
         raise HTTPException(
@@ -115,22 +144,22 @@ async def create_recurring_config(
         **config_data.model_dump()
     )
     db.add(config)
-    db.commit()
-    db.refresh(config)
+    await db.commit()
+    await db.refresh(config)
     return config
 
 
 @router.get("/{config_id}", response_model=RecurringConfigResponse)
 async def get_recurring_config(
     config_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get a specific recurring configuration"""
-    config = db.query(RecurringConfig).filter(
+    config = await db.scalar(select(RecurringConfig).where(
         RecurringConfig.id == config_id,
         RecurringConfig.user_id == current_user.id
-    ).first()
+    ))
 
     if not config:
         raise HTTPException(
@@ -145,14 +174,14 @@ async def get_recurring_config(
 async def update_recurring_config(
     config_id: UUID,
     config_data: RecurringConfigUpdate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update a recurring configuration"""
-    config = db.query(RecurringConfig).filter(
+    config = await db.scalar(select(RecurringConfig).where(
         RecurringConfig.id == config_id,
         RecurringConfig.user_id == current_user.id
-    ).first()
+    ))
 
     if not config:
         raise HTTPException(
@@ -165,22 +194,22 @@ async def update_recurring_config(
     for field, value in update_data.items():
         setattr(config, field, value)
 
-    db.commit()
-    db.refresh(config)
+    await db.commit()
+    await db.refresh(config)
     return config
 
 
 @router.delete("/{config_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_recurring_config(
     config_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Delete a recurring configuration (does not delete created transactions)"""
-    config = db.query(RecurringConfig).filter(
+    config = await db.scalar(select(RecurringConfig).where(
         RecurringConfig.id == config_id,
         RecurringConfig.user_id == current_user.id
-    ).first()
+    ))
 
     if not config:
         raise HTTPException(
@@ -188,32 +217,44 @@ async def delete_recurring_config(
             detail="Recurring configuration not found"
         )
 
-    db.delete(config)
-    db.commit()
+    await db.delete(config)
+    await db.commit()
 
 
 @router.post("/trigger", response_model=RecurringTriggerResponse)
 async def trigger_recurring_transactions(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Manually trigger processing of recurring transactions.
     Creates any pending transactions that are due.
     """
+    today = date.today()
+
     # Get all active configs with pending occurrences
-    configs = db.query(RecurringConfig).filter(
+    configs = (await db.scalars(select(RecurringConfig).where(
         RecurringConfig.user_id == current_user.id,
         RecurringConfig.is_active == True,
-        RecurringConfig.next_occurrence <= date.today()
-    ).all()
+        RecurringConfig.next_occurrence <= today
+    ))).all()
+
+    # Base transactions for all configs in one query
+    base_ids = {config.base_transaction_id for config in configs}
+    bases = {
+        transaction.id: transaction
+        for transaction in (await db.scalars(select(Transaction).where(
+            Transaction.id.in_(base_ids),
+            Transaction.deleted_at.is_(None)
+        ))).all()
+    } if base_ids else {}
 
     all_created_ids = []
     for config in configs:
-        created_ids = process_single_recurring(db, config)
+        created_ids = await process_single_recurring(db, config, bases.get(config.base_transaction_id), today)
         all_created_ids.extend(created_ids)
 
-    db.commit()
+    await db.commit()
 
     return RecurringTriggerResponse(
         processed_count=len(configs),
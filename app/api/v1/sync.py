@@ -1,12 +1,13 @@
 """Sync API endpoints for hybrid sync functionality"""
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, func, insert, select, update
 from typing import Dict, Any
 from uuid import UUID
-from app.database import get_db
-from app.core.dependencies import get_current_user
-from app.models.user import User
+from datetime import date, datetime
+from decimal import Decimal
+from app.database import get_async_db
+from app.core.dependencies import CurrentUser, get_current_user_minimal_async
 from app.models.sync_log import SyncLog
 from app.models.category import Category
 from app.models.wallet import Wallet
@@ -17,6 +18,9 @@ from app.models.recurring_config import RecurringConfig
 from app.models.associated_title import AssociatedTitle
 from app.models.payment_method import PaymentMethod
 from app.models.exchange_rate import ExchangeRate
+from app.api.v1.exchange_rates import invalidate_rate_cache
+from app.api.v1.objectives import invalidate_objective_cache
+from app.api.v1.payment_methods import invalidate_payment_method_cache
 from app.schemas.sync import (
     SyncPushRequest,
     SyncPushResponse,
@@ -26,8 +30,11 @@ from app.schemas.sync import (
     SyncConflict
 )
 from app.utils.time_utils import utc_now
+from app.utils.uuid_utils import uuid7
+import logging
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 # Mapping of table names to model classes
 TABLE_MODELS = {
@@ -42,6 +49,70 @@ TABLE_MODELS = {
     "exchange_rates": ExchangeRate,
 }
 
+
+def _parse_datetime(value):
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _parse_date(value):
+    return datetime.fromisoformat(value).date() if isinstance(value, str) else value
+
+
+def _parse_decimal(value):
+    return Decimal(str(value)) if isinstance(value, (str, int, float)) else value
+
+
+def _parse_uuid(value):
+    return UUID(value) if isinstance(value, str) else value
+
+
+def _keep(value):
+    return value
+
+
+# Pushed JSON carries dates, amounts and ids as strings; asyncpg only binds
+# the matching Python types
+_TYPE_PARSERS = {
+    datetime: _parse_datetime,
+    date: _parse_date,
+    Decimal: _parse_decimal,
+    UUID: _parse_uuid,
+}
+
+
+def _python_type(column):
+    try:
+        return column.type.python_type
+    except NotImplementedError:
+        return None
+
+
+# Per table: {column key: parser}
+COLUMN_PARSERS = {
+    table_name: {
+        column.key: _TYPE_PARSERS.get(_python_type(column), _keep)
+        for column in model.__table__.columns
+    }
+    for table_name, model in TABLE_MODELS.items()
+}
+
+# Per-user read caches to evict after a push to their table
+CACHE_INVALIDATORS = {
+    "objectives": invalidate_objective_cache,
+    "payment_methods": invalidate_payment_method_cache,
+    "exchange_rates": invalidate_rate_cache,
+}
+
+# Max rows per pull response; clients keep pulling while has_more is set
+PULL_BATCH_SIZE = 1000
+
+# Tables without soft delete: a deleted row leaves nothing for a delta pull
+# to return, so these are always pulled whole and clients drop local rows
+# missing from the response
+FULL_PULL_TABLES = {
+    table_name for table_name, model in TABLE_MODELS.items() if not hasattr(model, "deleted_at")
+}
+
 # Sync order (respecting foreign key constraints)
 SYNC_ORDER = [
     "categories",
@@ -56,12 +127,12 @@ SYNC_ORDER = [
 ]
 
 
-def get_or_create_sync_log(db: Session, user_id: UUID, table_name: str) -> SyncLog:
+async def get_or_create_sync_log(db: AsyncSession, user_id: UUID, table_name: str) -> SyncLog:
     """Get or create sync log for a user/table combination"""
-    sync_log = db.query(SyncLog).filter(
+    sync_log = await db.scalar(select(SyncLog).where(
         SyncLog.user_id == user_id,
         SyncLog.table_name == table_name
-    ).first()
+    ))
 
     if not sync_log:
         sync_log = SyncLog(
@@ -70,34 +141,34 @@ def get_or_create_sync_log(db: Session, user_id: UUID, table_name: str) -> SyncL
             last_server_version=0
         )
         db.add(sync_log)
-        db.commit()
-        db.refresh(sync_log)
+        await db.commit()
+        await db.refresh(sync_log)
 
     return sync_log
 
 
 @router.get("/status", response_model=SyncStatusResponse)
 async def get_sync_status(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get current sync status for all tables"""
     tables: Dict[str, Dict[str, Any]] = {}
 
     for table_name, model in TABLE_MODELS.items():
-        # Get count
-        count = db.query(func.count(model.id)).filter(
+        # Get count and the latest row version (same scale as the pull cursor)
+        count, version = (await db.execute(select(func.count(model.id), func.max(model.row_version)).where(
             model.user_id == current_user.id
-        ).scalar()
+        ))).one()
 
         # Get sync log
-        sync_log = db.query(SyncLog).filter(
+        sync_log = await db.scalar(select(SyncLog).where(
             SyncLog.user_id == current_user.id,
             SyncLog.table_name == table_name
-        ).first()
+        ))
 
         tables[table_name] = {
-            "version": sync_log.last_server_version if sync_log else 0,
+            "version": version or 0,
             "count": count,
             "last_sync": sync_log.last_sync_at.isoformat() if sync_log and sync_log.last_sync_at else None
         }
@@ -108,8 +179,8 @@ async def get_sync_status(
 @router.post("/push", response_model=SyncPushResponse)
 async def push_changes(
     push_data: SyncPushRequest,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Push local changes to server.
@@ -123,84 +194,116 @@ async def push_changes(
         )
 
     model = TABLE_MODELS[table_name]
-    sync_log = get_or_create_sync_log(db, current_user.id, table_name)
+    sync_log = await get_or_create_sync_log(db, current_user.id, table_name)
 
     accepted: list[UUID] = []
     conflicts: list[SyncConflict] = []
     id_mapping: Dict[str, str] = {}  # client_id -> server_id
 
+    # Changes are bucketed by action and written with one statement per bucket
+    parsers = COLUMN_PARSERS[table_name]
+    creates: list[dict] = []
+    updates = [change for change in push_data.changes if change.action == "update"]
+    deletes = [change for change in push_data.changes if change.action == "delete"]
+
     for change in push_data.changes:
+        if change.action != "create":
+            continue
+
+        server_id = uuid7()
+        record_data = {**change.data, "user_id": current_user.id, "id": server_id}
+
+        # Remove any client-specific fields (row_version is assigned by the database)
+        record_data.pop("sync_status", None)
+        record_data.pop("local_id", None)
+        record_data.pop("row_version", None)
+
         try:
-            if change.action == "create":
-                # Create new record
-                import uuid
-                server_id = uuid.uuid4()
-                record_data = {**change.data, "user_id": current_user.id, "id": server_id}
-
-                # Remove any client-specific fields
-                record_data.pop("sync_status", None)
-                record_data.pop("local_id", None)
-
-                new_record = model(**record_data)
-                db.add(new_record)
-                accepted.append(change.id)
-                id_mapping[str(change.id)] = str(server_id)
-
-            elif change.action == "update":
-                # Find existing record
-                record = db.query(model).filter(
-                    model.id == change.server_id,
-                    model.user_id == current_user.id
-                ).first()
-
-                if not record:
-                    # Record doesn't exist, treat as conflict
-                    conflicts.append(SyncConflict(
-                        client_id=change.id,
-                        server_id=change.server_id,
-                        client_data=change.data,
-                        server_data={},
-                        conflict_type="delete_conflict"
-                    ))
-                    continue
-
-                # Check for conflicts (last-write-wins by default)
-                # In a more sophisticated system, we'd compare timestamps
-                update_data = change.data
-                update_data.pop("id", None)
-                update_data.pop("user_id", None)
-                update_data.pop("sync_status", None)
-
-                for field, value in update_data.items():
-                    if hasattr(record, field):
-                        setattr(record, field, value)
-
-                accepted.append(change.id)
-
-            elif change.action == "delete":
-                # Soft delete if model supports it
-                record = db.query(model).filter(
-                    model.id == change.server_id,
-                    model.user_id == current_user.id
-                ).first()
-
-                if record:
-                    if hasattr(record, 'deleted_at'):
-                        record.deleted_at = utc_now()
-                    else:
-                        db.delete(record)
-                    accepted.append(change.id)
-
-        except Exception as e:
+            unknown = record_data.keys() - parsers.keys()
+            if unknown:
+                raise ValueError(f"unknown fields {sorted(unknown)}")
+            record_data = {field: parsers[field](value) for field, value in record_data.items()}
+        except (ValueError, ArithmeticError) as e:
             # Log error but continue processing other changes
-            print(f"Error processing change {change.id}: {e}")
+            logger.warning("[Sync] Skipping change %s: %s", change.id, e)
             continue
 
-    # Update sync log
-    sync_log.last_server_version += 1
+        creates.append(record_data)
+        accepted.append(change.id)
+        id_mapping[str(change.id)] = str(server_id)
+
+    if creates:
+        await db.execute(insert(model), creates)
+
+    if updates:
+        # Existing records for all updates in one query
+        existing_ids = set((await db.scalars(select(model.id).where(
+            model.id.in_({change.server_id for change in updates}),
+            model.user_id == current_user.id
+        ))).all())
+
+        # Last write wins; repeated updates of a record are merged in order
+        update_rows: Dict[UUID, dict] = {}
+        for change in updates:
+            if change.server_id not in existing_ids:
+                # Record doesn't exist, treat as conflict
+                conflicts.append(SyncConflict(
+                    client_id=change.id,
+                    server_id=change.server_id,
+                    client_data=change.data,
+                    server_data={},
+                    conflict_type="delete_conflict"
+                ))
+                continue
+
+            update_data = change.data
+            update_data.pop("id", None)
+            update_data.pop("user_id", None)
+            update_data.pop("sync_status", None)
+            update_data.pop("row_version", None)
+
+            try:
+                values = {
+                    field: parsers[field](value)
+                    for field, value in update_data.items() if field in parsers
+                }
+            except (ValueError, ArithmeticError) as e:
+                logger.warning("[Sync] Skipping change %s: %s", change.id, e)
+                continue
+
+            update_rows.setdefault(change.server_id, {"id": change.server_id}).update(values)
+            accepted.append(change.id)
+
+        # Bulk UPDATE by primary key (ownership was checked above)
+        update_params = [row for row in update_rows.values() if len(row) > 1]
+        if update_params:
+            await db.execute(update(model), update_params)
+
+    if deletes:
+        owned = (
+            model.id.in_({change.server_id for change in deletes}),
+            model.user_id == current_user.id
+        )
+        # Soft delete if model supports it
+        if hasattr(model, "deleted_at"):
+            stmt = update(model).where(*owned).values(deleted_at=utc_now())
+        else:
+            stmt = delete(model).where(*owned)
+        deleted_ids = set((await db.scalars(
+            stmt.returning(model.id).execution_options(synchronize_session=False)
+        )).all())
+        accepted.extend(change.id for change in deletes if change.server_id in deleted_ids)
+
+    # Update sync log; the version is the row_version this push's writes
+    # carry (they are pulled back with it)
+    sync_log.last_server_version = await db.scalar(select(func.sync_row_version()))
     sync_log.last_sync_at = utc_now()
 
-    db.commit()
+    await db.commit()
+
+    invalidate_cache = CACHE_INVALIDATORS.get(table_name)
+    if invalidate_cache:
+        invalidate_cache(current_user.id)
 
     return SyncPushResponse(
         server_version=sync_log.last_server_version,
@@ -213,12 +316,14 @@ async def push_changes(
 @router.post("/pull", response_model=SyncPullResponse)
 async def pull_changes(
     pull_data: SyncPullRequest,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Pull server changes since a given version.
-    Returns changed records and current server version.
+    Returns up to PULL_BATCH_SIZE changed records (more only when a single
+    write is bigger) and the version to pull from next. Tables in
+    FULL_PULL_TABLES return every record instead (full_snapshot).
     """
     table_name = pull_data.table
     if table_name not in TABLE_MODELS:
@@ -228,30 +333,54 @@ async def pull_changes(
         )
 
     model = TABLE_MODELS[table_name]
-    sync_log = get_or_create_sync_log(db, current_user.id, table_name)
-
-    # For simplicity, return all records if since_version is 0
-    # In a production system, you'd track changes with versions
-    query = db.query(model).filter(model.user_id == current_user.id)
-
-    # If there's a deleted_at column, include it but don't filter
-    records = query.all()
-
-    # Convert to dicts
-    changes = []
-    for record in records:
-        record_dict = {}
-        for column in model.__table__.columns:
-            value = getattr(record, column.name)
-            if hasattr(value, 'isoformat'):
-                value = value.isoformat()
-            elif isinstance(value, UUID):
-                value = str(value)
-            record_dict[column.name] = value
-        changes.append(record_dict)
+    columns = model.__table__.columns
+
+    # Versions below the horizon belong to finished transactions, so no row
+    # can still commit with one of them; rows at or above it wait for a
+    # later pull. Read first: the page query's snapshot sees all of them
+    horizon = await db.scalar(select(func.sync_row_version_horizon()))
+
+    if table_name in FULL_PULL_TABLES:
+        records = (await db.execute(select(*columns).where(
+            model.user_id == current_user.id
+        ).order_by(model.row_version))).all()
+
+        return SyncPullResponse(
+            changes=[record._asdict() for record in records],
+            server_version=max(pull_data.since_version, horizon - 1),
+            full_snapshot=True
+        )
+
+    # Rows written since the client's cursor, oldest first; soft deletes are
+    # writes too. One extra row tells whether another batch is waiting
+    records = (await db.execute(select(*columns).where(
+        model.user_id == current_user.id,
+        model.row_version > pull_data.since_version,
+        model.row_version < horizon
+    ).order_by(model.row_version).limit(PULL_BATCH_SIZE + 1))).all()
+
+    has_more = len(records) > PULL_BATCH_SIZE
+    if has_more:
+        # Rows written by one transaction share a version, and the cursor
+        # is a version: never end a batch partway through one
+        boundary = records[PULL_BATCH_SIZE].row_version
+        records = [record for record in records[:PULL_BATCH_SIZE] if record.row_version != boundary]
+        if not records:
+            records = (await db.execute(select(*columns).where(
+                model.user_id == current_user.id,
+                model.row_version == boundary
+            ))).all()
+        server_version = records[-1].row_version
+    else:
+        # Everything below the horizon has been returned
+        server_version = max(pull_data.since_version, horizon - 1)
+
+    # Dates, UUIDs and amounts are rendered by the response model's JSON
+    # serialization (then orjson), so rows go out as-is
+    changes = [record._asdict() for record in records]
 
     return SyncPullResponse(
         changes=changes,
-        server_version=sync_log.last_server_version,
-        has_more=False
+        server_version=server_version,
+        has_more=has_more
     )
@@ -1,14 +1,14 @@
 """Transaction CRUD endpoints"""
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, case, func, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 from typing import Optional
 from uuid import UUID
 from datetime import datetime
 from decimal import Decimal
-from app.database import get_db
-from app.core.dependencies import get_current_user
-from app.models.user import User
+from app.database import get_async_db
+from app.core.dependencies import CurrentUser, get_current_user_minimal_async
 from app.models.transaction import Transaction, TransactionType
 from app.models.wallet import Wallet
 from app.schemas.transaction import (
@@ -23,22 +23,18 @@ from app.utils.time_utils import utc_now
 router = APIRouter()
 
 
-def update_wallet_balance(db: Session, wallet_id: UUID, amount: Decimal, is_income: bool, reverse: bool = False):
-    """Update wallet balance after transaction"""
-    wallet = db.query(Wallet).filter(Wallet.id == wallet_id).first()
-    if wallet:
-        if reverse:
-            # Reverse the effect (for delete or update)
-            if is_income:
-                wallet.balance -= amount
-            else:
-                wallet.balance += amount
-        else:
-            # Apply the effect
-            if is_income:
-                wallet.balance += amount
-            else:
-                wallet.balance -= amount
+def signed_amount(amount: Decimal, is_income: bool) -> Decimal:
+    """Effect of a transaction on its wallet balance"""
+    return amount if is_income else -amount
+
+
+async def apply_balance_deltas(db: AsyncSession, deltas: dict[UUID, Decimal]):
+    """Add net balance changes to wallets in one UPDATE (call once per request)"""
+    deltas = {wallet_id: delta for wallet_id, delta in deltas.items() if delta}
+    if deltas:
+        await db.execute(update(Wallet).where(Wallet.id.in_(deltas)).values(
+            balance=Wallet.balance + case(deltas, value=Wallet.id)
+        ).execution_options(synchronize_session=False))
 
 
 @router.get("", response_model=TransactionListResponse)
@@ -55,60 +51,74 @@ async def list_transactions(
     search: Optional[str] = Query(None, description="Search in title and notes"),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """List transactions with filters"""
-    query = db.query(Transaction).filter(
+    # Page and total count in one round trip; rows are serialized
+    # column-only, so relationship access fails loudly
+    query = select(Transaction, func.count().over().label("total")).options(
+        raiseload("*")
+    ).where(
         Transaction.user_id == current_user.id,
         Transaction.deleted_at.is_(None)
     )
 
     # Apply filters
     if wallet_id:
-        query = query.filter(Transaction.wallet_id == wallet_id)
+        query = query.where(Transaction.wallet_id == wallet_id)
     if category_id:
-        query = query.filter(Transaction.category_id == category_id)
+        query = query.where(Transaction.category_id == category_id)
     if payment_method_id:
-        query = query.filter(Transaction.payment_method_id == payment_method_id)
+        query = query.where(Transaction.payment_method_id == payment_method_id)
     if is_income is not None:
-        query = query.filter(Transaction.is_income == is_income)
+        query = query.where(Transaction.is_income == is_income)
     if transaction_type:
-        query = query.filter(Transaction.type == transaction_type)
+        query = query.where(Transaction.type == transaction_type)
     if start_date:
-        query = query.filter(Transaction.date >= start_date)
+        query = query.where(Transaction.date >= start_date)
     if end_date:
-        query = query.filter(Transaction.date <= end_date)
+        query = query.where(Transaction.date <= end_date)
     if min_amount:
-        query = query.filter(Transaction.amount >= min_amount)
+        query = query.where(Transaction.amount >= min_amount)
     if max_amount:
-        query = query.filter(Transaction.amount <= max_amount)
+        query = query.where(Transaction.amount <= max_amount)
     if search:
+        # Served by the title/notes trigram indexes
         search_pattern = f"%{search}%"
-        query = query.filter(or_(
+        query = query.where(or_(
             Transaction.title.ilike(search_pattern),
             Transaction.notes.ilike(search_pattern)
         ))
 
-    total = query.count()
-    transactions = query.order_by(Transaction.date.desc(), Transaction.created_at.desc()).offset(skip).limit(limit).all()
+    query = query.order_by(Transaction.date.desc(), Transaction.created_at.desc())
+    rows = (await db.execute(query.offset(skip).limit(limit))).all()
+
+    if rows:
+        total = rows[0].total
+    elif skip:
+        # Page past the end; the window count has no row to ride on
+        first = (await db.execute(query.limit(1))).first()
+        total = first.total if first else 0
+    else:
+        total = 0
 
-    return TransactionListResponse(items=transactions, total=total)
+    return TransactionListResponse(items=[row.Transaction for row in rows], total=total)
 
 
 @router.post("", response_model=TransactionResponse, status_code=status.HTTP_201_CREATED)
 async def create_transaction(
     transaction_data: TransactionCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new transaction"""
     # Verify wallet belongs to user
-    wallet = db.query(Wallet).filter(
+    wallet = await db.scalar(select(Wallet).where(
         Wallet.id == transaction_data.wallet_id,
         Wallet.user_id == current_user.id,
         Wallet.deleted_at.is_(None)
-    ).first()
+    ))
 
     if not wallet:
         raise HTTPException(
@@ -116,71 +126,75 @@ async def create_transaction(
             detail="Wallet not found"
         )
 
-    transaction = Transaction(
+    # INSERT ... RETURNING brings back server defaults (no refresh after commit)
+    transaction = await db.scalar(insert(Transaction).values(
         user_id=current_user.id,
         **transaction_data.model_dump()
-    )
-    db.add(transaction)
+    ).returning(Transaction))
 
     # Update wallet balance
-    update_wallet_balance(db, transaction.wallet_id, transaction.amount, transaction.is_income)
+    await apply_balance_deltas(db, {transaction.wallet_id: signed_amount(transaction.amount, transaction.is_income)})
 
-    db.commit()
-    db.refresh(transaction)
+    await db.commit()
     return transaction
 
 
 @router.post("/bulk", response_model=list[TransactionResponse], status_code=status.HTTP_201_CREATED)
 async def bulk_create_transactions(
     bulk_data: TransactionBulkCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Bulk create transactions (for imports)"""
-    created_transactions = []
+    # Verify all wallets belong to user in one query
+    wallet_ids = {t.wallet_id for t in bulk_data.transactions}
+    valid_wallet_ids = set((await db.scalars(select(Wallet.id).where(
+        Wallet.user_id == current_user.id,
+        Wallet.id.in_(wallet_ids),
+        Wallet.deleted_at.is_(None)
+    ))).all()) if wallet_ids else set()
 
+    rows = []
+    balance_deltas: dict[UUID, Decimal] = {}
     for transaction_data in bulk_data.transactions:
-        # Verify wallet belongs to user
-        wallet = db.query(Wallet).filter(
-            Wallet.id == transaction_data.wallet_id,
-            Wallet.user_id == current_user.id,
-            Wallet.deleted_at.is_(None)
-        ).first()
-
-        if not wallet:
+        if transaction_data.wallet_id not in valid_wallet_ids:
             continue  # Skip invalid wallets
 
-        transaction = Transaction(
-            user_id=current_user.id,
-            **transaction_data.model_dump()
+        rows.append({"user_id": current_user.id, **transaction_data.model_dump()})
+
+        # Net wallet balance change
+        balance_deltas[transaction_data.wallet_id] = balance_deltas.get(transaction_data.wallet_id, 0) + signed_amount(
+            transaction_data.amount, transaction_data.is_income
         )
-        db.add(transaction)
-        created_transactions.append(transaction)
 
-        # Update wallet balance
-        update_wallet_balance(db, transaction.wallet_id, transaction.amount, transaction.is_income)
+    if not rows:
+        return []
 
-    db.commit()
+    # One multi-row INSERT ... RETURNING (no per-row flush or refresh)
+    created_transactions = (await db.scalars(
+        insert(Transaction).returning(Transaction, sort_by_parameter_order=True),
+        rows
+    )).all()
 
-    # Refresh all
-    for t in created_transactions:
-        db.refresh(t)
+    # Update wallet balances with one statement
+    await apply_balance_deltas(db, balance_deltas)
 
+    await db.commit()
     return created_transactions
 
 
 @router.get("/{transaction_id}", response_model=TransactionResponse)
 async def get_transaction(
     transaction_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get a specific transaction"""
-    transaction = db.query(Transaction).filter(
+    transaction = await db.scalar(select(Transaction).where(
         Transaction.id == transaction_id,
         Transaction.user_id == current_user.id,
         Transaction.deleted_at.is_(None)
-    ).first()
+    ))
 
     if not transaction:
         raise HTTPException(
@@ -195,15 +209,15 @@ async def get_transaction(
 async def update_transaction(
     transaction_id: UUID,
     transaction_data: TransactionUpdate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update a transaction"""
-    transaction = db.query(Transaction).filter(
+    transaction = await db.scalar(select(Transaction).where(
         Transaction.id == transaction_id,
         Transaction.user_id == current_user.id,
         Transaction.deleted_at.is_(None)
-    ).first()
+    ))
 
     if not transaction:
         raise HTTPException(
@@ -221,30 +235,30 @@ async def update_transaction(
     for field, value in update_data.items():
         setattr(transaction, field, value)
 
-    # Update wallet balances
-    # First, reverse old transaction effect
-    update_wallet_balance(db, old_wallet_id, old_amount, old_is_income, reverse=True)
-
-    # Then apply new transaction effect
-    update_wallet_balance(db, transaction.wallet_id, transaction.amount, transaction.is_income)
+    # Update wallet balances: reverse the old effect, apply the new one
+    balance_deltas = {old_wallet_id: -signed_amount(old_amount, old_is_income)}
+    balance_deltas[transaction.wallet_id] = balance_deltas.get(transaction.wallet_id, 0) + signed_amount(
+        transaction.amount, transaction.is_income
+    )
+    await apply_balance_deltas(db, balance_deltas)
 
-    db.commit()
-    db.refresh(transaction)
+    await db.commit()
+    await db.refresh(transaction)
     return transaction
 
 
 @router.delete("/{transaction_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_transaction(
     transaction_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Soft delete a transaction"""
-    transaction = db.query(Transaction).filter(
+    transaction = await db.scalar(select(Transaction).where(
         Transaction.id == transaction_id,
         Transaction.user_id == current_user.id,
         Transaction.deleted_at.is_(None)
-    ).first()
+    ))
 
     if not transaction:
         raise HTTPException(
@@ -253,8 +267,8 @@ async def delete_transaction(
         )
 
     # Reverse wallet balance effect
-    update_wallet_balance(db, transaction.wallet_id, transaction.amount, transaction.is_income, reverse=True)
+    await apply_balance_deltas(db, {transaction.wallet_id: -signed_amount(transaction.amount, transaction.is_income)})
 
     # Soft delete
     transaction.deleted_at = utc_now()
-    db.commit()
+    await db.commit()
@@ -1,10 +1,10 @@
 """Wallet CRUD endpoints"""
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
-from app.database import get_db
-from app.core.dependencies import get_current_user
-from app.models.user import User
+from app.database import get_async_db
+from app.core.dependencies import CurrentUser, get_current_user_minimal_async
 from app.models.wallet import Wallet
 from app.schemas.wallet import (
     WalletCreate,
@@ -21,63 +21,71 @@ router = APIRouter()
 async def list_wallets(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """List all wallets for the current user"""
-    query = db.query(Wallet).filter(
+    # Page and total count in one round trip
+    query = select(Wallet, func.count().over().label("total")).where(
         Wallet.user_id == current_user.id,
         Wallet.deleted_at.is_(None)
-    )
+    ).order_by(Wallet.order_index, Wallet.name)
 
-    total = query.count()
-    wallets = query.order_by(Wallet.order_index, Wallet.name).offset(skip).limit(limit).all()
+    rows = (await db.execute(query.offset(skip).limit(limit))).all()
 
-    return WalletListResponse(items=wallets, total=total)
+    if rows:
+        total = rows[0].total
+    elif skip:
+        # Page past the end; the window count has no row to ride on
+        first = (await db.execute(query.limit(1))).first()
+        total = first.total if first else 0
+    else:
+        total = 0
+
+    return WalletListResponse(items=[row.Wallet for row in rows], total=total)
 
 
 @router.post("", response_model=WalletResponse, status_code=status.HTTP_201_CREATED)
 async def create_wallet(
     wallet_data: WalletCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new wallet"""
     # If this is set as default, unset other defaults
     if wallet_data.is_default:
-        db.query(Wallet).filter(
+        await db.execute(update(Wallet).where(
             Wallet.user_id == current_user.id,
             Wallet.is_default == True
-        ).update({"is_default": False})
+        ).values(is_default=False))
 
-    wallet = Wallet(
+    # INSERT ... RETURNING brings back server defaults (no refresh after commit)
+    wallet = await db.scalar(insert(Wallet).values(
         user_id=current_user.id,
         **wallet_data.model_dump()
-    )
-    db.add(wallet)
-    db.commit()
-    db.refresh(wallet)
+    ).returning(Wallet))
+    await db.commit()
     return wallet
 
 
 @router.get("/default", response_model=WalletResponse)
 async def get_default_wallet(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get the default wallet"""
-    wallet = db.query(Wallet).filter(
+    wallet = await db.scalar(select(Wallet).where(
         Wallet.user_id == current_user.id,
         Wallet.is_default == True,
         Wallet.deleted_at.is_(None)
-    ).first()
+    ).limit(1))
 
     if not wallet:
         # Return first wallet if no default set
-        wallet = db.query(Wallet).filter(
+        wallet = await db.scalar(select(Wallet).where(
             Wallet.user_id == current_user.id,
             Wallet.deleted_at.is_(None)
-        ).order_by(Wallet.created_at).first()
+        ).order_by(Wallet.created_at).limit(1))
 
     if not wallet:
         raise HTTPException(
@@ -91,15 +99,15 @@ async def get_default_wallet(
 @router.get("/{wallet_id}", response_model=WalletResponse)
 async def get_wallet(
     wallet_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get a specific wallet"""
-    wallet = db.query(Wallet).filter(
+    wallet = await db.scalar(select(Wallet).where(
         Wallet.id == wallet_id,
         Wallet.user_id == current_user.id,
         Wallet.deleted_at.is_(None)
-    ).first()
+    ))
 
     if not wallet:
         raise HTTPException(
@@ -114,15 +122,15 @@ async def get_wallet(
 async def update_wallet(
     wallet_id: UUID,
     wallet_data: WalletUpdate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update a wallet"""
-    wallet = db.query(Wallet).filter(
+    wallet = await db.scalar(select(Wallet).where(
         Wallet.id == wallet_id,
         Wallet.user_id == current_user.id,
         Wallet.deleted_at.is_(None)
-    ).first()
+    ))
 
     if not wallet:
         raise HTTPException(
@@ -132,34 +140,34 @@ async def update_wallet(
 
     # If setting as default, unset others
     if wallet_data.is_default:
-        db.query(Wallet).filter(
+        await db.execute(update(Wallet).where(
             Wallet.user_id == current_user.id,
             Wallet.id != wallet_id,
             Wallet.is_default == True
-        ).update({"is_default": False})
+        ).values(is_default=False))
 
     # Update fields
     update_data = wallet_data.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(wallet, field, value)
 
-    db.commit()
-    db.refresh(wallet)
+    await db.commit()
+    await db.refresh(wallet)
     return wallet
 
 
 @router.delete("/{wallet_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_wallet(
     wallet_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user_minimal_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Soft delete a wallet"""
-    wallet = db.query(Wallet).filter(
+    wallet = await db.scalar(select(Wallet).where(
         Wallet.id == wallet_id,
         Wallet.user_id == current_user.id,
         Wallet.deleted_at.is_(None)
-    ).first()
+    ))
 
     if not wallet:
         raise HTTPException(
@@ -168,10 +176,10 @@ async def delete_wallet(
         )
 
     # Check if this is the only wallet
-    wallet_count = db.query(Wallet).filter(
+    wallet_count = await db.scalar(select(func.count(Wallet.id)).where(
         Wallet.user_id == current_user.id,
         Wallet.deleted_at.is_(None)
-    ).count()
+    ))
 
     if wallet_count <= 1:
         raise HTTPException(
@@ -181,4 +189,4 @@ async def delete_wallet(
 
     # Soft delete
     wallet.deleted_at = utc_now()
-    db.commit()
+    await db.commit()
@@ -1,6 +1,7 @@
 """
 Application Configuration
 """
+from functools import cached_property
 from pydantic_settings import BaseSettings
 from typing import List
 
@@ -17,7 +18,17 @@ class Settings(BaseSettings):
     DATABASE_PASSWORD: str
     DATABASE_SSL: bool = False
 
-    @property
+    # Connection pool (per engine)
+    DATABASE_POOL_SIZE: int = 10
+    DATABASE_MAX_OVERFLOW: int = 20
+    DATABASE_POOL_TIMEOUT: int = 10  # Seconds to wait for a free connection
+    DATABASE_POOL_RECYCLE: int = 1800  # Seconds before a connection is replaced
+    DATABASE_POOL_PRE_PING: bool = True  # Check connections on checkout
+    DATABASE_STATEMENT_CACHE_SIZE: int = 500  # asyncpg prepared statements per connection (0 behind PgBouncer)
+
+    # Derived values are computed on first access; settings are not mutated after load
+
+    @cached_property
     def DATABASE_URL(self) -> str:
         """Construct database URL from components"""
         return (
@@ -25,6 +36,11 @@ class Settings(BaseSettings):
             f"@{self.DATABASE_HOST}:{self.DATABASE_PORT}/{self.DATABASE_NAME}"
         )
 
+    @cached_property
+    def ASYNC_DATABASE_URL(self) -> str:
+        """Database URL for the asyncpg driver"""
+        return self.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
+
     # JWT
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: str = "HS256"
@@ -36,7 +52,7 @@ class Settings(BaseSettings):
     DEBUG: bool = True
     ALLOWED_ORIGINS: str = "*"
 
-    @property
+    @cached_property
     def CORS_ORIGINS(self) -> List[str]:
         """Parse CORS origins from string"""
         if self.ALLOWED_ORIGINS == "*":
@@ -1,10 +1,19 @@
 """Core utilities"""
-from app.core.security import verify_password, get_password_hash, create_access_token, decode_access_token
+from app.core.security import (
+    verify_password,
+    verify_password_async,
+    get_password_hash,
+    get_password_hash_async,
+    create_access_token,
+    decode_access_token
+)
 from app.core.dependencies import get_current_user, get_current_active_user
 
 __all__ = [
     "verify_password",
+    "verify_password_async",
     "get_password_hash",
+    "get_password_hash_async",
     "create_access_token",
     "decode_access_token",
     "get_current_user",
@@ -1,11 +1,15 @@
 """
 FastAPI dependencies for request handling
 """
+from dataclasses import dataclass
 from uuid import UUID as PyUUID
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
-from app.database import get_db
+from sqlalchemy import select
+from sqlalchemy.orm import Session, load_only, raiseload
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_db, get_async_db
 from app.core.security import decode_access_token
 from app.models.user import User
 import logging
@@ -14,20 +18,28 @@ security = HTTPBearer()
 logger = logging.getLogger(__name__)
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
-    """
-    Get current authenticated user from JWT token
+@dataclass(frozen=True, slots=True)
+class CurrentUser:
+    """Detached snapshot of the user columns that user-scoped endpoints read"""
+    id: PyUUID
+    email: str
+    is_active: bool
+    subscription_tier: str
+
+
+# Snapshots from get_current_user_minimal_async by user ID, so user-scoped
+# endpoints skip the users lookup. Changes to these columns must call
+# invalidate_user_cache; a deleted user is only noticed after the TTL.
+_user_cache: TTLCache = TTLCache(maxsize=10000, ttl=60)
 
-    Usage:
-        @router.get("/me")
-        async def get_me(current_user: User = Depends(get_current_user)):
-            return current_user
-    """
-    token = credentials.credentials
 
+def invalidate_user_cache(user_id: PyUUID) -> None:
+    """Drop the cached snapshot for a user (call after committing changes to it)"""
+    _user_cache.pop(user_id, None)
+
+
+def _get_user_id_from_token(token: str) -> PyUUID:
+    """Decode a bearer token and return the user ID it was issued for"""
     # Decode token
     payload = decode_access_token(token)
     if payload is None:
@@ -40,7 +52,6 @@ async def get_current_user(
 
     # Extract user ID from token
     user_id: str = payload.get("sub")
-    logger.info(f"[Auth] Extracted user_id from token: {user_id}")
     if user_id is None:
         logger.error("[Auth] No 'sub' claim in token payload")
         raise HTTPException(
@@ -49,32 +60,120 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Get user from database
-    logger.info(f"[Auth] Looking up user with ID: {user_id}")
+    # Runs on every authenticated request; skip the logging call entirely unless enabled
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[Auth] user_id=%s", user_id)
     try:
-        user_uuid = PyUUID(user_id)
+        return PyUUID(user_id)
     except (ValueError, TypeError) as e:
-        logger.error(f"[Auth] Invalid UUID format for user_id: {user_id}, error: {e}")
+        logger.error("[Auth] Invalid UUID format for user_id: %s, error: %s", user_id, e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid user ID format",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    user = db.query(User).filter(User.id == user_uuid).first()
+
+
+def _ensure_user_found(user: User | None, user_id: PyUUID) -> User:
+    """Raise 401 if the token's user no longer exists"""
     if user is None:
-        logger.error(f"[Auth] User not found in database for ID: {user_id}")
+        logger.error("[Auth] User not found in database for ID: %s", user_id)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    logger.info(f"[Auth] User found: {user.email}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[Auth] User found: %s", user.email)
     return user
 
 
+async def get_current_user_id(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> PyUUID:
+    """
+    Get the authenticated user's ID from the JWT token without a database lookup
+
+    Only for endpoints that can serve a response without loading the user.
+    """
+    return _get_user_id_from_token(credentials.credentials)
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db)
+) -> User:
+    """
+    Get current authenticated user from JWT token
+
+    Usage:
+        @router.get("/me")
+        async def get_me(current_user: User = Depends(get_current_user)):
+            return current_user
+    """
+    user_uuid = _get_user_id_from_token(credentials.credentials)
+
+    # Get user from database; no response reads the user's relationships,
+    # so any lazy load from here on is a bug
+    user = db.query(User).options(raiseload("*")).filter(User.id == user_uuid).first()
+    return _ensure_user_found(user, user_uuid)
+
+
+async def get_current_user_async(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_async_db)
+) -> User:
+    """
+    Get current authenticated user from JWT token (async session)
+
+    Use together with get_async_db so the user is attached to the same
+    session as the endpoint.
+    """
+    user_uuid = _get_user_id_from_token(credentials.credentials)
+
+    # Get user from database (relationships are never read, see get_current_user)
+    user = await db.get(User, user_uuid, options=[raiseload("*")])
+    return _ensure_user_found(user, user_uuid)
+
+
+async def get_current_user_minimal_async(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_async_db)
+) -> CurrentUser:
+    """
+    Get current authenticated user as a snapshot of the commonly used columns
+
+    For endpoints that just scope queries by user; the snapshot is cached for up
+    to a minute. Use get_current_user_async when the full row is needed.
+    """
+    user_uuid = _get_user_id_from_token(credentials.credentials)
+
+    cached = _user_cache.get(user_uuid)
+    if cached is not None:
+        return cached
+
+    user = await db.scalar(select(User).where(User.id == user_uuid).options(load_only(
+        User.id,
+        User.email,
+        User.is_active,
+        User.subscription_tier,
+        raiseload=True
+    ), raiseload("*")))
+    user = _ensure_user_found(user, user_uuid)
+
+    snapshot = CurrentUser(
+        id=user.id,
+        email=user.email,
+        is_active=user.is_active,
+        subscription_tier=user.subscription_tier
+    )
+    _user_cache[user_uuid] = snapshot
+    return snapshot
+
+
 async def get_current_active_user(
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user_async)
 ) -> User:
     """
     Get current active user (not disabled/deleted)
@@ -93,7 +192,7 @@ optional_security = HTTPBearer(auto_error=False)
 
 async def get_optional_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(optional_security),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> User | None:
     """
     Get current authenticated user if token provided, otherwise return None.
@@ -120,5 +219,5 @@ async def get_optional_current_user(
     except (ValueError, TypeError):
         return None
 
-    user = db.query(User).filter(User.id == user_uuid).first()
+    user = await db.get(User, user_uuid)
     return user
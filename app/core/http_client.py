@@ -0,0 +1,47 @@
+"""
+Shared outbound HTTP client
+"""
+from typing import Optional
+import httpx
+
+# One client per process so calls to the stores reuse pooled keep-alive
+# connections instead of paying a TCP/TLS handshake each time
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _new_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        timeout=httpx.Timeout(5.0)
+    )
+
+
+async def open_http_client():
+    """Create the shared client (called on startup)"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _new_client()
+
+
+async def get_http_client() -> httpx.AsyncClient:
+    """
+    Dependency for getting the shared HTTP client
+
+    Async so it runs on the event loop rather than the threadpool; the
+    fallback only covers apps served without the startup hook (e.g. tests).
+
+    Usage in FastAPI endpoints:
+        async def my_endpoint(http: httpx.AsyncClient = Depends(get_http_client)):
+            ...
+    """
+    if _client is None or _client.is_closed:
+        await open_http_client()
+    return _client
+
+
+async def close_http_client():
+    """Close the shared client's pooled connections (called on shutdown)"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
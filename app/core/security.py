@@ -1,8 +1,16 @@
 """
 Security utilities for authentication and encryption
 """
+import asyncio
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
+from functools import lru_cache
 from typing import Optional
+from cachetools import TTLCache
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from app.config import settings
@@ -11,6 +19,19 @@ from app.utils.time_utils import utc_now
 # Password hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt is CPU-bound; run it on a dedicated pool so it neither blocks the
+# event loop nor starves the default executor used for sync endpoints
+_password_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix="bcrypt"
+)
+
+# Verified token payloads, keyed by token digest. Clients send the same
+# token on every request, so signature checks are skipped for a short while.
+_TOKEN_CACHE_TTL_SECONDS = 30
+_token_cache: TTLCache = TTLCache(maxsize=10000, ttl=_TOKEN_CACHE_TTL_SECONDS)
+_token_cache_lock = threading.Lock()
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against a hash"""
@@ -22,6 +43,38 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+@lru_cache(maxsize=1)
+def _dummy_password_hash() -> str:
+    """Hash checked when there is no real one, so misses cost as much as hits"""
+    return pwd_context.hash("dummy-password-for-timing")
+
+
+def _verify_password_or_dummy(plain_password: str, hashed_password: Optional[str]) -> bool:
+    if not hashed_password:
+        verify_password(plain_password, _dummy_password_hash())
+        return False
+    return verify_password(plain_password, hashed_password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: Optional[str]) -> bool:
+    """
+    Verify a password off the event loop
+
+    A missing hash (unknown user, Firebase-only account) still runs a full
+    bcrypt check, so response time does not reveal whether the account exists.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _password_executor, _verify_password_or_dummy, plain_password, hashed_password
+    )
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password off the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, get_password_hash, password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
     Create a JWT access token
@@ -56,18 +109,35 @@ def decode_access_token(token: str) -> Optional[dict]:
     """
     Decode a JWT access token
 
+    Successfully verified payloads are cached for a few seconds; the
+    token's own expiry is still enforced on every call.
+
     Args:
         token: JWT token string
 
     Returns:
         Decoded token payload or None if invalid
     """
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    with _token_cache_lock:
+        payload = _token_cache.get(key)
+    if payload is not None:
+        if payload.get("exp", 0) > time.time():
+            return payload
+        with _token_cache_lock:
+            _token_cache.pop(key, None)
+        return None
+
     try:
         payload = jwt.decode(
             token,
             settings.JWT_SECRET_KEY,
             algorithms=[settings.JWT_ALGORITHM]
         )
-        return payload
     except JWTError:
         return None
+
+    with _token_cache_lock:
+        _token_cache[key] = payload
+    return payload
@@ -1,7 +1,9 @@
 """
 Database connection and session management
 """
-from sqlalchemy import create_engine
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import DDL, Table, create_engine, event, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.config import settings
@@ -9,18 +11,137 @@ from app.config import settings
 # Create database engine
 engine = create_engine(
     settings.DATABASE_URL,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
+    pool_size=settings.DATABASE_POOL_SIZE,
+    max_overflow=settings.DATABASE_MAX_OVERFLOW,
+    pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+    pool_recycle=settings.DATABASE_POOL_RECYCLE,
     echo=settings.DEBUG
 )
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine (asyncpg) for endpoints that must not block the event loop
+async_engine = create_async_engine(
+    settings.ASYNC_DATABASE_URL,
+    pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
+    pool_size=settings.DATABASE_POOL_SIZE,
+    max_overflow=settings.DATABASE_MAX_OVERFLOW,
+    pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+    pool_recycle=settings.DATABASE_POOL_RECYCLE,
+    echo=settings.DEBUG,
+    # Per-connection cache of server-side prepared statements, so hot
+    # queries such as /suggest skip parse/plan after their first run
+    connect_args={"prepared_statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE}
+)
+
+_PG_EPOCH = datetime(2000, 1, 1)
+
+
+def _encode_timestamp(value: datetime) -> tuple:
+    """Store aware datetimes (utc_now()) as naive UTC, like psycopg2 does"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return ((value - _PG_EPOCH) // timedelta(microseconds=1),)
+
+
+def _decode_timestamp(value: tuple) -> datetime:
+    return _PG_EPOCH + timedelta(microseconds=value[0])
+
+
+@event.listens_for(async_engine.sync_engine, "connect")
+def _register_timestamp_codec(dbapi_connection, connection_record):
+    # asyncpg refuses aware datetimes for TIMESTAMP WITHOUT TIME ZONE columns
+    dbapi_connection.run_async(
+        lambda conn: conn.set_type_codec(
+            "timestamp",
+            schema="pg_catalog",
+            encoder=_encode_timestamp,
+            decoder=_decode_timestamp,
+            format="tuple",
+        )
+    )
+
+
+# Objects stay usable after commit without being reloaded
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
 # Base class for models
 Base = declarative_base()
 
+# associated_titles.title is CITEXT (migration 009)
+event.listen(Base.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS citext"))
+
+# Trigram indexes for transaction search (migration 018)
+event.listen(Base.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
+# updated_at is maintained by Postgres (migration 012); create_all sets up
+# the same function and per-table triggers for fresh databases
+SET_UPDATED_AT_FUNCTION = DDL("""
+CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at = now() AT TIME ZONE 'utc';
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql
+""")
+event.listen(Base.metadata, "before_create", SET_UPDATED_AT_FUNCTION)
+
+# Tables with the updated_at trigger; migration 012 installs it on the same
+# list, so fresh and migrated schemas match (users is not one of them)
+UPDATED_AT_TRIGGER_TABLES = (
+    'categories',
+    'wallets',
+    'payment_methods',
+    'transactions',
+    'recurring_configs',
+    'budgets',
+    'objectives',
+    'associated_titles',
+    'sync_logs',
+    'exchange_rates',
+)
+
+# row_version on synced tables is the writing transaction's ID, set by a
+# trigger on insert and update; pulls stop below the oldest running
+# transaction (migration 017, which also offsets both by old sync versions)
+SYNC_ROW_VERSION_FUNCTIONS = DDL("""
+CREATE OR REPLACE FUNCTION sync_row_version() RETURNS bigint AS
+'SELECT pg_current_xact_id()::text::bigint' LANGUAGE sql VOLATILE;
+CREATE OR REPLACE FUNCTION sync_row_version_horizon() RETURNS bigint AS
+'SELECT pg_snapshot_xmin(pg_current_snapshot())::text::bigint' LANGUAGE sql STABLE;
+""")
+event.listen(Base.metadata, "before_create", SYNC_ROW_VERSION_FUNCTIONS)
+SET_ROW_VERSION_FUNCTION = DDL("""
+CREATE OR REPLACE FUNCTION set_row_version() RETURNS trigger AS $$
+BEGIN
+    NEW.row_version = sync_row_version();
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql
+""")
+event.listen(Base.metadata, "before_create", SET_ROW_VERSION_FUNCTION)
+
+
+@event.listens_for(Table, "after_create")
+def _create_updated_at_trigger(table, connection, **kw):
+    if table.metadata is Base.metadata and table.name in UPDATED_AT_TRIGGER_TABLES:
+        connection.execute(text(
+            f"CREATE TRIGGER trg_{table.name}_updated_at BEFORE UPDATE ON {table.name} "
+            f"FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+        ))
+    if table.metadata is Base.metadata and "row_version" in table.c:
+        connection.execute(text(
+            f"CREATE TRIGGER trg_{table.name}_row_version BEFORE INSERT OR UPDATE ON {table.name} "
+            f"FOR EACH ROW EXECUTE FUNCTION set_row_version()"
+        ))
+
 
 def get_db():
     """
@@ -37,6 +158,18 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    """
+    Dependency for getting an async database session
+
+    Usage in FastAPI endpoints:
+        async def my_endpoint(db: AsyncSession = Depends(get_async_db)):
+            ...
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 def init_db():
     """Initialize database tables"""
     Base.metadata.create_all(bind=engine)
@@ -1,23 +1,32 @@
 """
 The Accountant Backend API - Main Application
 """
+import atexit
 import logging
 import os
+import queue
 import sys
 import traceback
 import uuid
+from logging.handlers import QueueHandler, QueueListener
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 from app.config import settings
 from app.api.v1 import api_router
-from app.database import init_db
-
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+from app.database import init_db, engine, async_engine
+from app.core.http_client import open_http_client, close_http_client
+
+# Configure logging; records are written to stderr by a background thread
+# so request handlers never block on log I/O
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(_log_queue)])
+_log_listener = QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
 # Create FastAPI application
@@ -28,7 +37,8 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url=f"{settings.API_V1_PREFIX}/openapi.json",
-    redirect_slashes=False
+    redirect_slashes=False,
+    default_response_class=ORJSONResponse
 )
 
 # Initialize rate limiter
@@ -139,6 +149,9 @@ async def startup_event():
         print(f"[ERROR] Database initialization failed: {e}")
         sys.exit(1)
 
+    # Pooled client for outbound calls (store purchase verification)
+    await open_http_client()
+
     print("=" * 70)
     print(f"[API] Running at: http://{settings.HOST}:{settings.PORT}")
     print(f"[DOCS] API Docs: http://{settings.HOST}:{settings.PORT}/docs")
@@ -150,6 +163,7 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup on shutdown"""
     print("[SHUTDOWN] Shutting down The Accountant API...")
+    await close_http_client()
 
 
 # Health check endpoint
@@ -163,6 +177,16 @@ async def health_check():
     }
 
 
+if settings.DEBUG:
+    @app.get("/health/db-pool")
+    async def db_pool_status():
+        """Connection pool usage, for capacity planning (debug only)"""
+        return {
+            "sync": engine.pool.status(),
+            "async": async_engine.pool.status()
+        }
+
+
 # Include API routes
 app.include_router(api_router, prefix=settings.API_V1_PREFIX)
 
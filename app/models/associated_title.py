@@ -1,23 +1,24 @@
 """Associated title model for smart categorization"""
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, Boolean, DateTime, ForeignKey, Index, UniqueConstraint, CheckConstraint, text, FetchedValue, BigInteger
+from sqlalchemy.dialects.postgresql import UUID, CITEXT
 from sqlalchemy.orm import relationship
-import uuid
 from app.database import Base
 from app.utils.time_utils import utc_now
+from app.utils.uuid_utils import uuid7
 
 
 class AssociatedTitle(Base):
     """Mapping of transaction titles to categories for smart auto-categorization"""
 
     __tablename__ = "associated_titles"
+    __mapper_args__ = {"eager_defaults": True}
 
     # Identity
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
 
     # Mapping details
-    title = Column(String(200), nullable=False, index=True)  # The merchant/payee name pattern
+    title = Column(CITEXT, nullable=False)  # The merchant/payee name pattern (case-insensitive)
     category_id = Column(UUID(as_uuid=True), ForeignKey("categories.id", ondelete="CASCADE"), nullable=False, index=True)
 
     # Matching behavior
@@ -25,12 +26,36 @@ class AssociatedTitle(Base):
 
     # Timestamps
     created_at = Column(DateTime, default=utc_now, nullable=False)
-    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now, nullable=False)
+    updated_at = Column(DateTime, default=utc_now, server_onupdate=FetchedValue(), nullable=False)  # Set by trigger
+    row_version = Column(BigInteger, server_default=FetchedValue(), server_onupdate=FetchedValue(), nullable=False)  # Writer's transaction version, set by trigger (sync pull)
 
     # Relationships
     user = relationship("User", backref="associated_titles")
     category = relationship("Category", backref="associated_titles")
 
+    __table_args__ = (
+        # One mapping per title per user (upsert conflict target)
+        UniqueConstraint('user_id', 'title', name='uq_associated_titles_user_title'),
+        CheckConstraint('char_length(title) <= 200', name='ck_associated_titles_title_length'),
+        # /suggest lookups, one partial index per match type
+        Index(
+            'ix_assoc_titles_exact',
+            'user_id', 'title',
+            postgresql_include=['category_id'],
+            postgresql_where=text('is_exact_match = true')
+        ),
+        Index(
+            'ix_assoc_titles_contains',
+            'user_id',
+            postgresql_include=['title', 'category_id'],
+            postgresql_where=text('is_exact_match = false')
+        ),
+        # Keyset pagination for the title list
+        Index('ix_assoc_titles_user_title_id', 'user_id', 'title', 'id'),
+        # Incremental sync pull: rows changed since a version
+        Index('ix_associated_titles_user_row_version', 'user_id', 'row_version'),
+    )
+
     def matches(self, transaction_title: str) -> bool:
         """Check if this association matches the given transaction title"""
         normalized_title = transaction_title.lower().strip()
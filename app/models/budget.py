@@ -1,11 +1,11 @@
 """Budget model for tracking spending limits"""
-from sqlalchemy import Column, String, Boolean, DateTime, Numeric, Date, ForeignKey, Enum
-from sqlalchemy.dialects.postgresql import UUID, JSON
+from sqlalchemy import Column, String, Boolean, DateTime, Numeric, Date, ForeignKey, Enum, Index, FetchedValue, BigInteger
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
-import uuid
 import enum
 from app.database import Base
 from app.utils.time_utils import utc_now
+from app.utils.uuid_utils import uuid7
 
 
 class BudgetPeriod(str, enum.Enum):
@@ -20,9 +20,10 @@ class Budget(Base):
     """Budget for tracking spending limits by category/wallet"""
 
     __tablename__ = "budgets"
+    __mapper_args__ = {"eager_defaults": True}
 
     # Identity
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
 
     # Budget details
@@ -31,7 +32,7 @@ class Budget(Base):
 
     # Period settings
     period = Column(
-        Enum(BudgetPeriod),
+        Enum(BudgetPeriod, native_enum=False, length=20),
         default=BudgetPeriod.MONTHLY,
         nullable=False
     )
@@ -39,8 +40,8 @@ class Budget(Base):
     end_date = Column(Date, nullable=True)  # Required for custom period
 
     # Filters - which wallets and categories to include
-    wallet_ids = Column(JSON, nullable=True)  # Array of wallet UUIDs, null = all wallets
-    category_ids = Column(JSON, nullable=True)  # Array of category UUIDs, null = all categories
+    wallet_ids = Column(JSONB, nullable=True)  # Array of wallet UUIDs, null = all wallets
+    category_ids = Column(JSONB, nullable=True)  # Array of category UUIDs, null = all categories
 
     # Budget type - track income or expenses
     is_income = Column(Boolean, default=False, nullable=False)
@@ -51,12 +52,21 @@ class Budget(Base):
 
     # Timestamps
     created_at = Column(DateTime, default=utc_now, nullable=False)
-    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now, nullable=False)
+    updated_at = Column(DateTime, default=utc_now, server_onupdate=FetchedValue(), nullable=False)  # Set by trigger
+    row_version = Column(BigInteger, server_default=FetchedValue(), server_onupdate=FetchedValue(), nullable=False)  # Writer's transaction version, set by trigger (sync pull)
     deleted_at = Column(DateTime, nullable=True)  # Soft delete
 
     # Relationships
     user = relationship("User", backref="budgets")
 
+    __table_args__ = (
+        # Containment lookups, e.g. budgets covering a wallet: wallet_ids @> '["<uuid>"]'
+        Index('ix_budgets_wallet_ids_gin', 'wallet_ids', postgresql_using='gin', postgresql_ops={'wallet_ids': 'jsonb_path_ops'}),
+        Index('ix_budgets_category_ids_gin', 'category_ids', postgresql_using='gin', postgresql_ops={'category_ids': 'jsonb_path_ops'}),
+        # Incremental sync pull: rows changed since a version
+        Index('ix_budgets_user_row_version', 'user_id', 'row_version'),
+    )
+
     @property
     def is_deleted(self) -> bool:
         """Check if budget is soft deleted"""
@@ -1,19 +1,20 @@
 """Category model with subcategory support"""
-from sqlalchemy import Column, String, Boolean, DateTime, Integer, ForeignKey
+from sqlalchemy import Column, String, Boolean, DateTime, Integer, ForeignKey, FetchedValue, Index, text, BigInteger
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
-import uuid
+from sqlalchemy.orm import relationship, backref
 from app.database import Base
 from app.utils.time_utils import utc_now
+from app.utils.uuid_utils import uuid7
 
 
 class Category(Base):
     """Category for organizing transactions (supports subcategories)"""
 
     __tablename__ = "categories"
+    __mapper_args__ = {"eager_defaults": True}
 
     # Identity
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
 
     # Category details
@@ -32,12 +33,28 @@ class Category(Base):
 
     # Timestamps
     created_at = Column(DateTime, default=utc_now, nullable=False)
-    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now, nullable=False)
+    updated_at = Column(DateTime, default=utc_now, server_onupdate=FetchedValue(), nullable=False)  # Set by trigger
+    row_version = Column(BigInteger, server_default=FetchedValue(), server_onupdate=FetchedValue(), nullable=False)  # Writer's transaction version, set by trigger (sync pull)
     deleted_at = Column(DateTime, nullable=True)  # Soft delete
 
     # Relationships
     user = relationship("User", backref="categories")
-    parent_category = relationship("Category", remote_side=[id], backref="subcategories")
+    parent_category = relationship(
+        "Category",
+        remote_side=[id],
+        backref=backref("subcategories", order_by=lambda: (Category.order_index, Category.name))
+    )
+
+    __table_args__ = (
+        # Keyset pagination for GET /categories: (order_index, name, id) cursor
+        Index(
+            'ix_categories_user_keyset',
+            'user_id', 'order_index', 'name', 'id',
+            postgresql_where=text('deleted_at IS NULL')
+        ),
+        # Incremental sync pull: rows changed since a version
+        Index('ix_categories_user_row_version', 'user_id', 'row_version'),
+    )
 
     @property
     def is_subcategory(self) -> bool:
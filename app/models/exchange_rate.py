@@ -1,19 +1,20 @@
 """Exchange rate model for storing user's currency conversion rates"""
-from sqlalchemy import Column, String, Numeric, Boolean, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, String, Numeric, Boolean, DateTime, ForeignKey, UniqueConstraint, FetchedValue, BigInteger, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-import uuid
 from app.database import Base
 from app.utils.time_utils import utc_now
+from app.utils.uuid_utils import uuid7
 
 
 class ExchangeRate(Base):
     """Exchange rate model for per-user currency conversion rates"""
 
     __tablename__ = "exchange_rates"
+    __mapper_args__ = {"eager_defaults": True}
 
     # Identity
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
 
     # Currency pair (ISO 4217 codes)
@@ -30,7 +31,8 @@ class ExchangeRate(Base):
 
     # Timestamps
     created_at = Column(DateTime, default=utc_now, nullable=False)
-    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now, nullable=False)
+    updated_at = Column(DateTime, default=utc_now, server_onupdate=FetchedValue(), nullable=False)  # Set by trigger
+    row_version = Column(BigInteger, server_default=FetchedValue(), server_onupdate=FetchedValue(), nullable=False)  # Writer's transaction version, set by trigger (sync pull)
 
     # Sync tracking
     version = Column(Numeric, default=1, nullable=False)
@@ -41,6 +43,8 @@ class ExchangeRate(Base):
     # Unique constraint: one rate per currency pair per user
     __table_args__ = (
         UniqueConstraint('user_id', 'from_currency', 'to_currency', name='uq_exchange_rates_user_currency_pair'),
+        # Incremental sync pull: rows changed since a version
+        Index('ix_exchange_rates_user_row_version', 'user_id', 'row_version'),
     )
 
     def __repr__(self):
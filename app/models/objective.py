@@ -1,11 +1,11 @@
 """Objective model for goals and savings tracking"""
-from sqlalchemy import Column, String, Boolean, DateTime, Numeric, Date, ForeignKey, Enum, Table
+from sqlalchemy import Column, String, Boolean, DateTime, Numeric, Date, ForeignKey, Enum, Table, FetchedValue, Index, UniqueConstraint, desc, text, BigInteger
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-import uuid
 import enum
 from app.database import Base
 from app.utils.time_utils import utc_now
+from app.utils.uuid_utils import uuid7
 
 
 class ObjectiveType(str, enum.Enum):
@@ -18,10 +18,13 @@ class ObjectiveType(str, enum.Enum):
 objective_transactions = Table(
     "objective_transactions",
     Base.metadata,
-    Column("id", UUID(as_uuid=True), primary_key=True, default=uuid.uuid4),
-    Column("objective_id", UUID(as_uuid=True), ForeignKey("objectives.id", ondelete="CASCADE"), nullable=False, index=True),
+    Column("id", UUID(as_uuid=True), primary_key=True, default=uuid7),
+    Column("objective_id", UUID(as_uuid=True), ForeignKey("objectives.id", ondelete="CASCADE"), nullable=False),
     Column("transaction_id", UUID(as_uuid=True), ForeignKey("transactions.id", ondelete="CASCADE"), nullable=False, index=True),
     Column("created_at", DateTime, default=utc_now, nullable=False),
+    # A transaction is linked to an objective at most once (link conflict target;
+    # also serves objective_id lookups)
+    UniqueConstraint("objective_id", "transaction_id", name="uq_objective_transactions_objective_transaction"),
 )
 
 
@@ -29,13 +32,14 @@ class Objective(Base):
     """Objective/Goal for savings tracking or debt payoff"""
 
     __tablename__ = "objectives"
+    __mapper_args__ = {"eager_defaults": True}
 
     # Identity
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
 
     # Optional link to a specific wallet
-    wallet_id = Column(UUID(as_uuid=True), ForeignKey("wallets.id", ondelete="SET NULL"), nullable=True)
+    wallet_id = Column(UUID(as_uuid=True), ForeignKey("wallets.id", ondelete="SET NULL"), nullable=True, index=True)
 
     # Objective details
     name = Column(String(100), nullable=False)
@@ -45,7 +49,7 @@ class Objective(Base):
 
     # Type - are we saving up or paying off?
     type = Column(
-        Enum(ObjectiveType),
+        Enum(ObjectiveType, native_enum=False, length=20),
         default=ObjectiveType.GOAL,
         nullable=False
     )
@@ -60,7 +64,8 @@ class Objective(Base):
 
     # Timestamps
     created_at = Column(DateTime, default=utc_now, nullable=False)
-    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now, nullable=False)
+    updated_at = Column(DateTime, default=utc_now, server_onupdate=FetchedValue(), nullable=False)  # Set by trigger
+    row_version = Column(BigInteger, server_default=FetchedValue(), server_onupdate=FetchedValue(), nullable=False)  # Writer's transaction version, set by trigger (sync pull)
     deleted_at = Column(DateTime, nullable=True)  # Soft delete
 
     # Relationships
@@ -72,6 +77,17 @@ class Objective(Base):
         backref="objectives"
     )
 
+    __table_args__ = (
+        # Live objectives per user in list order (is_pinned DESC, name)
+        Index(
+            'ix_objectives_user_list',
+            'user_id', desc('is_pinned'), 'name',
+            postgresql_where=text('deleted_at IS NULL')
+        ),
+        # Incremental sync pull: rows changed since a version
+        Index('ix_objectives_user_row_version', 'user_id', 'row_version'),
+    )
+
     @property
     def is_deleted(self) -> bool:
         """Check if objective is soft deleted"""
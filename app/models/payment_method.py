@@ -1,19 +1,20 @@
 """Payment method model"""
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, FetchedValue, Index, text, BigInteger
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-import uuid
 from app.database import Base
 from app.utils.time_utils import utc_now
+from app.utils.uuid_utils import uuid7
 
 
 class PaymentMethod(Base):
     """Payment method for transactions (cash, credit card, debit card, etc.)"""
 
     __tablename__ = "payment_methods"
+    __mapper_args__ = {"eager_defaults": True}
 
     # Identity
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
 
     # Payment method details
@@ -25,12 +26,24 @@ class PaymentMethod(Base):
 
     # Timestamps
     created_at = Column(DateTime, default=utc_now, nullable=False)
-    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now, nullable=False)
+    updated_at = Column(DateTime, default=utc_now, server_onupdate=FetchedValue(), nullable=False)  # Set by trigger
+    row_version = Column(BigInteger, server_default=FetchedValue(), server_onupdate=FetchedValue(), nullable=False)  # Writer's transaction version, set by trigger (sync pull)
     deleted_at = Column(DateTime, nullable=True)  # Soft delete
 
     # Relationships
     user = relationship("User", backref="payment_methods")
 
+    __table_args__ = (
+        # Live payment methods per user in list order
+        Index(
+            'ix_payment_methods_user_name',
+            'user_id', 'name',
+            postgresql_where=text('deleted_at IS NULL')
+        ),
+        # Incremental sync pull: rows changed since a version
+        Index('ix_payment_methods_user_row_version', 'user_id', 'row_version'),
+    )
+
     @property
     def is_deleted(self) -> bool:
         """Check if payment method is soft deleted"""
@@ -1,13 +1,13 @@
 """Recurring transaction configuration model"""
-from sqlalchemy import Column, String, Boolean, DateTime, Integer, Date, ForeignKey, Enum
+from sqlalchemy import Column, String, Boolean, DateTime, Integer, Date, ForeignKey, Enum, FetchedValue, Index, text, BigInteger
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-import uuid
 import enum
 from datetime import date, timedelta
 from dateutil.relativedelta import relativedelta
 from app.database import Base
 from app.utils.time_utils import utc_now
+from app.utils.uuid_utils import uuid7
 
 
 class RecurrenceType(str, enum.Enum):
@@ -22,18 +22,19 @@ class RecurringConfig(Base):
     """Configuration for recurring/scheduled transactions"""
 
     __tablename__ = "recurring_configs"
+    __mapper_args__ = {"eager_defaults": True}
 
     # Identity
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
 
     # Reference to template transaction
-    base_transaction_id = Column(UUID(as_uuid=True), ForeignKey("transactions.id", ondelete="CASCADE"), nullable=False)
+    base_transaction_id = Column(UUID(as_uuid=True), ForeignKey("transactions.id", ondelete="CASCADE"), nullable=False, index=True)
 
     # Recurrence settings
     period_length = Column(Integer, default=1, nullable=False)  # e.g., every 2 weeks
     reoccurrence = Column(
-        Enum(RecurrenceType),
+        Enum(RecurrenceType, native_enum=False, length=20),
         default=RecurrenceType.MONTHLY,
         nullable=False
     )
@@ -48,7 +49,8 @@ class RecurringConfig(Base):
 
     # Timestamps
     created_at = Column(DateTime, default=utc_now, nullable=False)
-    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now, nullable=False)
+    updated_at = Column(DateTime, default=utc_now, server_onupdate=FetchedValue(), nullable=False)  # Set by trigger
+    row_version = Column(BigInteger, server_default=FetchedValue(), server_onupdate=FetchedValue(), nullable=False)  # Writer's transaction version, set by trigger (sync pull)
 
     # Relationships
     user = relationship("User", backref="recurring_configs")
@@ -58,6 +60,17 @@ class RecurringConfig(Base):
         backref="recurring_config_source"
     )
 
+    __table_args__ = (
+        # /recurring/trigger: active configs due on or before today
+        Index(
+            'ix_recurring_configs_user_due',
+            'user_id', 'next_occurrence',
+            postgresql_where=text('is_active')
+        ),
+        # Incremental sync pull: rows changed since a version
+        Index('ix_recurring_configs_user_row_version', 'user_id', 'row_version'),
+    )
+
     def calculate_next_occurrence(self) -> date:
         """Calculate the next occurrence date based on current settings"""
         current = self.next_occurrence
@@ -1,11 +1,11 @@
 """Transaction model"""
-from sqlalchemy import Column, String, Boolean, DateTime, Numeric, Text, ForeignKey, Enum, Integer
+from sqlalchemy import Column, String, Boolean, DateTime, Numeric, Text, ForeignKey, Enum, Integer, FetchedValue, Index, desc, BigInteger
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-import uuid
 import enum
 from app.database import Base
 from app.utils.time_utils import utc_now
+from app.utils.uuid_utils import uuid7
 
 
 class TransactionType(str, enum.Enum):
@@ -32,35 +32,36 @@ class Transaction(Base):
     """Financial transaction record"""
 
     __tablename__ = "transactions"
+    __mapper_args__ = {"eager_defaults": True}
 
     # Identity
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
 
     # Related entities
     wallet_id = Column(UUID(as_uuid=True), ForeignKey("wallets.id", ondelete="CASCADE"), nullable=False, index=True)
     category_id = Column(UUID(as_uuid=True), ForeignKey("categories.id", ondelete="SET NULL"), nullable=True, index=True)
-    payment_method_id = Column(UUID(as_uuid=True), ForeignKey("payment_methods.id", ondelete="SET NULL"), nullable=True)
+    payment_method_id = Column(UUID(as_uuid=True), ForeignKey("payment_methods.id", ondelete="SET NULL"), nullable=True, index=True)
 
     # Transaction details
     amount = Column(Numeric(15, 2), nullable=False)
     title = Column(String(200), nullable=False)
     notes = Column(Text, nullable=True)
-    date = Column(DateTime, nullable=False, index=True)
+    date = Column(DateTime, nullable=False)
     is_income = Column(Boolean, default=False, nullable=False)
 
     # Transaction type
     type = Column(
-        Enum(TransactionType),
+        Enum(TransactionType, native_enum=False, length=30),
         default=TransactionType.REGULAR,
         nullable=False
     )
 
     # For transfers - links to the paired transaction in another wallet
-    paired_transaction_id = Column(UUID(as_uuid=True), ForeignKey("transactions.id", ondelete="SET NULL"), nullable=True)
+    paired_transaction_id = Column(UUID(as_uuid=True), ForeignKey("transactions.id", ondelete="SET NULL"), nullable=True, index=True)
 
     # For recurring instances - links to the recurring config
-    recurring_config_id = Column(UUID(as_uuid=True), ForeignKey("recurring_configs.id", ondelete="SET NULL"), nullable=True)
+    recurring_config_id = Column(UUID(as_uuid=True), ForeignKey("recurring_configs.id", ondelete="SET NULL"), nullable=True, index=True)
 
     # Receipt attachment
     receipt_image_url = Column(String(500), nullable=True)
@@ -79,7 +80,8 @@ class Transaction(Base):
 
     # Timestamps
     created_at = Column(DateTime, default=utc_now, nullable=False)
-    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now, nullable=False)
+    updated_at = Column(DateTime, default=utc_now, server_onupdate=FetchedValue(), nullable=False)  # Set by trigger
+    row_version = Column(BigInteger, server_default=FetchedValue(), server_onupdate=FetchedValue(), nullable=False)  # Writer's transaction version, set by trigger (sync pull)
     deleted_at = Column(DateTime, nullable=True)  # Soft delete
 
     # Relationships
@@ -94,6 +96,16 @@ class Transaction(Base):
         backref="instances"
     )
 
+    __table_args__ = (
+        # Per-user listing in display order (also serves the user_id FK)
+        Index('ix_transactions_user_date', 'user_id', desc('date'), desc('created_at')),
+        # Incremental sync pull: rows changed since a version
+        Index('ix_transactions_user_row_version', 'user_id', 'row_version'),
+        # Substring search on title/notes (ILIKE '%q%', migration 018)
+        Index('ix_transactions_title_trgm', 'title', postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'}),
+        Index('ix_transactions_notes_trgm', 'notes', postgresql_using='gin', postgresql_ops={'notes': 'gin_trgm_ops'}),
+    )
+
     @property
     def is_deleted(self) -> bool:
         """Check if transaction is soft deleted"""
@@ -1,19 +1,20 @@
 """Wallet model for managing multiple accounts/wallets"""
-from sqlalchemy import Column, String, Boolean, DateTime, Integer, Numeric, ForeignKey
+from sqlalchemy import Column, String, Boolean, DateTime, Integer, Numeric, ForeignKey, FetchedValue, BigInteger, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-import uuid
 from app.database import Base
 from app.utils.time_utils import utc_now
+from app.utils.uuid_utils import uuid7
 
 
 class Wallet(Base):
     """Wallet/Account for organizing finances (personal, business, etc.)"""
 
     __tablename__ = "wallets"
+    __mapper_args__ = {"eager_defaults": True}
 
     # Identity
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
 
     # Wallet details
@@ -31,12 +32,18 @@ class Wallet(Base):
 
     # Timestamps
     created_at = Column(DateTime, default=utc_now, nullable=False)
-    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now, nullable=False)
+    updated_at = Column(DateTime, default=utc_now, server_onupdate=FetchedValue(), nullable=False)  # Set by trigger
+    row_version = Column(BigInteger, server_default=FetchedValue(), server_onupdate=FetchedValue(), nullable=False)  # Writer's transaction version, set by trigger (sync pull)
     deleted_at = Column(DateTime, nullable=True)  # Soft delete
 
     # Relationships
     user = relationship("User", backref="wallets")
 
+    __table_args__ = (
+        # Incremental sync pull: rows changed since a version
+        Index('ix_wallets_user_row_version', 'user_id', 'row_version'),
+    )
+
     @property
     def is_deleted(self) -> bool:
         """Check if wallet is soft deleted"""
@@ -17,7 +17,9 @@ from app.schemas.category import (
     CategoryUpdate,
     CategoryResponse,
     CategoryWithSubcategories,
-    CategoryListResponse
+    CategoryCursor,
+    CategoryListResponse,
+    CategoryCountResponse
 )
 from app.schemas.wallet import (
     WalletBase,
@@ -77,6 +79,7 @@ from app.schemas.associated_title import (
     AssociatedTitleCreate,
     AssociatedTitleUpdate,
     AssociatedTitleResponse,
+    AssociatedTitleCursor,
     AssociatedTitleListResponse,
     CategorySuggestion
 )
@@ -121,7 +124,9 @@ __all__ = [
     "CategoryUpdate",
     "CategoryResponse",
     "CategoryWithSubcategories",
+    "CategoryCursor",
     "CategoryListResponse",
+    "CategoryCountResponse",
     # Wallet
     "WalletBase",
     "WalletCreate",
@@ -174,6 +179,7 @@ __all__ = [
     "AssociatedTitleCreate",
     "AssociatedTitleUpdate",
     "AssociatedTitleResponse",
+    "AssociatedTitleCursor",
     "AssociatedTitleListResponse",
     "CategorySuggestion",
     # Sync
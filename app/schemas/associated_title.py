@@ -1,5 +1,6 @@
 """Associated title (Smart Categorization) schemas"""
-from pydantic import BaseModel, UUID4, Field, field_serializer
+from pydantic import BaseModel, Field, field_serializer
+from uuid import UUID
 from datetime import datetime
 from typing import Optional, List
 from app.utils.time_utils import to_utc_isoformat
@@ -8,7 +9,7 @@ from app.utils.time_utils import to_utc_isoformat
 class AssociatedTitleBase(BaseModel):
     """Base associated title schema"""
     title: str = Field(..., min_length=1, max_length=200)
-    category_id: UUID4
+    category_id: UUID
     is_exact_match: bool = False
 
 
@@ -20,14 +21,14 @@ class AssociatedTitleCreate(AssociatedTitleBase):
 class AssociatedTitleUpdate(BaseModel):
     """Schema for updating associated title"""
     title: Optional[str] = Field(None, min_length=1, max_length=200)
-    category_id: Optional[UUID4] = None
+    category_id: Optional[UUID] = None
     is_exact_match: Optional[bool] = None
 
 
 class AssociatedTitleResponse(AssociatedTitleBase):
     """Schema for associated title response"""
-    id: UUID4
-    user_id: UUID4
+    id: UUID
+    user_id: UUID
     created_at: datetime
     updated_at: datetime
 
@@ -39,14 +40,20 @@ class AssociatedTitleResponse(AssociatedTitleBase):
         from_attributes = True
 
 
+class AssociatedTitleCursor(BaseModel):
+    """Keyset cursor pointing at the last item of a page"""
+    after_title: str
+    after_id: UUID
+
+
 class AssociatedTitleListResponse(BaseModel):
     """Response for associated title list"""
     items: List[AssociatedTitleResponse]
-    total: int
+    next_cursor: Optional[AssociatedTitleCursor] = None  # Null on the last page
 
 
 class CategorySuggestion(BaseModel):
     """Response for category suggestion based on title"""
-    category_id: Optional[UUID4] = None
+    category_id: Optional[UUID] = None
     confidence: str  # 'exact', 'contains', 'none'
     matched_title: Optional[str] = None
@@ -1,5 +1,6 @@
 """Authentication schemas"""
-from pydantic import BaseModel, UUID4
+from pydantic import BaseModel
+from uuid import UUID
 
 
 class Token(BaseModel):
@@ -11,4 +12,4 @@ class Token(BaseModel):
 
 class TokenData(BaseModel):
     """Token payload data"""
-    user_id: UUID4
+    user_id: UUID
@@ -1,5 +1,6 @@
 """Budget schemas"""
-from pydantic import BaseModel, UUID4, Field, field_serializer
+from pydantic import BaseModel, Field, field_serializer
+from uuid import UUID
 from datetime import datetime, date
 from typing import Optional, List
 from decimal import Decimal
@@ -22,8 +23,8 @@ class BudgetBase(BaseModel):
     period: BudgetPeriod = BudgetPeriod.MONTHLY
     start_date: date
     end_date: Optional[date] = None
-    wallet_ids: Optional[List[UUID4]] = None  # Null = all wallets
-    category_ids: Optional[List[UUID4]] = None  # Null = all categories
+    wallet_ids: Optional[List[UUID]] = None  # Null = all wallets
+    category_ids: Optional[List[UUID]] = None  # Null = all categories
     is_income: bool = False
 
 
@@ -40,8 +41,8 @@ class BudgetUpdate(BaseModel):
     period: Optional[BudgetPeriod] = None
     start_date: Optional[date] = None
     end_date: Optional[date] = None
-    wallet_ids: Optional[List[UUID4]] = None
-    category_ids: Optional[List[UUID4]] = None
+    wallet_ids: Optional[List[UUID]] = None
+    category_ids: Optional[List[UUID]] = None
     is_income: Optional[bool] = None
     is_pinned: Optional[bool] = None
     is_archived: Optional[bool] = None
@@ -49,8 +50,8 @@ class BudgetUpdate(BaseModel):
 
 class BudgetResponse(BudgetBase):
     """Schema for budget response"""
-    id: UUID4
-    user_id: UUID4
+    id: UUID
+    user_id: UUID
     is_pinned: bool
     is_archived: bool
     created_at: datetime
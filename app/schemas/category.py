@@ -1,5 +1,6 @@
 """Category schemas"""
-from pydantic import BaseModel, UUID4, Field, field_serializer
+from pydantic import BaseModel, Field, field_serializer
+from uuid import UUID
 from datetime import datetime
 from typing import Optional, List
 from app.utils.time_utils import to_utc_isoformat
@@ -16,7 +17,7 @@ class CategoryBase(BaseModel):
 
 class CategoryCreate(CategoryBase):
     """Schema for creating a new category"""
-    main_category_id: Optional[UUID4] = None
+    main_category_id: Optional[UUID] = None
 
 
 class CategoryUpdate(BaseModel):
@@ -26,14 +27,14 @@ class CategoryUpdate(BaseModel):
     color: Optional[str] = Field(None, pattern=r"^#[0-9A-Fa-f]{6}$")
     is_income: Optional[bool] = None
     order_index: Optional[int] = None
-    main_category_id: Optional[UUID4] = None
+    main_category_id: Optional[UUID] = None
 
 
 class CategoryResponse(CategoryBase):
     """Schema for category response"""
-    id: UUID4
-    user_id: UUID4
-    main_category_id: Optional[UUID4] = None
+    id: UUID
+    user_id: UUID
+    main_category_id: Optional[UUID] = None
     created_at: datetime
     updated_at: datetime
     deleted_at: Optional[datetime] = None
@@ -51,7 +52,19 @@ class CategoryWithSubcategories(CategoryResponse):
     subcategories: List["CategoryResponse"] = []
 
 
+class CategoryCursor(BaseModel):
+    """Keyset cursor pointing at the last item of a page"""
+    after_order_index: int
+    after_name: str
+    after_id: UUID
+
+
 class CategoryListResponse(BaseModel):
     """Response for category list"""
     items: List[CategoryResponse]
+    next_cursor: Optional[CategoryCursor] = None  # Null on the last page
+
+
+class CategoryCountResponse(BaseModel):
+    """Response for category count"""
     total: int
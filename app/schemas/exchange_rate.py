@@ -41,6 +41,18 @@ class ExchangeRateResponse(ExchangeRateBase):
         from_attributes = True
 
 
+class ExchangeRateCursor(BaseModel):
+    """Keyset cursor pointing at the last item of a page"""
+    after_from_currency: str
+    after_to_currency: str
+
+
+class ExchangeRateListResponse(BaseModel):
+    """Response for exchange rate list"""
+    items: list[ExchangeRateResponse]
+    next_cursor: Optional[ExchangeRateCursor] = None  # Null on the last page
+
+
 class ExchangeRateSyncRequest(BaseModel):
     """Schema for syncing exchange rates from client"""
     id: UUID
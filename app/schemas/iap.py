@@ -1,5 +1,5 @@
 """In-App Purchase schemas"""
-from pydantic import BaseModel, UUID4, Field, field_serializer
+from pydantic import BaseModel, Field, field_serializer
 from datetime import datetime
 from typing import Optional
 from enum import Enum
@@ -1,5 +1,6 @@
 """Objective (Goals & Savings) schemas"""
-from pydantic import BaseModel, UUID4, Field, field_serializer
+from pydantic import BaseModel, Field, field_serializer
+from uuid import UUID
 from datetime import datetime, date
 from typing import Optional, List
 from decimal import Decimal
@@ -20,7 +21,7 @@ class ObjectiveBase(BaseModel):
     color: str = Field(default="#6366F1", pattern=r"^#[0-9A-Fa-f]{6}$")
     target_amount: Decimal = Field(..., decimal_places=2)
     type: ObjectiveType = ObjectiveType.GOAL
-    wallet_id: Optional[UUID4] = None
+    wallet_id: Optional[UUID] = None
     start_date: date
     end_date: Optional[date] = None
 
@@ -38,7 +39,7 @@ class ObjectiveUpdate(BaseModel):
     color: Optional[str] = Field(None, pattern=r"^#[0-9A-Fa-f]{6}$")
     target_amount: Optional[Decimal] = Field(None, decimal_places=2)
     type: Optional[ObjectiveType] = None
-    wallet_id: Optional[UUID4] = None
+    wallet_id: Optional[UUID] = None
     end_date: Optional[date] = None
     is_pinned: Optional[bool] = None
     is_archived: Optional[bool] = None
@@ -46,8 +47,8 @@ class ObjectiveUpdate(BaseModel):
 
 class ObjectiveResponse(ObjectiveBase):
     """Schema for objective response"""
-    id: UUID4
-    user_id: UUID4
+    id: UUID
+    user_id: UUID
     is_pinned: bool
     is_archived: bool
     created_at: datetime
@@ -87,14 +88,14 @@ class ObjectiveListResponse(BaseModel):
 
 class ObjectiveTransactionLink(BaseModel):
     """Schema for linking a transaction to an objective"""
-    transaction_id: UUID4
+    transaction_id: UUID
 
 
 class ObjectiveTransactionResponse(BaseModel):
     """Response for objective-transaction link"""
-    id: UUID4
-    objective_id: UUID4
-    transaction_id: UUID4
+    id: UUID
+    objective_id: UUID
+    transaction_id: UUID
     created_at: datetime
 
     @field_serializer('created_at')
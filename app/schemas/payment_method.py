@@ -1,5 +1,6 @@
 """Payment method schemas"""
-from pydantic import BaseModel, UUID4, Field, field_serializer
+from pydantic import BaseModel, Field, field_serializer
+from uuid import UUID
 from datetime import datetime
 from typing import Optional, List
 from app.utils.time_utils import to_utc_isoformat
@@ -26,8 +27,8 @@ class PaymentMethodUpdate(BaseModel):
 
 class PaymentMethodResponse(PaymentMethodBase):
     """Schema for payment method response"""
-    id: UUID4
-    user_id: UUID4
+    id: UUID
+    user_id: UUID
     created_at: datetime
     updated_at: datetime
     deleted_at: Optional[datetime] = None
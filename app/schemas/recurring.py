@@ -1,5 +1,6 @@
 """Recurring transaction configuration schemas"""
-from pydantic import BaseModel, UUID4, Field, field_serializer
+from pydantic import BaseModel, Field, field_serializer
+from uuid import UUID
 from datetime import datetime, date
 from typing import Optional, List
 from enum import Enum
@@ -16,7 +17,7 @@ class RecurrenceType(str, Enum):
 
 class RecurringConfigBase(BaseModel):
     """Base recurring config schema"""
-    base_transaction_id: UUID4
+    base_transaction_id: UUID
     period_length: int = Field(default=1, ge=1)
     reoccurrence: RecurrenceType = RecurrenceType.MONTHLY
     start_date: date
@@ -38,8 +39,8 @@ class RecurringConfigUpdate(BaseModel):
 
 class RecurringConfigResponse(RecurringConfigBase):
     """Schema for recurring config response"""
-    id: UUID4
-    user_id: UUID4
+    id: UUID
+    user_id: UUID
     next_occurrence: date
     is_active: bool
     created_at: datetime
@@ -66,4 +67,4 @@ class RecurringConfigListResponse(BaseModel):
 class RecurringTriggerResponse(BaseModel):
     """Response for triggering recurring transactions"""
     processed_count: int
-    created_transaction_ids: List[UUID4]
+    created_transaction_ids: List[UUID]
@@ -1,5 +1,6 @@
 """Sync schemas for hybrid sync functionality"""
-from pydantic import BaseModel, UUID4, Field, field_serializer
+from pydantic import BaseModel, Field, field_serializer
+from uuid import UUID
 from datetime import datetime
 from typing import Optional, List, Any, Dict
 from enum import Enum
@@ -17,8 +18,8 @@ class SyncStatus(str, Enum):
 
 class SyncChange(BaseModel):
     """A single change to sync"""
-    id: UUID4  # Client-side ID
-    server_id: Optional[UUID4] = None  # Server-side ID (null for new records)
+    id: UUID  # Client-side ID
+    server_id: Optional[UUID] = None  # Server-side ID (null for new records)
     action: str  # 'create', 'update', 'delete'
     data: Dict[str, Any]  # The record data
     client_timestamp: datetime  # When the change was made on client
@@ -28,13 +29,13 @@ class SyncPushRequest(BaseModel):
     """Request to push local changes to server"""
     table: str  # Table name
     changes: List[SyncChange]
-    client_version: int  # Client's last known server version
+    client_version: int  # Client's pull cursor (server_version of its last pull)
 
 
 class SyncConflict(BaseModel):
     """A sync conflict that needs resolution"""
-    client_id: UUID4
-    server_id: UUID4
+    client_id: UUID
+    server_id: UUID
     client_data: Dict[str, Any]
     server_data: Dict[str, Any]
     conflict_type: str  # 'update_conflict', 'delete_conflict'
@@ -42,8 +43,8 @@ class SyncConflict(BaseModel):
 
 class SyncPushResponse(BaseModel):
     """Response from push sync"""
-    server_version: int  # New server version after push
-    accepted: List[UUID4]  # IDs of changes that were accepted
+    server_version: int  # row_version of the pushed records; not a pull cursor (keep the one from the last pull)
+    accepted: List[UUID]  # IDs of changes that were accepted
     conflicts: List[SyncConflict]  # Conflicts that need resolution
     id_mapping: Dict[str, str]  # client_id -> server_id for new records
 
@@ -51,25 +52,26 @@ class SyncPushResponse(BaseModel):
 class SyncPullRequest(BaseModel):
     """Request to pull server changes"""
     table: str  # Table name
-    since_version: int  # Pull changes since this version
+    since_version: int  # Pull changes since this version (server_version of the last pull)
 
 
 class SyncPullResponse(BaseModel):
     """Response from pull sync"""
     changes: List[Dict[str, Any]]  # Changed records
-    server_version: int  # Current server version
+    server_version: int  # Version to pull from next
     has_more: bool = False  # If there are more changes to pull
+    full_snapshot: bool = False  # All records of a hard-delete table; drop local ones not listed
 
 
 class SyncStatusResponse(BaseModel):
     """Overall sync status"""
-    tables: Dict[str, Dict[str, Any]]  # table -> {version, count, last_sync}
+    tables: Dict[str, Dict[str, Any]]  # table -> {version (latest row_version), count, last_sync}
 
 
 class SyncLogResponse(BaseModel):
     """Sync log entry"""
-    id: UUID4
-    user_id: UUID4
+    id: UUID
+    user_id: UUID
     table_name: str
     last_sync_at: Optional[datetime] = None
     last_server_version: int
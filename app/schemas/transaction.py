@@ -1,5 +1,6 @@
 """Transaction schemas"""
-from pydantic import BaseModel, UUID4, Field, field_serializer
+from pydantic import BaseModel, Field, field_serializer
+from uuid import UUID
 from datetime import datetime
 from typing import Optional, List
 from decimal import Decimal
@@ -26,9 +27,9 @@ class TransactionSpecialType(int, Enum):
 
 class TransactionBase(BaseModel):
     """Base transaction schema"""
-    wallet_id: UUID4
-    category_id: Optional[UUID4] = None
-    payment_method_id: Optional[UUID4] = None
+    wallet_id: UUID
+    category_id: Optional[UUID] = None
+    payment_method_id: Optional[UUID] = None
     amount: Decimal = Field(..., decimal_places=2)
     title: str = Field(..., min_length=1, max_length=200)
     notes: Optional[str] = None
@@ -44,16 +45,16 @@ class TransactionBase(BaseModel):
 
 class TransactionCreate(TransactionBase):
     """Schema for creating a new transaction"""
-    paired_transaction_id: Optional[UUID4] = None
-    recurring_config_id: Optional[UUID4] = None
+    paired_transaction_id: Optional[UUID] = None
+    recurring_config_id: Optional[UUID] = None
     receipt_image_url: Optional[str] = Field(None, max_length=500)
 
 
 class TransactionUpdate(BaseModel):
     """Schema for updating transaction"""
-    wallet_id: Optional[UUID4] = None
-    category_id: Optional[UUID4] = None
-    payment_method_id: Optional[UUID4] = None
+    wallet_id: Optional[UUID] = None
+    category_id: Optional[UUID] = None
+    payment_method_id: Optional[UUID] = None
     amount: Optional[Decimal] = Field(None, decimal_places=2)
     title: Optional[str] = Field(None, min_length=1, max_length=200)
     notes: Optional[str] = None
@@ -69,10 +70,10 @@ class TransactionUpdate(BaseModel):
 
 class TransactionResponse(TransactionBase):
     """Schema for transaction response"""
-    id: UUID4
-    user_id: UUID4
-    paired_transaction_id: Optional[UUID4] = None
-    recurring_config_id: Optional[UUID4] = None
+    id: UUID
+    user_id: UUID
+    paired_transaction_id: Optional[UUID] = None
+    recurring_config_id: Optional[UUID] = None
     receipt_image_url: Optional[str] = None
     created_at: datetime
     updated_at: datetime
@@ -103,9 +104,9 @@ class TransactionBulkCreate(BaseModel):
 
 class TransactionFilter(BaseModel):
     """Filter options for transaction list"""
-    wallet_id: Optional[UUID4] = None
-    category_id: Optional[UUID4] = None
-    payment_method_id: Optional[UUID4] = None
+    wallet_id: Optional[UUID] = None
+    category_id: Optional[UUID] = None
+    payment_method_id: Optional[UUID] = None
     is_income: Optional[bool] = None
     type: Optional[TransactionType] = None
     start_date: Optional[datetime] = None
@@ -1,5 +1,6 @@
 """User schemas"""
-from pydantic import BaseModel, EmailStr, UUID4, field_serializer
+from pydantic import BaseModel, EmailStr, field_serializer
+from uuid import UUID
 from datetime import datetime
 from typing import Optional
 
@@ -23,7 +24,7 @@ class UserLogin(UserBase):
 
 class UserResponse(UserBase):
     """Schema for user response (no password)"""
-    id: UUID4
+    id: UUID
     created_at: datetime
     subscription_tier: str
     is_active: bool
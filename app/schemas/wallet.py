@@ -1,5 +1,6 @@
 """Wallet schemas"""
-from pydantic import BaseModel, UUID4, Field, field_serializer
+from pydantic import BaseModel, Field, field_serializer
+from uuid import UUID
 from datetime import datetime
 from typing import Optional, List
 from decimal import Decimal
@@ -33,8 +34,8 @@ class WalletUpdate(BaseModel):
 
 class WalletResponse(WalletBase):
     """Schema for wallet response"""
-    id: UUID4
-    user_id: UUID4
+    id: UUID
+    user_id: UUID
     balance: Decimal
     created_at: datetime
     updated_at: datetime
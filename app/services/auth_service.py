@@ -1,36 +1,46 @@
 """Authentication service"""
 from uuid import UUID
-from sqlalchemy.orm import Session
+from cachetools import TTLCache
+from sqlalchemy import select, exists
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.user import User
 from app.schemas.user import UserCreate
-from app.core.security import get_password_hash, verify_password, create_access_token
+from app.core.security import get_password_hash_async, verify_password_async, create_access_token
 from typing import Optional
 
 from app.utils.time_utils import utc_now
 
+# Recently minted tokens per user. Tokens only carry the user id and expiry,
+# so repeated sign-ins within a few seconds can share one signature.
+_issued_tokens: TTLCache = TTLCache(maxsize=10000, ttl=15)
+
 
 class AuthService:
     """Service for user authentication"""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def get_user_by_email(self, email: str) -> Optional[User]:
+    async def get_user_by_email(self, email: str) -> Optional[User]:
         """Get user by email"""
-        return self.db.query(User).filter(User.email == email).first()
+        return await self.db.scalar(select(User).where(User.email == email))
+
+    async def email_exists(self, email: str) -> bool:
+        """Check whether an account already uses this email"""
+        return await self.db.scalar(select(exists().where(User.email == email)))
 
-    def get_user_by_id(self, user_id: str) -> Optional[User]:
+    async def get_user_by_id(self, user_id: str) -> Optional[User]:
         """Get user by ID"""
         try:
             user_uuid = UUID(user_id) if isinstance(user_id, str) else user_id
-            return self.db.query(User).filter(User.id == user_uuid).first()
         except (ValueError, TypeError):
             return None
+        return await self.db.get(User, user_uuid)
 
-    def create_user(self, user_data: UserCreate) -> User:
+    async def create_user(self, user_data: UserCreate) -> User:
         """Create a new user"""
         # Hash the password
-        hashed_password = get_password_hash(user_data.password)
+        hashed_password = await get_password_hash_async(user_data.password)
 
         # Create user instance
         db_user = User(
@@ -42,35 +52,36 @@ class AuthService:
         )
 
         self.db.add(db_user)
-        self.db.commit()
-        self.db.refresh(db_user)
+        await self.db.commit()
+        await self.db.refresh(db_user)
 
         return db_user
 
-    def authenticate_user(self, email: str, password: str) -> Optional[User]:
+    async def authenticate_user(self, email: str, password: str) -> Optional[User]:
         """
         Authenticate user with email and password
 
         Returns:
             User object if authentication successful, None otherwise
         """
-        user = self.get_user_by_email(email)
+        user = await self.get_user_by_email(email)
 
-        if not user:
-            return None
-
-        if not user.password_hash:
-            return None
+        # Always run bcrypt, even for unknown emails, to keep timing uniform
+        password_ok = await verify_password_async(password, user.password_hash if user else None)
 
-        if not verify_password(password, user.password_hash):
+        if not user or not password_ok:
             return None
 
         # Update last login
         user.last_login = utc_now()
-        self.db.commit()
+        await self.db.commit()
 
         return user
 
     def create_access_token_for_user(self, user: User) -> str:
-        """Create JWT access token for user"""
-        return create_access_token(data={"sub": str(user.id)})
+        """Create JWT access token for user (reused for up to 15 seconds)"""
+        token = _issued_tokens.get(user.id)
+        if token is None:
+            token = create_access_token(data={"sub": str(user.id)})
+            _issued_tokens[user.id] = token
+        return token
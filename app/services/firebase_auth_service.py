@@ -1,13 +1,22 @@
 """Firebase Authentication Service"""
 import firebase_admin
 from firebase_admin import auth, credentials
+from cachetools import TTLCache
 from typing import Dict, Optional
+import hashlib
 import logging
 import os
+import threading
+import time
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Verified ID token claims, keyed by token digest. Clients retry /firebase,
+# /google and /link-google with the same ID token (valid ~1 hour).
+_verified_tokens: TTLCache = TTLCache(maxsize=2048, ttl=300)
+_verified_tokens_lock = threading.Lock()
+
 
 def _ensure_firebase_initialized():
     """
@@ -22,7 +31,7 @@ def _ensure_firebase_initialized():
                 firebase_admin.initialize_app(cred)
                 logger.info("Firebase Admin SDK initialized successfully")
             except Exception as e:
-                logger.error(f"Failed to initialize Firebase Admin SDK: {e}")
+                logger.error("Failed to initialize Firebase Admin SDK: %s", e)
                 raise RuntimeError(
                     f"Firebase Admin SDK initialization failed: {e}\n"
                     f"Check that {settings.FCM_CREDENTIALS_PATH} is valid."
@@ -49,22 +58,30 @@ def verify_firebase_token(id_token: str) -> Optional[Dict]:
         ValueError: If token is invalid
         RuntimeError: If Firebase Admin SDK not initialized
     """
+    key = hashlib.blake2b(id_token.encode(), digest_size=16).digest()
+    with _verified_tokens_lock:
+        decoded_token = _verified_tokens.get(key)
+    if decoded_token is not None and decoded_token.get('exp', 0) > time.time():
+        return decoded_token
+
     # Ensure Firebase is initialized
     _ensure_firebase_initialized()
 
     try:
         # Verify the ID token
         decoded_token = auth.verify_id_token(id_token)
-        logger.info(f"Firebase token verified for UID: {decoded_token['uid']}")
+        logger.debug("Firebase token verified for UID: %s", decoded_token['uid'])
+        with _verified_tokens_lock:
+            _verified_tokens[key] = decoded_token
         return decoded_token
     except auth.InvalidIdTokenError as e:
-        logger.error(f"Invalid Firebase ID token: {e}")
+        logger.error("Invalid Firebase ID token: %s", e)
         raise ValueError(f"Invalid Firebase token: {str(e)}")
     except auth.ExpiredIdTokenError as e:
-        logger.error(f"Expired Firebase ID token: {e}")
+        logger.error("Expired Firebase ID token: %s", e)
         raise ValueError(f"Firebase token expired: {str(e)}")
     except Exception as e:
-        logger.error(f"Error verifying Firebase token: {e}")
+        logger.error("Error verifying Firebase token: %s", e)
         raise ValueError(f"Token verification failed: {str(e)}")
 
 
@@ -95,7 +112,7 @@ def get_user_info_from_token(decoded_token: Dict) -> Dict:
         # For Google Sign-In, the sub claim contains the Google user ID
         user_info['google_id'] = decoded_token.get('sub') if decoded_token.get('firebase', {}).get('sign_in_provider') == 'google.com' else None
 
-    logger.info(f"Extracted user info for: {user_info['email']}")
+    logger.debug("Extracted user info for: %s", user_info['email'])
     return user_info
 
 
@@ -115,10 +132,10 @@ def get_firebase_user_by_uid(firebase_uid: str) -> Optional[auth.UserRecord]:
         user = auth.get_user(firebase_uid)
         return user
     except auth.UserNotFoundError:
-        logger.warning(f"Firebase user not found: {firebase_uid}")
+        logger.warning("Firebase user not found: %s", firebase_uid)
         return None
     except Exception as e:
-        logger.error(f"Error getting Firebase user: {e}")
+        logger.error("Error getting Firebase user: %s", e)
         return None
 
 
@@ -138,8 +155,8 @@ def get_firebase_user_by_email(email: str) -> Optional[auth.UserRecord]:
         user = auth.get_user_by_email(email)
         return user
     except auth.UserNotFoundError:
-        logger.warning(f"Firebase user not found for email: {email}")
+        logger.warning("Firebase user not found for email: %s", email)
         return None
     except Exception as e:
-        logger.error(f"Error getting Firebase user by email: {e}")
+        logger.error("Error getting Firebase user by email: %s", e)
         return None
@@ -1,4 +1,6 @@
 """Utility modules"""
 from app.utils.time_utils import utc_now, to_utc_isoformat, ensure_utc
+from app.utils.uuid_utils import uuid7
+from app.utils.cache_utils import CacheGenerations
 
-__all__ = ["utc_now", "to_utc_isoformat", "ensure_utc"]
+__all__ = ["utc_now", "to_utc_isoformat", "ensure_utc", "uuid7", "CacheGenerations"]
@@ -0,0 +1,37 @@
+"""
+Invalidation tracking for per-user read caches.
+
+A read that misses the cache awaits the database before storing its result.
+If a write commits and invalidates the user's entry during that await, the
+read would store a pre-write result that is then served until the TTL runs
+out. Readers take the user's generation before querying and store only if
+it is unchanged afterwards; invalidation bumps it.
+"""
+from itertools import count
+from uuid import UUID
+
+from cachetools import TTLCache
+
+# Process-wide, so a user's generation never returns to an earlier value
+_next_generation = count(1)
+
+
+class CacheGenerations:
+    """Per-user invalidation counters for one or more read caches"""
+
+    def __init__(self, maxsize: int = 100000, ttl: float = 3600):
+        # Kept far longer than any request, so a bump stays visible to the
+        # reads that were in flight when it happened
+        self._generations: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def current(self, user_id: UUID) -> int:
+        """Generation to capture before querying"""
+        return self._generations.get(user_id, 0)
+
+    def bump(self, user_id: UUID) -> None:
+        """Mark results read before now as stale (call when invalidating)"""
+        self._generations[user_id] = next(_next_generation)
+
+    def unchanged(self, user_id: UUID, generation: int) -> bool:
+        """True if no invalidation happened since the generation was captured"""
+        return self.current(user_id) == generation
@@ -0,0 +1,56 @@
+"""
+Time-ordered UUID generation for primary keys.
+
+Random UUIDv4 keys scatter inserts across the whole primary key B-tree.
+UUIDv7 (RFC 9562) keeps the leading 48 bits as a millisecond timestamp, so
+new rows land on the right-most index pages while staying a regular UUID
+for the API and the mobile clients.
+"""
+import os
+import threading
+import time
+import uuid
+
+_lock = threading.Lock()
+_last_timestamp_ms = 0
+_last_counter = 0
+
+# 12-bit rand_a field is used as a per-millisecond counter (RFC 9562, method 1)
+_COUNTER_MAX = 0xFFF
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a UUIDv7.
+
+    IDs created in the same process are strictly increasing, even when
+    several are generated within the same millisecond.
+
+    Returns:
+        uuid.UUID: Time-ordered version 7 UUID
+    """
+    global _last_timestamp_ms, _last_counter
+
+    with _lock:
+        timestamp_ms = time.time_ns() // 1_000_000
+        if timestamp_ms > _last_timestamp_ms:
+            counter = int.from_bytes(os.urandom(2), "big") & 0x7FF
+        else:
+            # Clock did not advance (or went backwards): keep ordering
+            timestamp_ms = _last_timestamp_ms
+            counter = _last_counter + 1
+            if counter > _COUNTER_MAX:
+                timestamp_ms += 1
+                counter = 0
+        _last_timestamp_ms = timestamp_ms
+        _last_counter = counter
+
+    rand_b = int.from_bytes(os.urandom(8), "big") & 0x3FFFFFFFFFFFFFFF
+
+    value = (timestamp_ms & 0xFFFFFFFFFFFF) << 80
+    value |= 0x7 << 76          # version
+    value |= counter << 64      # rand_a / counter
+    value |= 0x2 << 62          # RFC 4122 variant
+    value |= rand_b
+
+    return uuid.UUID(int=value)
@@ -0,0 +1,42 @@
+"""
+Associated title listing tests (need a migrated PostgreSQL database from .env)
+"""
+import pytest
+
+from app.database import SessionLocal
+from app.models.associated_title import AssociatedTitle
+from app.models.category import Category
+
+# One event loop for the whole run: the async engine's pooled connections
+# are bound to the loop that opened them
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def test_keyset_pages_follow_case_insensitive_order(user, client_for):
+    """Paging one title at a time visits mixed-case titles once each, in citext order"""
+    db = SessionLocal()
+    try:
+        category = Category(user_id=user.id, name="Groceries")
+        db.add(category)
+        db.flush()
+        db.add_all([
+            AssociatedTitle(user_id=user.id, title=title, category_id=category.id)
+            for title in ["cherry", "Banana", "apple", "Date"]
+        ])
+        db.commit()
+    finally:
+        db.close()
+
+    seen = []
+    params = {"limit": 1}
+    async with client_for(user) as client:
+        while True:
+            response = await client.get("/api/v1/associated-titles", params=params)
+            assert response.status_code == 200, response.text
+            page = response.json()
+            seen.extend(item["title"] for item in page["items"])
+            if page["next_cursor"] is None:
+                break
+            params = {"limit": 1, **page["next_cursor"]}
+
+    assert seen == ["apple", "Banana", "cherry", "Date"]
@@ -0,0 +1,42 @@
+"""
+Per-user list cache tests (need a migrated PostgreSQL database from .env)
+"""
+import pytest
+from sqlalchemy import event
+
+from app.api.v1.payment_methods import invalidate_payment_method_cache
+from app.database import SessionLocal, async_engine
+from app.models.payment_method import PaymentMethod
+
+# One event loop for the whole run: the async engine's pooled connections
+# are bound to the loop that opened them
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def test_write_during_list_read_is_not_hidden_by_the_cache(user, client_for):
+    """A page read before a concurrent write is not cached past that write"""
+    written = []
+
+    def write_while_listing(conn, cursor, statement, *args):
+        if written or "FROM payment_methods" not in statement:
+            return
+        written.append(True)
+        db = SessionLocal()
+        try:
+            db.add(PaymentMethod(user_id=user.id, name="Card"))
+            db.commit()
+        finally:
+            db.close()
+        invalidate_payment_method_cache(user.id)
+
+    event.listen(async_engine.sync_engine, "after_cursor_execute", write_while_listing)
+    try:
+        async with client_for(user) as client:
+            during = await client.get("/api/v1/payment-methods")
+            after = await client.get("/api/v1/payment-methods")
+    finally:
+        event.remove(async_engine.sync_engine, "after_cursor_execute", write_while_listing)
+
+    assert during.status_code == 200, during.text
+    assert during.json()["total"] == 0
+    assert [item["name"] for item in after.json()["items"]] == ["Card"]
@@ -0,0 +1,120 @@
+"""
+Sync pull cursor tests (need a migrated PostgreSQL database from .env)
+"""
+import uuid
+
+import httpx
+import pytest
+
+import app.api.v1.sync as sync_api
+from app.database import SessionLocal
+from app.models.associated_title import AssociatedTitle
+from app.models.category import Category
+from app.models.wallet import Wallet
+
+# One event loop for the whole run: the async engine's pooled connections
+# are bound to the loop that opened them
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def _pull(client: httpx.AsyncClient, since_version: int, table: str = "wallets") -> dict:
+    response = await client.post("/api/v1/sync/pull", json={"table": table, "since_version": since_version})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+async def test_pull_waits_for_writes_that_commit_late(user, client_for):
+    """A write committed after a pull is still returned from that pull's cursor"""
+    slow = SessionLocal()
+    fast = SessionLocal()
+    try:
+        # The slow writer takes its version first but commits last
+        slow.add(Wallet(user_id=user.id, name="slow"))
+        slow.flush()
+        fast.add(Wallet(user_id=user.id, name="fast"))
+        fast.commit()
+
+        async with client_for(user) as client:
+            first = await _pull(client, 0)
+            slow.commit()
+            second = await _pull(client, first["server_version"])
+    finally:
+        slow.close()
+        fast.close()
+
+    pulled = [change["name"] for change in first["changes"] + second["changes"]]
+    assert sorted(pulled) == ["fast", "slow"]
+
+
+async def test_pull_does_not_split_one_write_across_batches(user, client_for, monkeypatch):
+    """Rows from one transaction share a version, so a batch takes all of them"""
+    monkeypatch.setattr(sync_api, "PULL_BATCH_SIZE", 2)
+
+    db = SessionLocal()
+    try:
+        db.add_all([Wallet(user_id=user.id, name=f"bulk {i}") for i in range(3)])
+        db.commit()
+        db.add(Wallet(user_id=user.id, name="later"))
+        db.commit()
+    finally:
+        db.close()
+
+    async with client_for(user) as client:
+        first = await _pull(client, 0)
+        second = await _pull(client, first["server_version"])
+
+    assert sorted(change["name"] for change in first["changes"]) == ["bulk 0", "bulk 1", "bulk 2"]
+    assert first["has_more"]
+    assert [change["name"] for change in second["changes"]] == ["later"]
+    assert not second["has_more"]
+
+
+async def test_hard_delete_tables_are_pulled_whole(user, client_for):
+    """Deleted rows of tables without deleted_at show up as missing from the snapshot"""
+    db = SessionLocal()
+    try:
+        category = Category(user_id=user.id, name="Food")
+        db.add(category)
+        db.flush()
+        kept = AssociatedTitle(user_id=user.id, title="Bakery", category_id=category.id)
+        dropped = AssociatedTitle(user_id=user.id, title="Cafe", category_id=category.id)
+        db.add_all([kept, dropped])
+        db.commit()
+
+        async with client_for(user) as client:
+            first = await _pull(client, 0, "associated_titles")
+            db.delete(dropped)
+            db.commit()
+            second = await _pull(client, first["server_version"], "associated_titles")
+    finally:
+        db.close()
+
+    assert sorted(change["title"] for change in first["changes"]) == ["Bakery", "Cafe"]
+    assert second["full_snapshot"]
+    assert [change["title"] for change in second["changes"]] == ["Bakery"]
+
+
+async def test_push_and_status_versions_match_pulled_rows(user, client_for):
+    """Push and status report versions on the pull cursor's scale"""
+    async with client_for(user) as client:
+        before = await _pull(client, 0)
+        response = await client.post("/api/v1/sync/push", json={
+            "table": "wallets",
+            "client_version": before["server_version"],
+            "changes": [{
+                "id": str(uuid.uuid4()),
+                "action": "create",
+                "data": {"name": "pushed"},
+                "client_timestamp": "2026-01-01T00:00:00",
+            }],
+        })
+        assert response.status_code == 200, response.text
+        pushed_version = response.json()["server_version"]
+
+        after = await _pull(client, before["server_version"])
+        response = await client.get("/api/v1/sync/status")
+        assert response.status_code == 200, response.text
+        status_version = response.json()["tables"]["wallets"]["version"]
+
+    assert [(change["name"], change["row_version"]) for change in after["changes"]] == [("pushed", pushed_version)]
+    assert status_version == pushed_version